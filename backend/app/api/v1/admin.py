@@ -4,7 +4,11 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
 from app.models.db import get_db
+from app.models.orm_models import Source
 from app.models import schemas
+from app.services.embed_batcher import embedding_batcher_stats
+from app.services.groq_client import groq_pool_stats
+from app.services.url_filter import get_url_filter
 
 router = APIRouter()
 
@@ -12,16 +16,65 @@ router = APIRouter()
 # ---------------------------------------------------------
 # GET /admin/sources  → List all news sources
 # ---------------------------------------------------------
-@router.get("/sources")
+@router.get("/sources", response_model=schemas.SourceListResponse)
 def get_sources(
     db: Session = Depends(get_db)
 ):
+    """
+    Sources with their health (failure count, last success,
+    circuit-breaker retry time).
+    """
+    sources = db.query(Source).order_by(Source.id).all()
     return {
-        "total": 0,
-        "sources": []
+        "total": len(sources),
+        "sources": sources
     }
 
 
+# ---------------------------------------------------------
+# GET /admin/url-filter  → Seen-URL Bloom filter health
+# ---------------------------------------------------------
+@router.get("/url-filter")
+def get_url_filter_stats(
+    db: Session = Depends(get_db)
+):
+    """
+    Size, fill ratio and false-positive counters (this process only).
+    """
+    url_filter = get_url_filter(db)
+    if url_filter is None:
+        return {"enabled": False}
+    return {"enabled": True, **url_filter.stats()}
+
+
+# ---------------------------------------------------------
+# GET /admin/embedder  → Embedding micro-batcher counters
+# ---------------------------------------------------------
+@router.get("/embedder")
+def get_embedder_stats():
+    """
+    Batches, mean batch size and p50/p99 latency (this process only).
+    """
+    stats = embedding_batcher_stats()
+    if stats is None:
+        return {"started": False}
+    return {"started": True, **stats}
+
+
+# ---------------------------------------------------------
+# GET /admin/groq  → Pooled Groq client settings
+# ---------------------------------------------------------
+@router.get("/groq")
+def get_groq_stats():
+    """
+    Base URL, connection limits and live clients (this process only).
+    """
+    stats = groq_pool_stats()
+    if stats is None:
+        return {"started": False}
+    return {"started": True, **stats}
+
+
 # ---------------------------------------------------------
 # POST /admin/sources/refresh  → Refresh only sources table
 # ---------------------------------------------------------
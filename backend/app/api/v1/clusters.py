@@ -0,0 +1,94 @@
+# backend/app/api/v1/clusters.py
+
+from datetime import datetime, timedelta
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.models.db import get_db
+from app.models.orm_models import NewsItem, StoryCluster
+from app.models import schemas
+
+router = APIRouter()
+
+
+# ---------------------------------------------------------
+# GET /api/v1/clusters — Stories, most recently active first
+# ---------------------------------------------------------
+@router.get("/", response_model=schemas.PaginatedClusterResponse)
+def get_clusters(
+    page: int = 1,
+    limit: int = 20,
+    hours: Optional[int] = None,
+    min_members: int = 1,
+    db: Session = Depends(get_db),
+):
+    """
+    hours:       only clusters active in the last N hours
+    min_members: hide clusters with fewer items (1 = single-item stories too)
+
+    member_count includes stored duplicates (syndicated copies).
+    """
+    offset = (page - 1) * limit
+
+    member_count = func.count(NewsItem.id).label("member_count")
+    query = (
+        db.query(StoryCluster, member_count)
+        .join(NewsItem, NewsItem.cluster_id == StoryCluster.id)
+        .filter(StoryCluster.merged_into.is_(None))
+        .group_by(StoryCluster.id)
+        .having(member_count >= min_members)
+    )
+    if hours:
+        query = query.filter(StoryCluster.last_seen_at >= datetime.utcnow() - timedelta(hours=hours))
+
+    total = query.count()
+
+    rows = (
+        query
+        .order_by(StoryCluster.last_seen_at.desc(), StoryCluster.id.desc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+
+    return {
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "clusters": [
+            {
+                "id": cluster.id,
+                "label": cluster.label,
+                "member_count": count,
+                "first_seen_at": cluster.first_seen_at,
+                "last_seen_at": cluster.last_seen_at,
+            }
+            for cluster, count in rows
+        ],
+    }
+
+
+# ---------------------------------------------------------
+# GET /api/v1/clusters/{cluster_id}/items — Coverage of one story
+# ---------------------------------------------------------
+@router.get("/{cluster_id}/items", response_model=schemas.NewsListResponse)
+def get_cluster_items(
+    cluster_id: int,
+    include_duplicates: bool = False,
+    db: Session = Depends(get_db),
+):
+    cluster = db.query(StoryCluster).filter(StoryCluster.id == cluster_id).first()
+    if not cluster:
+        raise HTTPException(status_code=404, detail="Cluster not found")
+    if cluster.merged_into:
+        cluster_id = cluster.merged_into
+
+    query = db.query(NewsItem).filter(NewsItem.cluster_id == cluster_id)
+    if not include_duplicates:
+        query = query.filter(NewsItem.is_duplicate.isnot(True))
+
+    items = query.order_by(NewsItem.published_at.desc().nullslast()).all()
+    return {"total": len(items), "items": items}
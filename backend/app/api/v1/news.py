@@ -1,42 +1,25 @@
 # backend/app/api/v1/news.py
 
-from fastapi import APIRouter, Depends
+import time
+from datetime import datetime
+from typing import List, Optional
+
+import numpy as np
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
+from app.config import get_settings
 from app.models.db import get_db
-from app.models.orm_models import Source
 from app.models.orm_models import NewsItem
 from app.models import schemas
 
-from app.services.ingestion.fetcher import fetch_all_sources
 from app.services.ingestion.fetcher import NEWS_SOURCES
-from app.services.ingestion.parsers import parse_raw_items
-from app.services.normalizer import normalize_items
-from app.services.deduper import check_duplicate
-from app.services.ingestion.seed_data import get_seed_news
+from app.services.ingestion.pipeline import iter_ingest_items, run_ingestion_pipeline
+from app.services.ingestion.source_state import ensure_sources_exist
+from app.services.search_index import get_search_index, keyword_score
 
 router = APIRouter()
-
-def ensure_sources_exist(db: Session) -> dict[str, int]:
-    """
-    Ensures sources exist and returns a map: source_url -> source_id
-    """
-    existing = {s.url: s.id for s in db.query(Source).all()}
-
-    for src in NEWS_SOURCES:
-        if src["url"] not in existing:
-            new = Source(
-                name=src["name"],
-                url=src["url"],
-                type=src["type"],
-                active=True,
-            )
-            db.add(new)
-            db.flush()  # 🔥 get ID immediately
-            existing[new.url] = new.id
-
-    db.commit()
-    return existing
+settings = get_settings()
 
 
 # ---------------------------------------------------------
@@ -46,14 +29,20 @@ def ensure_sources_exist(db: Session) -> dict[str, int]:
 def get_news(
     page: int = 1,
     limit: int = 10,
+    include_duplicates: bool = False,
     db: Session = Depends(get_db),
 ):
     offset = (page - 1) * limit
 
-    total = db.query(NewsItem).count()
+    query = db.query(NewsItem)
+    if not include_duplicates:
+        # Syndicated copies are stored, linked via duplicate_of
+        query = query.filter(NewsItem.is_duplicate.isnot(True))
+
+    total = query.count()
 
     items = (
-        db.query(NewsItem)
+        query
         .order_by(NewsItem.published_at.desc().nullslast())
         .offset(offset)
         .limit(limit)
@@ -68,6 +57,67 @@ def get_news(
     }
 
 
+# ---------------------------------------------------------
+# GET /api/v1/news/search — Semantic (+ keyword) search
+# Declared before any /{...} path routes so "search" isn't captured
+# ---------------------------------------------------------
+@router.get("/search", response_model=schemas.NewsSearchResponse)
+def search_news(
+    q: str = Query(..., min_length=1, max_length=500),
+    limit: int = Query(10, ge=1, le=100),
+    source_id: Optional[List[int]] = Query(None),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    keyword_weight: Optional[float] = Query(None, ge=0.0, le=1.0),
+    db: Session = Depends(get_db),
+):
+    """
+    Items whose title embedding is nearest to the query's, optionally
+    blended with a keyword score (keyword_weight, default
+    SEARCH_KEYWORD_WEIGHT) and limited to sources / a published_at range.
+    Needs stored embeddings (EMBEDDINGS=true); duplicates are excluded.
+    """
+    started = time.perf_counter()
+    weight = settings.SEARCH_KEYWORD_WEIGHT if keyword_weight is None else keyword_weight
+
+    try:
+        from app.services.embedder import EmbedderService
+    except ImportError:
+        raise HTTPException(status_code=503, detail="Search needs the embedding model (sentence-transformers)")
+
+    # Single queries are micro-batched with concurrent ones
+    vector = np.asarray(EmbedderService.generate_embedding(q), dtype=np.float32)
+
+    # Keyword re-ranking looks past the semantic top `limit`
+    ids, scores = get_search_index(db).search(
+        vector, k=limit * 4 if weight else limit, sources=source_id, since=since, until=until
+    )
+    found = {news.id: news for news in db.query(NewsItem).filter(NewsItem.id.in_(ids.tolist()))}
+
+    hits = []
+    for item_id, semantic in zip(ids.tolist(), scores.tolist()):
+        news = found.get(item_id)
+        if news is None:
+            continue  # deleted since it was indexed
+        keyword = keyword_score(q, news) if weight else 0.0
+        hits.append({
+            "score": (1 - weight) * semantic + weight * keyword,
+            "semantic_score": semantic,
+            "keyword_score": keyword,
+            "item": news,
+        })
+    hits.sort(key=lambda hit: -hit["score"])
+    hits = hits[:limit]
+
+    return {
+        "query": q,
+        "total": len(hits),
+        "limit": limit,
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        "items": hits,
+    }
+
+
 # ---------------------------------------------------------
 # POST /api/v1/news/refresh — SAFE INGESTION PIPELINE
 # ---------------------------------------------------------
@@ -75,80 +125,21 @@ def get_news(
 def refresh_news(db: Session = Depends(get_db)):
 
     # 1️⃣ Ensure sources exist
-    source_map = ensure_sources_exist(db)
-
-    # 2️⃣ Fetch
-    # raw_items = fetch_all_sources()
-    # if not raw_items:
-    #     return {"inserted": 0, "duplicates": 0}
-    # 2️⃣ Fetch (MODE SWITCH)
-    USE_SEED_DATA = True  # 🔥 MVP DEMO MODE — set False for live RSS
-
-    if USE_SEED_DATA:
-        seed_items = get_seed_news()
-        raw_items = []
-
-        for item in seed_items:
-            raw_items.append({
-                "source_name": item["source_name"],
-                "source_url": item["url"],  # IMPORTANT: used for source_id mapping
-                "parser_key": "rss_generic",
-                "title": item["title"],
-                "url": item["url"],
-                "author": item.get("author"),
-                "published_at": item.get("published_at"),
-                "summary": item.get("content"),
-                "raw": item,
-                "fetched_at": item.get("published_at"),
-            })
-    else:
-        raw_items = fetch_all_sources()
-
-    if not raw_items:
-        return {"inserted": 0, "duplicates": 0}
-
-    # 3️⃣ Parse + normalize
-    parsed = parse_raw_items(raw_items)
-    items = normalize_items(parsed)
-
-    inserted = 0
-    duplicates = 0
-
-    for item in items:
-        source_url = item.get("source_url")
-
-        # HARD GUARD (prevents NULL FK forever)
-        source_id = source_map.get(source_url)
-        if not source_id:
-            continue
-
-        is_dup, _ = check_duplicate(
-            db=db,
-            title=item["title"],
-            url=item["url"],
-        )
-        if is_dup:
-            duplicates += 1
-            continue
-
-        news = NewsItem(
-            source_id=source_id,
-            title=item["title"],
-            summary=item["content"][:500] if item.get("content") else None,
-            author=item.get("author"),
-            url=item["url"],
-            published_at=item.get("published_at"),
-            content=item.get("content"),
-            is_duplicate=False,
-        )
-
-        db.add(news)
-        inserted += 1
-
-    db.commit()
+    source_map = ensure_sources_exist(db, NEWS_SOURCES)
+
+    # 2️⃣ Fetch — a stream, nothing is materialised
+    # REFRESH_FETCH_MODE: seed (🔥 MVP demo, default) / async / sync / replay
+    fetch_stats: dict = {}
+    items = iter_ingest_items(db, mode=settings.REFRESH_FETCH_MODE, stats=fetch_stats)
+
+    # 3️⃣ Parse → normalize → dedupe → insert (chunked commits)
+    result = run_ingestion_pipeline(db, items, source_map)
 
     return {
-        "inserted": inserted,
-        "duplicates": duplicates,
+        "inserted": result["inserted"],
+        "duplicates": result["duplicates"],
+        "batch_duplicates": result["batch_duplicates"],
+        "semantic_duplicates": result["semantic_duplicates"],
+        "unchanged_sources": fetch_stats.get("unchanged", 0),
         "message": "Ingestion completed",
     }
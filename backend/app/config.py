@@ -28,6 +28,12 @@ class Settings(BaseSettings):
     # Groq LLM (MANDATORY)
     # --------------------
     GROQ_API_KEY: str = Field(..., env="GROQ_API_KEY")
+    GROQ_BASE_URL: str | None = Field(default=None, env="GROQ_BASE_URL")  # e.g. a local mock server
+    GROQ_MAX_CONNECTIONS: int = Field(default=16, env="GROQ_MAX_CONNECTIONS")  # per client (sync / each event loop)
+    GROQ_KEEPALIVE_SECONDS: float = Field(default=60.0, env="GROQ_KEEPALIVE_SECONDS")  # idle connections kept
+    GROQ_TIMEOUT_SECONDS: float = Field(default=30.0, env="GROQ_TIMEOUT_SECONDS")
+    GROQ_CONNECT_TIMEOUT_SECONDS: float = Field(default=5.0, env="GROQ_CONNECT_TIMEOUT_SECONDS")
+    GROQ_MAX_RETRIES: int = Field(default=2, env="GROQ_MAX_RETRIES")
 
     # --------------------
     # Email Broadcast (Mock / Optional)
@@ -41,6 +47,80 @@ class Settings(BaseSettings):
     LINKEDIN_CLIENT_ID: str | None = Field(default=None, env="LINKEDIN_CLIENT_ID")
     LINKEDIN_CLIENT_SECRET: str | None = Field(default=None, env="LINKEDIN_CLIENT_SECRET")
 
+    # --------------------
+    # Ingestion / Fetching
+    # --------------------
+    FETCH_MODE: str = Field(default="async", env="FETCH_MODE")  # async / sync / replay / seed
+    REFRESH_FETCH_MODE: str = Field(default="seed", env="REFRESH_FETCH_MODE")  # POST /news/refresh (MVP demo)
+    FETCH_MAX_CONCURRENCY: int = Field(default=32, env="FETCH_MAX_CONCURRENCY")
+    FETCH_PER_HOST_CONCURRENCY: int = Field(default=2, env="FETCH_PER_HOST_CONCURRENCY")
+    FETCH_TIMEOUT_SECONDS: float = Field(default=20.0, env="FETCH_TIMEOUT_SECONDS")
+    FETCH_BUFFER_SIZE: int = Field(default=4, env="FETCH_BUFFER_SIZE")  # fetched feeds waiting to be parsed
+    INGEST_CHUNK_SIZE: int = Field(default=50, env="INGEST_CHUNK_SIZE")  # items per DB commit
+    PARSE_WORKERS: int = Field(default=0, env="PARSE_WORKERS")  # 0 = parse inline, >0 = process pool
+    PARSE_CHUNK_SIZE: int = Field(default=1, env="PARSE_CHUNK_SIZE")  # fetched feeds per pool task
+    HWM_GUID_LIMIT: int = Field(default=1000, env="HWM_GUID_LIMIT")  # recent entry ids kept per source
+
+    # Full-article extraction (background, after insert)
+    ARTICLE_EXTRACTION: bool = Field(default=False, env="ARTICLE_EXTRACTION")
+    ARTICLE_MAX_CONCURRENCY: int = Field(default=8, env="ARTICLE_MAX_CONCURRENCY")
+    ARTICLE_PER_HOST_CONCURRENCY: int = Field(default=2, env="ARTICLE_PER_HOST_CONCURRENCY")
+    ARTICLE_TIMEOUT_SECONDS: float = Field(default=15.0, env="ARTICLE_TIMEOUT_SECONDS")
+    ARTICLE_MAX_BYTES: int = Field(default=2_000_000, env="ARTICLE_MAX_BYTES")  # page download cap
+    ARTICLE_MIN_CHARS: int = Field(default=300, env="ARTICLE_MIN_CHARS")  # shorter extractions are ignored
+
+    # Title embeddings (stored on new items; cached by model + text)
+    EMBEDDINGS: bool = Field(default=False, env="EMBEDDINGS")  # also on when an embedding stage needs them
+    EMBEDDING_BATCH_SIZE: int = Field(default=64, env="EMBEDDING_BATCH_SIZE")  # texts per model forward pass
+    EMBEDDING_BATCH_WINDOW_MS: float = Field(default=5.0, env="EMBEDDING_BATCH_WINDOW_MS")  # single-text requests coalesce this long
+    EMBEDDER_BACKEND: str = Field(default="torch", env="EMBEDDER_BACKEND")  # torch / torch-int8 / onnx
+    EMBEDDER_THREADS: int = Field(default=0, env="EMBEDDER_THREADS")  # intra-op threads, 0 = library default
+    EMBEDDING_STORAGE: str = Field(default="float32", env="EMBEDDING_STORAGE")  # float32 / int8 (see utils/vectors.py)
+
+    # Near-duplicate title index (MinHash/LSH snapshot, see services/title_index.py)
+    DEDUP_INDEX_PATH: str = Field(default="data/title_index.npz", env="DEDUP_INDEX_PATH")
+
+    # Seen-URL Bloom filter (memory-mapped, see services/url_filter.py)
+    URL_FILTER: bool = Field(default=True, env="URL_FILTER")
+    URL_FILTER_PATH: str = Field(default="data/url_filter.bloom", env="URL_FILTER_PATH")
+    URL_FILTER_CAPACITY: int = Field(default=2_000_000, env="URL_FILTER_CAPACITY")  # URLs before a rebuild
+    URL_FILTER_ERROR_RATE: float = Field(default=0.001, env="URL_FILTER_ERROR_RATE")
+
+    # Semantic dedup (title embeddings vs recent items, see services/vector_index.py)
+    SEMANTIC_DEDUP: bool = Field(default=False, env="SEMANTIC_DEDUP")
+    SEMANTIC_DEDUP_THRESHOLD: float = Field(default=0.90, env="SEMANTIC_DEDUP_THRESHOLD")  # cosine
+    SEMANTIC_DEDUP_WINDOW_DAYS: int = Field(default=7, env="SEMANTIC_DEDUP_WINDOW_DAYS")  # index rebuild window
+    SEMANTIC_DEDUP_MAX_ITEMS: int = Field(default=200_000, env="SEMANTIC_DEDUP_MAX_ITEMS")  # newest vectors kept
+    EMBEDDING_DIM: int = Field(default=384, env="EMBEDDING_DIM")  # all-MiniLM-L6-v2
+
+    # Story clustering (online, see services/clustering.py)
+    STORY_CLUSTERING: bool = Field(default=False, env="STORY_CLUSTERING")
+    CLUSTER_THRESHOLD: float = Field(default=0.75, env="CLUSTER_THRESHOLD")  # cosine to join a cluster
+    CLUSTER_WINDOW_HOURS: int = Field(default=72, env="CLUSTER_WINDOW_HOURS")  # clusters idle longer are closed
+    CLUSTER_HALF_LIFE_HOURS: float = Field(default=24.0, env="CLUSTER_HALF_LIFE_HOURS")  # centroid member decay
+    CLUSTER_MERGE_THRESHOLD: float = Field(default=0.85, env="CLUSTER_MERGE_THRESHOLD")  # compaction
+    CLUSTER_COMPACT_INTERVAL_SECONDS: int = Field(default=60 * 60, env="CLUSTER_COMPACT_INTERVAL_SECONDS")
+
+    # Semantic search (GET /api/v1/news/search, see services/search_index.py)
+    SEARCH_IVF_MIN_ITEMS: int = Field(default=50_000, env="SEARCH_IVF_MIN_ITEMS")  # exact search below this
+    SEARCH_IVF_PROBES: int = Field(default=32, env="SEARCH_IVF_PROBES")  # lists scanned per query (recall vs latency)
+    SEARCH_KEYWORD_WEIGHT: float = Field(default=0.3, env="SEARCH_KEYWORD_WEIGHT")  # default share of the keyword score
+
+    # Raw feed snapshots (capture for replay / reprocessing)
+    SNAPSHOT_CAPTURE: bool = Field(default=False, env="SNAPSHOT_CAPTURE")
+    SNAPSHOT_DIR: str = Field(default="data/snapshots", env="SNAPSHOT_DIR")
+
+    # Adaptive polling (per-source intervals, learned from publish rate)
+    POLL_DEFAULT_INTERVAL_SECONDS: int = Field(default=15 * 60, env="POLL_DEFAULT_INTERVAL_SECONDS")
+    POLL_MIN_INTERVAL_SECONDS: int = Field(default=2 * 60, env="POLL_MIN_INTERVAL_SECONDS")
+    POLL_MAX_INTERVAL_SECONDS: int = Field(default=6 * 60 * 60, env="POLL_MAX_INTERVAL_SECONDS")
+    POLL_TICK_SECONDS: int = Field(default=30, env="POLL_TICK_SECONDS")
+
+    # Per-source circuit breaker (exponential backoff for failing sources)
+    SOURCE_FAILURE_THRESHOLD: int = Field(default=3, env="SOURCE_FAILURE_THRESHOLD")
+    SOURCE_BACKOFF_BASE_SECONDS: int = Field(default=5 * 60, env="SOURCE_BACKOFF_BASE_SECONDS")
+    SOURCE_BACKOFF_MAX_SECONDS: int = Field(default=24 * 60 * 60, env="SOURCE_BACKOFF_MAX_SECONDS")
+
     # --------------------
     # Logging
     # --------------------
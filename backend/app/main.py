@@ -4,9 +4,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.api.v1 import news, favorites, broadcast, admin
+from app.api.v1 import news, favorites, broadcast, admin, clusters
 
-from app.models.db import init_db
+from app.models.db import SessionLocal, init_db
+from app.services.deduper import backfill_url_hashes
+from app.services.embed_batcher import shutdown_embedding_batcher
+from app.services.groq_client import shutdown_groq_pool
+from app.services.ingestion.embeddings import warm_embedder
+from app.services.search_index import warm_search_index
+from app.services.vector_index import warm_semantic_dedup
 
 
 # Load environment settings
@@ -38,6 +44,17 @@ app.add_middleware(
 # -------------------------------------------------------------
 # Event Hooks
 # -------------------------------------------------------------
+def backfill_legacy_url_hashes():
+    # Rows from before url_hash existed; a no-op once they are hashed
+    db = SessionLocal()
+    try:
+        updated = backfill_url_hashes(db)
+        if updated:
+            print(f" Backfilled url_hash on {updated} news item(s)")
+    finally:
+        db.close()
+
+
 @app.on_event("startup")
 async def startup():
     """
@@ -49,6 +66,15 @@ async def startup():
     """
     print(" FastAPI backend started successfully!")
     init_db() 
+    backfill_legacy_url_hashes()
+
+    if settings.SEMANTIC_DEDUP:
+        warm_semantic_dedup()
+    elif settings.EMBEDDINGS or settings.STORY_CLUSTERING:
+        warm_embedder()
+
+    if settings.EMBEDDINGS:
+        warm_search_index()
 
 
 @app.on_event("shutdown")
@@ -59,6 +85,8 @@ async def shutdown():
     - Cleaning connections
     - Releasing resources
     """
+    shutdown_embedding_batcher()
+    await shutdown_groq_pool()
     print(" FastAPI backend shutdown.")
 
 
@@ -69,6 +97,7 @@ app.include_router(news.router, prefix="/api/v1/news", tags=["News"])
 app.include_router(favorites.router, prefix="/api/v1/favorites", tags=["Favorites"])
 app.include_router(broadcast.router, prefix="/api/v1/broadcast", tags=["Broadcast"])
 app.include_router(admin.router, prefix="/api/v1/admin", tags=["Admin"])
+app.include_router(clusters.router, prefix="/api/v1/clusters", tags=["Clusters"])
 
 
 # -------------------------------------------------------------
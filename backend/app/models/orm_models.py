@@ -11,11 +11,13 @@ from sqlalchemy import (
     Text,
     DateTime,
     ForeignKey,
+    Float,
     JSON
 )
 from sqlalchemy.orm import relationship
 
 from app.models.db import Base
+from app.models.types import VectorType
 
 
 # --------------------------------------------------
@@ -32,6 +34,26 @@ class Source(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    # HTTP cache validators (conditional GET)
+    etag = Column(String(255), nullable=True)
+    last_modified = Column(String(100), nullable=True)
+
+    # Adaptive polling state
+    poll_interval_seconds = Column(Integer, nullable=True)
+    next_poll_at = Column(DateTime, nullable=True)
+    latest_published_at = Column(DateTime, nullable=True)  # newest entry seen
+
+    # Health / circuit breaker
+    failure_count = Column(Integer, default=0, nullable=False)
+    last_success_at = Column(DateTime, nullable=True)
+    last_failure_at = Column(DateTime, nullable=True)
+    next_retry_at = Column(DateTime, nullable=True)  # breaker open until then
+    last_error = Column(String(500), nullable=True)
+
+    # Incremental ingestion high-water mark (entries at/below it are skipped)
+    hwm_published_at = Column(DateTime, nullable=True)
+    recent_guids = Column(JSON, nullable=True)  # newest-first entry ids
+
     # Relationship: one source → many news items
     news_items = relationship("NewsItem", back_populates="source")
 
@@ -49,11 +71,12 @@ class NewsItem(Base):
     summary = Column(Text, nullable=True)
     author = Column(String(255), nullable=True)
     url = Column(String(1000), unique=True)
+    url_hash = Column(String(32), index=True, nullable=True)  # canonical URL (utils/urls.py)
     published_at = Column(DateTime)
     retrieved_at = Column(DateTime, default=datetime.utcnow)
 
-    # Embedding stored as JSON (for pgvector you will change this)
-    embedding = Column(JSON, nullable=True)
+    # Title embedding, packed float32 / int8 bytes (models/types.py)
+    embedding = Column(VectorType(), nullable=True)
 
     # Tags, keywords, entities (NER)
     tags = Column(JSON, nullable=True)
@@ -61,7 +84,7 @@ class NewsItem(Base):
     # Duplicate handling
     is_duplicate = Column(Boolean, default=False)
     duplicate_of = Column(Integer, ForeignKey("news_items.id"), nullable=True)  # points to original
-    cluster_id = Column(Integer, nullable=True)  # used for clustering (optional)
+    cluster_id = Column(Integer, ForeignKey("story_clusters.id"), nullable=True, index=True)  # story (services/clustering.py)
 
     # Full article text (optional)
     content = Column(Text, nullable=True)
@@ -69,6 +92,61 @@ class NewsItem(Base):
     # Relationships
     source = relationship("Source", back_populates="news_items")
     favorites = relationship("Favorite", back_populates="news_item")
+    original = relationship("NewsItem", remote_side=[id], foreign_keys=[duplicate_of])
+    cluster = relationship("StoryCluster")
+
+
+# --------------------------------------------------
+# Story Cluster Table (coverage of one event)
+# --------------------------------------------------
+class StoryCluster(Base):
+    __tablename__ = "story_clusters"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    label = Column(String(500), nullable=True)  # title of the first item
+
+    # Time-decayed sum of member title embeddings (direction = centroid);
+    # always float32, it is re-read and updated in place
+    centroid = Column(VectorType("float32"), nullable=False)
+    weight = Column(Float, nullable=False, default=1.0)  # decayed member count
+    size = Column(Integer, nullable=False, default=1)  # members assigned online
+
+    first_seen_at = Column(DateTime, default=datetime.utcnow)
+    last_seen_at = Column(DateTime, default=datetime.utcnow, index=True)
+
+    merged_into = Column(Integer, ForeignKey("story_clusters.id"), nullable=True)  # set by compaction
+
+
+# --------------------------------------------------
+# Embedding Cache Table (vectors by model + normalized text)
+# --------------------------------------------------
+class EmbeddingCache(Base):
+    __tablename__ = "embedding_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    key = Column(String(32), unique=True, nullable=False, index=True)  # hash of (model, text)
+    model = Column(String(255), nullable=False)
+    vector = Column(VectorType(), nullable=False)
+
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+
+# --------------------------------------------------
+# Article Cache Table (extracted page text by URL)
+# --------------------------------------------------
+class ArticleCache(Base):
+    __tablename__ = "article_cache"
+
+    id = Column(Integer, primary_key=True, index=True)
+
+    url = Column(String(1000), unique=True, nullable=False, index=True)
+    status = Column(String(20), nullable=False)  # ok / empty / failed
+    text = Column(Text, nullable=True)
+    error = Column(String(500), nullable=True)
+
+    fetched_at = Column(DateTime, default=datetime.utcnow)
 
 
 # --------------------------------------------------
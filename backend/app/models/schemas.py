@@ -26,10 +26,22 @@ class SourceResponse(SourceBase):
     id: int
     created_at: datetime
 
+    # Health / circuit breaker
+    failure_count: int = 0
+    last_success_at: Optional[datetime] = None
+    last_failure_at: Optional[datetime] = None
+    next_retry_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+
     class Config:
         orm_mode = True
 
 
+class SourceListResponse(BaseModel):
+    total: int
+    sources: List[SourceResponse]
+
+
 # ============================================================
 # News Item Schemas
 # ============================================================
@@ -61,6 +73,40 @@ class NewsItemResponse(NewsItemBase):
         orm_mode = True
 
 
+class NewsSearchHit(BaseModel):
+    score: float           # what hits are ranked by
+    semantic_score: float  # cosine of query and title embeddings
+    keyword_score: float   # share of query words in title / summary
+    item: NewsItemResponse
+
+
+class NewsSearchResponse(BaseModel):
+    query: str
+    total: int
+    limit: int
+    took_ms: float
+    items: List[NewsSearchHit]
+
+
+# ============================================================
+# Story Cluster Schemas
+# ============================================================
+
+class StoryClusterResponse(BaseModel):
+    id: int
+    label: Optional[str] = None
+    member_count: int
+    first_seen_at: Optional[datetime] = None
+    last_seen_at: Optional[datetime] = None
+
+
+class PaginatedClusterResponse(BaseModel):
+    total: int
+    page: int
+    limit: int
+    clusters: List[StoryClusterResponse]
+
+
 # ============================================================
 # Favorite Schemas
 # ============================================================
@@ -0,0 +1,50 @@
+# backend/app/models/types.py
+
+"""
+Custom column types.
+"""
+
+import json
+from typing import Optional
+
+import numpy as np
+from sqlalchemy.types import LargeBinary, TypeDecorator
+
+from app.config import get_settings
+from app.utils.vectors import decode_vector, encode_vector
+
+settings = get_settings()
+
+
+class VectorType(TypeDecorator):
+    """
+    Embedding stored as packed bytes (utils/vectors.py), bytea on
+    Postgres / BLOB on SQLite. Python side: a float32 NumPy array.
+
+    storage: "float32" / "int8" (default: EMBEDDING_STORAGE at write time)
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, storage: Optional[str] = None):
+        super().__init__()
+        self.storage = storage
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, (bytes, bytearray, memoryview)):
+            return value
+        return encode_vector(value, self.storage or settings.EMBEDDING_STORAGE)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        if isinstance(value, str):
+            # JSON list written before this column was binary (SQLite keeps it)
+            return np.asarray(json.loads(value), dtype=np.float32)
+        return decode_vector(value)  # bytes, or memoryview from psycopg2
+
+    def compare_values(self, x, y):
+        if x is None or y is None:
+            return x is y
+        return np.array_equal(x, y)
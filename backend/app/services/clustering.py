@@ -0,0 +1,309 @@
+# backend/app/services/clustering.py
+
+"""
+Online story clustering (fills NewsItem.cluster_id).
+
+Each new item joins the most similar open cluster or opens a new one:
+
+    title embedding · centroid of every open cluster → best cosine
+        >= CLUSTER_THRESHOLD → join (centroid updated in place)
+        otherwise            → new cluster
+
+A cluster is open while its newest member is less than
+CLUSTER_WINDOW_HOURS from the item, so an assignment costs one
+matrix-vector product over the open clusters — O(open clusters),
+never a re-cluster. Centroids are time-decayed sums of member vectors
+(half-life CLUSTER_HALF_LIFE_HOURS): a long-running story follows its
+latest coverage instead of its first headline.
+
+Online assignment is order-dependent, so two clusters can end up
+covering one event. compact_clusters() (worker, every
+CLUSTER_COMPACT_INTERVAL_SECONDS) merges open clusters whose centroids
+drifted together.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem, StoryCluster
+from app.utils.similarity import cosine_matrix, cosine_scores, normalize_rows
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+EPOCH = datetime(1970, 1, 1)
+
+
+def _seconds(value: Optional[datetime]) -> float:
+    # Feed dates are tz-aware UTC, DB columns naive UTC
+    value = value or datetime.utcnow()
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH).total_seconds()
+
+
+def _decay(age_seconds: float) -> float:
+    half_life = settings.CLUSTER_HALF_LIFE_HOURS * 3600
+    return 0.5 ** (max(age_seconds, 0.0) / half_life)
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+def _open_clusters(db: Session) -> List[StoryCluster]:
+    since = datetime.utcnow() - timedelta(hours=settings.CLUSTER_WINDOW_HOURS)
+    return (
+        db.query(StoryCluster)
+        .filter(StoryCluster.merged_into.is_(None))
+        .filter(StoryCluster.last_seen_at >= since)
+        .order_by(StoryCluster.id)
+        .all()
+    )
+
+
+class StoryClusterer:
+    """
+    Open clusters for one ingestion run, as contiguous arrays.
+
+    assign() links items before the chunk is flushed (new clusters via
+    the relationship, known ones by id); write() persists the touched
+    clusters after the flush.
+    """
+
+    def __init__(self, dim: int, capacity: int = 256):
+        self.dim = dim
+        self.threshold = settings.CLUSTER_THRESHOLD
+        self.window = settings.CLUSTER_WINDOW_HOURS * 3600
+
+        self._sums = np.empty((capacity, dim), dtype=np.float32)       # decayed member sums
+        self._centroids = np.empty((capacity, dim), dtype=np.float32)  # unit-length sums
+        self._weights = np.empty(capacity, dtype=np.float64)
+        self._sizes = np.empty(capacity, dtype=np.int64)
+        self._first_seen = np.empty(capacity, dtype=np.float64)
+        self._last_seen = np.empty(capacity, dtype=np.float64)
+        self._ids: List[Optional[int]] = []
+        self._new: Dict[int, StoryCluster] = {}  # slot → row not flushed yet
+        self._dirty = set()
+        self._slot_of: Dict[NewsItem, int] = {}  # items assigned this run
+        self.size = 0
+
+    @classmethod
+    def load(cls, db: Session) -> "StoryClusterer":
+        clusterer = cls(settings.EMBEDDING_DIM)
+        for row in _open_clusters(db):
+            if row.centroid is None or len(row.centroid) != clusterer.dim:
+                continue
+            slot = clusterer._append(
+                row.centroid,
+                row.weight, row.size,
+                _seconds(row.first_seen_at), _seconds(row.last_seen_at),
+            )
+            clusterer._ids[slot] = row.id
+        return clusterer
+
+    def _append(self, total, weight, size, first_seen, last_seen) -> int:
+        slot = self.size
+        if slot == len(self._weights):
+            capacity = 2 * slot
+            for name in ("_sums", "_centroids", "_weights", "_sizes", "_first_seen", "_last_seen"):
+                old = getattr(self, name)
+                grown = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+                grown[:slot] = old
+                setattr(self, name, grown)
+
+        self._sums[slot] = total
+        self._centroids[slot] = _unit(total)
+        self._weights[slot] = weight
+        self._sizes[slot] = size
+        self._first_seen[slot] = first_seen
+        self._last_seen[slot] = last_seen
+        self._ids.append(None)
+        self.size += 1
+        return slot
+
+    # -------------------------
+    # Assignment
+    # -------------------------
+    def _best(self, vector: np.ndarray, seen: float) -> Optional[int]:
+        if not self.size:
+            return None
+
+        sims = cosine_scores(vector, self._centroids[:self.size])
+        sims[np.abs(seen - self._last_seen[:self.size]) > self.window] = -np.inf
+        slot = int(np.argmax(sims))
+        return slot if sims[slot] >= self.threshold else None
+
+    def _join(self, slot: int, vector: np.ndarray, seen: float) -> None:
+        last = self._last_seen[slot]
+        if seen >= last:
+            decay = _decay(seen - last)
+            self._sums[slot] = self._sums[slot] * decay + vector
+            self._weights[slot] = self._weights[slot] * decay + 1.0
+            self._last_seen[slot] = seen
+        else:
+            decay = _decay(last - seen)  # older item counts for less
+            self._sums[slot] += vector * decay
+            self._weights[slot] += decay
+
+        self._first_seen[slot] = min(self._first_seen[slot], seen)
+        self._centroids[slot] = _unit(self._sums[slot])
+        self._sizes[slot] += 1
+
+    def _link(self, news: NewsItem, slot: int) -> None:
+        if self._ids[slot] is not None:
+            news.cluster_id = self._ids[slot]
+        else:
+            news.cluster = self._new[slot]
+        self._slot_of[news] = slot
+
+    def assign(self, db: Session, items: List[NewsItem], vectors: np.ndarray) -> None:
+        """
+        Cluster kept items (vectors: unit-length title embeddings, one row each).
+        """
+        for news, vector in zip(items, vectors):
+            seen = min(_seconds(news.published_at), _seconds(None))  # no future dates
+
+            slot = self._best(vector, seen)
+            if slot is None:
+                slot = self._append(vector, 1.0, 1, seen, seen)
+                row = StoryCluster(label=(news.title or "")[:500], centroid=vector.copy())
+                db.add(row)
+                self._new[slot] = row
+            else:
+                self._join(slot, vector, seen)
+
+            self._dirty.add(slot)
+            self._link(news, slot)
+
+    def inherit(self, copy: NewsItem, root: NewsItem) -> None:
+        """
+        A duplicate belongs to its original's story.
+        """
+        slot = self._slot_of.get(root)
+        if slot is not None:
+            self._link(copy, slot)
+        else:
+            copy.cluster_id = root.cluster_id
+
+    def write(self, db: Session) -> None:
+        """
+        Persist touched clusters (call after flush, before commit).
+        """
+        for slot, row in self._new.items():
+            self._ids[slot] = row.id
+        self._new = {}
+
+        if not self._dirty:
+            return
+        db.bulk_update_mappings(StoryCluster, [
+            {
+                "id": self._ids[slot],
+                "centroid": self._sums[slot].copy(),
+                "weight": float(self._weights[slot]),
+                "size": int(self._sizes[slot]),
+                "first_seen_at": EPOCH + timedelta(seconds=float(self._first_seen[slot])),
+                "last_seen_at": EPOCH + timedelta(seconds=float(self._last_seen[slot])),
+            }
+            for slot in sorted(self._dirty)
+        ])
+        self._dirty = set()
+
+
+# -------------------------
+# Compaction
+# -------------------------
+def _relink_stragglers(db: Session) -> None:
+    """
+    Items a concurrent run assigned to a cluster after it was merged.
+    """
+    since = datetime.utcnow() - timedelta(hours=settings.CLUSTER_WINDOW_HOURS)
+    merged = (
+        db.query(StoryCluster.id, StoryCluster.merged_into)
+        .filter(StoryCluster.merged_into.isnot(None))
+        .filter(StoryCluster.last_seen_at >= since)
+        .all()
+    )
+    for cluster_id, target in merged:
+        db.query(NewsItem).filter(NewsItem.cluster_id == cluster_id).update(
+            {NewsItem.cluster_id: target}, synchronize_session=False
+        )
+
+
+def compact_clusters(db: Session, threshold: Optional[float] = None) -> int:
+    """
+    Merge open clusters whose centroids are within `threshold` cosine
+    (default CLUSTER_MERGE_THRESHOLD), most similar pairs first; the
+    heavier cluster absorbs the lighter one and its items.
+
+    Returns the number of clusters merged away.
+    """
+    threshold = threshold or settings.CLUSTER_MERGE_THRESHOLD
+    _relink_stragglers(db)
+
+    rows = [
+        row for row in _open_clusters(db)
+        if row.centroid is not None and len(row.centroid) == settings.EMBEDDING_DIM
+    ]
+    if len(rows) < 2:
+        return 0
+
+    sums = np.stack([row.centroid for row in rows])
+    sims = cosine_matrix(normalize_rows(sums))
+
+    first, second = np.nonzero(np.triu(sims, k=1) >= threshold)
+    if not len(first):
+        return 0
+    order = np.argsort(-sims[first, second])
+
+    parent = list(range(len(rows)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    merged = 0
+    for a, b in zip(first[order].tolist(), second[order].tolist()):
+        a, b = find(a), find(b)
+        if a == b:
+            continue
+        # Re-check on the current (possibly already merged) centroids
+        if float(_unit(sums[a]) @ _unit(sums[b])) < threshold:
+            continue
+
+        keep, drop = (a, b) if rows[a].weight >= rows[b].weight else (b, a)
+        kept, dropped = rows[keep], rows[drop]
+
+        latest = max(kept.last_seen_at, dropped.last_seen_at)
+        keep_decay = _decay((latest - kept.last_seen_at).total_seconds())
+        drop_decay = _decay((latest - dropped.last_seen_at).total_seconds())
+
+        sums[keep] = sums[keep] * keep_decay + sums[drop] * drop_decay
+        kept.centroid = sums[keep].copy()
+        kept.weight = kept.weight * keep_decay + dropped.weight * drop_decay
+        kept.size += dropped.size
+        kept.first_seen_at = min(kept.first_seen_at, dropped.first_seen_at)
+        kept.last_seen_at = latest
+
+        dropped.merged_into = kept.id
+        db.query(NewsItem).filter(NewsItem.cluster_id == dropped.id).update(
+            {NewsItem.cluster_id: kept.id}, synchronize_session=False
+        )
+        db.query(StoryCluster).filter(StoryCluster.merged_into == dropped.id).update(
+            {StoryCluster.merged_into: kept.id}, synchronize_session=False
+        )
+
+        parent[drop] = keep
+        merged += 1
+
+    db.commit()
+    logger.info(f"Cluster compaction: merged {merged} of {len(rows)} open cluster(s)")
+    return merged
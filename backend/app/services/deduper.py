@@ -4,14 +4,35 @@
 Deduplication logic for news ingestion.
 
 MVP rules:
-1. URL-based deduplication (mandatory)
-2. Title similarity deduplication (mandatory)
-3. ONLY compare against DB (never within the same batch)
+1. Batch-local dedup first (BatchDeduper): copies of the same story
+   within one ingestion run are caught in memory, before any DB
+   lookup or LLM call
+2. URL-based deduplication (mandatory) — on the canonical URL hash,
+   resolved for a whole batch with one query (find_existing_urls);
+   URLs the seen-URL Bloom filter has never held skip the query
+3. Title similarity deduplication (mandatory)
+4. Semantic dedup (optional, SEMANTIC_DEDUP): paraphrased headlines,
+   by title-embedding cosine against recent items (SemanticDeduper)
 """
 
 from difflib import SequenceMatcher
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import or_, update
 from sqlalchemy.orm import Session
+from app.config import get_settings
 from app.models.orm_models import NewsItem
+from app.services.title_index import TitleIndex, get_title_index
+from app.services.url_filter import get_url_filter
+from app.services.vector_index import get_vector_index
+from app.utils.similarity import cosine_matrix
+from app.utils.urls import url_hash as compute_url_hash
+
+settings = get_settings()
+
+# Strict threshold (prevents over-dedup)
+TITLE_SIMILARITY_THRESHOLD = 0.90
 
 
 # ----------------------------------------
@@ -21,6 +42,224 @@ def title_similarity(a: str, b: str) -> float:
     return SequenceMatcher(None, a.lower(), b.lower()).ratio()
 
 
+def is_similar_title(a: str, b: str, threshold: float = TITLE_SIMILARITY_THRESHOLD) -> bool:
+    """
+    title_similarity(a, b) >= threshold, with difflib's cheap upper bounds first.
+    """
+    matcher = SequenceMatcher(None, a.lower(), b.lower())
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
+# ----------------------------------------
+# Batch-local dedup (memory only)
+# ----------------------------------------
+class BatchDeduper:
+    """
+    Remembers the items kept so far in one ingestion run, by canonical
+    URL hash and by title (in-memory LSH, same rules as the DB check).
+    match() returns the kept item a new one duplicates, if any.
+    """
+
+    def __init__(self):
+        self._by_url: Dict[str, Any] = {}
+        self._titles = TitleIndex()
+        self._kept: List[Tuple[str, Any]] = []  # position = id in _titles
+
+    def match(self, title: str, url_key: Optional[str]) -> Optional[Any]:
+        if url_key and url_key in self._by_url:
+            return self._by_url[url_key]
+
+        for pos in self._titles.candidates(title):
+            kept_title, kept = self._kept[pos]
+            if is_similar_title(title, kept_title):
+                return kept
+        return None
+
+    def add(self, title: str, url_key: Optional[str], kept: Any) -> None:
+        if url_key:
+            self._by_url.setdefault(url_key, kept)
+        self._titles.add(len(self._kept), title)
+        self._kept.append((title, kept))
+
+
+# ----------------------------------------
+# Semantic dedup (optional)
+# ----------------------------------------
+class SemanticDeduper:
+    """
+    Marks a chunk's new items whose title embedding is within
+    `threshold` cosine of a recent item (process-wide vector index) or
+    of an item kept earlier in the same chunk.
+
+    mark() runs before the chunk is flushed; index_kept() appends the
+    kept items once they have ids.
+    """
+
+    def __init__(self, db: Session, threshold: Optional[float] = None):
+        self.db = db
+        self.threshold = threshold or settings.SEMANTIC_DEDUP_THRESHOLD
+        self.index = get_vector_index(db)
+        self._pending: List[Tuple[NewsItem, np.ndarray]] = []
+        self._roots: Dict[NewsItem, NewsItem] = {}  # marked item → its original
+
+    def mark(self, items: List[NewsItem], vectors: np.ndarray) -> List[int]:
+        """
+        vectors: unit-length title embeddings, one row per item.
+
+        Returns the positions of the items kept; the others get
+        is_duplicate=True and `original` set to the item they repeat.
+        """
+        if not items:
+            return []
+
+        # Items other processes stored since the last chunk
+        self.index.sync(self.db)
+
+        best_ids, best_scores = self.index.search(vectors, k=1)
+        local = cosine_matrix(vectors)
+
+        kept_pos: List[int] = []
+        for pos, news in enumerate(items):
+            score, original = float(best_scores[pos, 0]), None
+            if score >= self.threshold:
+                original = int(best_ids[pos, 0])
+
+            if kept_pos:
+                row = local[pos, kept_pos]
+                best = int(np.argmax(row))
+                if row[best] >= self.threshold and row[best] > score:
+                    original = items[kept_pos[best]]
+
+            if isinstance(original, int):
+                original = self.db.get(NewsItem, original)  # None if deleted since
+
+            if original is None:
+                kept_pos.append(pos)
+                self._pending.append((news, vectors[pos]))
+                continue
+
+            news.is_duplicate = True
+            news.original = original
+            self._roots[news] = original
+
+        return kept_pos
+
+    def root(self, news: NewsItem) -> NewsItem:
+        """
+        The kept item `news` stands for: itself, or its original when
+        mark() flagged it (originals are always kept items).
+        """
+        return self._roots.get(news, news)
+
+    def index_kept(self) -> None:
+        """
+        Add the kept items to the vector index (call after flush).
+        """
+        if not self._pending:
+            return
+        self.index.add(
+            [news.id for news, _ in self._pending],
+            np.stack([vector for _, vector in self._pending]),
+        )
+        self._pending = []
+
+
+# ----------------------------------------
+# Helper: batch URL lookup
+# ----------------------------------------
+def find_existing_urls(
+    db: Session,
+    urls: Iterable[Tuple[str, Optional[str]]],
+) -> Dict[str, int]:
+    """
+    One query for a batch of (url, url_hash) pairs.
+
+    Returns {url_hash or url: existing news_item id}. Raw URLs are
+    matched too, for rows stored before url_hash existed (startup
+    hashes those, see backfill_url_hashes).
+
+    Only URLs the seen-URL filter may hold are looked up; the rest are
+    definitely new (see url_filter.py). The filter first catches up on
+    rows committed by other processes (API refresh vs worker), or their
+    URLs would pass as new.
+    """
+    urls = [(url, hashed) for url, hashed in urls if url]
+
+    url_filter = get_url_filter(db) if urls else None
+    if url_filter is not None:
+        url_filter.sync(db)
+        hashed_urls = [(url, hashed) for url, hashed in urls if hashed]
+        maybe = url_filter.screen([hashed for _, hashed in hashed_urls])
+        urls = [pair for pair, hit in zip(hashed_urls, maybe.tolist()) if hit] + [
+            (url, hashed) for url, hashed in urls if not hashed
+        ]
+
+    if not urls:
+        return {}
+
+    hashes = {hashed for _, hashed in urls if hashed}
+    raw_urls = {url for url, _ in urls}
+
+    rows = (
+        db.query(NewsItem.id, NewsItem.url, NewsItem.url_hash)
+        .filter(or_(NewsItem.url_hash.in_(hashes), NewsItem.url.in_(raw_urls)))
+        .all()
+    )
+
+    existing: Dict[str, int] = {}
+    for item_id, url, hashed in rows:
+        if hashed in hashes:
+            existing.setdefault(hashed, item_id)
+        if url in raw_urls:
+            existing.setdefault(url, item_id)
+
+    if url_filter is not None:
+        url_filter.record_false_positives(
+            sum(1 for url, hashed in urls if hashed and hashed not in existing and url not in existing)
+        )
+    return existing
+
+
+def backfill_url_hashes(db: Session, batch_size: int = 5_000) -> int:
+    """
+    Set url_hash on rows stored before it existed. Until then they only
+    match by raw URL, so canonical variants of those articles (tracking
+    params, www., trailing slash) pass as new. Commits per batch; one
+    indexed query once every row is hashed. Returns rows updated.
+    """
+    updated = 0
+    last_id = 0
+    while True:
+        rows = (
+            db.query(NewsItem.id, NewsItem.url)
+            .filter(NewsItem.url_hash.is_(None))
+            .filter(NewsItem.url.isnot(None))
+            .filter(NewsItem.id > last_id)
+            .order_by(NewsItem.id)
+            .limit(batch_size)
+            .all()
+        )
+        if not rows:
+            break
+
+        hashed = [
+            {"id": item_id, "url_hash": hashed_url}
+            for item_id, hashed_url in ((item_id, compute_url_hash(url)) for item_id, url in rows)
+            if hashed_url
+        ]
+        if hashed:
+            db.execute(update(NewsItem), hashed)
+            db.commit()
+        updated += len(hashed)
+        last_id = rows[-1][0]
+
+    return updated
+
+
 # ----------------------------------------
 # Main dedup function
 # ----------------------------------------
@@ -28,8 +267,14 @@ def check_duplicate(
     db: Session,
     title: str,
     url: str,
+    url_hash: Optional[str] = None,
+    existing_urls: Optional[Dict[str, int]] = None,
 ) -> tuple[bool, int | None]:
     """
+    url_hash:      canonical hash of `url` (computed when omitted)
+    existing_urls: find_existing_urls() result for the current batch;
+                   without it the URL check costs one query
+
     Returns:
         (is_duplicate, duplicate_of_id)
     """
@@ -37,32 +282,34 @@ def check_duplicate(
     # -------------------------
     # 1. URL-based dedup
     # -------------------------
-    existing_by_url = (
-        db.query(NewsItem)
-        .filter(NewsItem.url == url)
-        .first()
-    )
+    url_hash = url_hash or compute_url_hash(url)
+    if existing_urls is None:
+        existing_urls = find_existing_urls(db, [(url, url_hash)])
 
-    if existing_by_url:
-        return True, existing_by_url.id
+    existing_id = existing_urls.get(url_hash) or existing_urls.get(url)
+    if existing_id:
+        return True, existing_id
 
     # -------------------------
     # 2. Title similarity dedup
     # -------------------------
-    existing_titles = (
-        db.query(NewsItem.id, NewsItem.title)
-        .all()
-    )
-
-    for item_id, existing_title in existing_titles:
-        if not existing_title:
-            continue
+    # Only titles sharing an LSH band are compared (see title_index.py);
+    # first catch up on titles other processes committed (one id > max_id query)
+    title_index = get_title_index(db)
+    title_index.sync(db)
+    candidate_ids = title_index.candidates(title)
 
-        similarity = title_similarity(title, existing_title)
+    if candidate_ids:
+        candidates = (
+            db.query(NewsItem.id, NewsItem.title)
+            .filter(NewsItem.id.in_(candidate_ids))
+            .order_by(NewsItem.id)
+            .all()
+        )
 
-        # Strict threshold (prevents over-dedup)
-        if similarity >= 0.90:
-            return True, item_id
+        for item_id, existing_title in candidates:
+            if existing_title and is_similar_title(title, existing_title):
+                return True, item_id
 
     # -------------------------
     # Not a duplicate
@@ -0,0 +1,222 @@
+# backend/app/services/embed_batcher.py
+
+"""
+In-process micro-batcher in front of EmbedderService.
+
+Single texts (query embeddings from the API, per-item callers) used to
+cost one forward pass each. Requests now go through one queue:
+
+    submit(text) ─┐
+    submit(text) ─┼→ queue → batcher thread: collect → one encode → fan out
+    submit(text) ─┘
+
+The batcher thread takes the first waiting request, then keeps
+collecting until EMBEDDING_BATCH_SIZE texts or EMBEDDING_BATCH_WINDOW_MS
+after that request arrived, whichever comes first, and encodes them in
+one call. Requests that queued up while the previous batch was encoding
+are usually past their window already, so under load batches fill
+without extra waiting; a request waits at most the window, the batch in
+progress and its own batch (bounded p99).
+
+Sync callers block on the returned Future, async callers await it
+(embed_async) — the event loop is never blocked by the model.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_STOP = object()
+
+
+class _Request:
+    __slots__ = ("text", "future", "enqueued")
+
+    def __init__(self, text: str):
+        self.text = text
+        self.future: Future = Future()
+        self.enqueued = time.perf_counter()
+
+
+class MicroBatcher:
+
+    def __init__(
+        self,
+        encode: Callable[[List[str]], np.ndarray],
+        max_batch: int,
+        window_ms: float,
+        name: str = "embed-batcher",
+    ):
+        self.encode = encode
+        self.max_batch = max(1, max_batch)
+        self.window = max(0.0, window_ms) / 1000
+        self.name = name
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+        self.batches = 0
+        self.items = 0
+        self.largest = 0
+        self._latencies: deque = deque(maxlen=4096)  # seconds, submit → result
+
+    # -------------------------
+    # Callers
+    # -------------------------
+    def submit(self, text: str) -> Future:
+        """
+        Future of the text's embedding (one float32 row).
+        """
+        self._start()
+        request = _Request(text)
+        self._queue.put(request)
+        return request.future
+
+    def embed(self, text: str) -> np.ndarray:
+        return self.submit(text).result()
+
+    async def embed_async(self, text: str) -> np.ndarray:
+        return await asyncio.wrap_future(self.submit(text))
+
+    async def embed_many_async(self, texts: List[str]) -> np.ndarray:
+        futures = [asyncio.wrap_future(self.submit(text)) for text in texts]
+        return np.stack(await asyncio.gather(*futures))
+
+    # -------------------------
+    # Batcher thread
+    # -------------------------
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+                thread.start()
+                self._thread = thread
+
+    def close(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+
+    def _collect(self) -> Optional[List[_Request]]:
+        """
+        Next batch (None once closed). Cancelled requests are dropped.
+        """
+        first = self._queue.get()
+        if first is _STOP:
+            return None
+
+        batch = [first]
+        deadline = first.enqueued + self.window
+        while len(batch) < self.max_batch:
+            try:
+                request = self._queue.get_nowait()
+            except queue.Empty:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+            if request is _STOP:
+                self._queue.put(_STOP)  # finish this batch first
+                break
+            batch.append(request)
+
+        return [r for r in batch if r.future.set_running_or_notify_cancel()]
+
+    def _run(self) -> None:
+        while True:
+            batch = self._collect()
+            if batch is None:
+                return
+            if not batch:
+                continue
+
+            # Identical texts in one batch are encoded once
+            unique = list(dict.fromkeys(r.text for r in batch))
+            try:
+                matrix = self.encode(unique)
+            except Exception as e:
+                logger.exception(f"Embedding batch of {len(unique)} failed")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            row_of = dict(zip(unique, matrix))
+            done = time.perf_counter()
+            for request in batch:
+                request.future.set_result(row_of[request.text])
+                self._latencies.append(done - request.enqueued)
+
+            self.batches += 1
+            self.items += len(batch)
+            self.largest = max(self.largest, len(batch))
+
+    def stats(self) -> Dict:
+        latencies = np.array(self._latencies) * 1000
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch": round(self.items / self.batches, 2) if self.batches else 0.0,
+            "largest_batch": self.largest,
+            "queued": self._queue.qsize(),
+            "max_batch": self.max_batch,
+            "window_ms": self.window * 1000,
+            "latency_p50_ms": round(float(np.percentile(latencies, 50)), 2) if len(latencies) else None,
+            "latency_p99_ms": round(float(np.percentile(latencies, 99)), 2) if len(latencies) else None,
+        }
+
+
+_batcher: Optional[MicroBatcher] = None
+_batcher_lock = threading.Lock()
+
+
+def get_embedding_batcher() -> MicroBatcher:
+    """
+    Process-wide batcher over EmbedderService (thread started on first use).
+    """
+    global _batcher
+
+    if _batcher is None:
+        with _batcher_lock:
+            if _batcher is None:
+                # Imported here: the model libraries load with the first request
+                from app.services.embedder import EmbedderService
+
+                _batcher = MicroBatcher(
+                    lambda texts: EmbedderService.generate_batch_matrix(texts, batch_size=len(texts)),
+                    max_batch=settings.EMBEDDING_BATCH_SIZE,
+                    window_ms=settings.EMBEDDING_BATCH_WINDOW_MS,
+                )
+    return _batcher
+
+
+def embedding_batcher_stats() -> Optional[Dict]:
+    # None until something has been embedded through the batcher
+    return _batcher.stats() if _batcher is not None else None
+
+
+def shutdown_embedding_batcher() -> None:
+    global _batcher
+
+    if _batcher is not None:
+        _batcher.close()
+        _batcher = None
@@ -10,11 +10,68 @@ Used for:
 
 Model: all-MiniLM-L6-v2
 Fast, accurate & industry-standard for semantic similarity tasks.
+
+Inference backend (EMBEDDER_BACKEND), for CPU-only workers:
+- torch       PyTorch fp32 (reference)
+- torch-int8  PyTorch with Linear layers dynamically quantized to int8
+- onnx        ONNX Runtime (needs `sentence-transformers[onnx]`)
+
+EMBEDDER_THREADS pins intra-op threads (0 = library default).
+Single-text requests are micro-batched (see embed_batcher.py).
+See benchmarks/bench_embedder_backends.py for speed / agreement.
 """
 
+import time
 from typing import List
+
 import numpy as np
-from sentence_transformers import SentenceTransformer, util
+import torch
+from sentence_transformers import SentenceTransformer
+
+from app.config import get_settings
+from app.services.embed_batcher import get_embedding_batcher
+from app.utils import similarity as sim
+
+settings = get_settings()
+
+MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+BACKENDS = ("torch", "torch-int8", "onnx")
+
+WARMUP_TEXTS = [
+    "Warmup headline for the embedding model",
+    "A second, somewhat longer warmup sentence so the first batch has mixed lengths",
+]
+
+
+def load_backend(backend: str, threads: int = 0) -> SentenceTransformer:
+    """
+    all-MiniLM-L6-v2 on the given inference backend.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown EMBEDDER_BACKEND {backend!r} (expected one of {BACKENDS})")
+
+    if backend == "onnx":
+        import onnxruntime as ort
+
+        options = ort.SessionOptions()
+        if threads > 0:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        return SentenceTransformer(
+            MODEL_NAME,
+            backend="onnx",
+            model_kwargs={"provider": "CPUExecutionProvider", "session_options": options},
+        )
+
+    if threads > 0:
+        torch.set_num_threads(threads)
+
+    if backend == "torch-int8":
+        # Dynamic quantization is CPU-only
+        model = SentenceTransformer(MODEL_NAME, device="cpu")
+        return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+    return SentenceTransformer(MODEL_NAME)
 
 
 class EmbedderService:
@@ -28,44 +85,95 @@ class EmbedderService:
     @classmethod
     def load_model(cls):
         if cls._model is None:
-            print("🔤 Loading embedding model: all-MiniLM-L6-v2 ...")
-            cls._model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-            print("✅ Embedding model loaded.")
+            backend = settings.EMBEDDER_BACKEND
+            print(f"🔤 Loading embedding model: all-MiniLM-L6-v2 ({backend}) ...")
+            started = time.monotonic()
+            cls._model = load_backend(backend, settings.EMBEDDER_THREADS)
+            print(f"✅ Embedding model loaded in {time.monotonic() - started:.1f}s.")
         return cls._model
 
+    @classmethod
+    def model_id(cls) -> str:
+        """
+        Identifies the vectors this service produces (embedding cache key):
+        quantized backends don't reproduce fp32 vectors bit for bit.
+        """
+        backend = settings.EMBEDDER_BACKEND
+        return MODEL_NAME if backend == "torch" else f"{MODEL_NAME}@{backend}"
+
+    @classmethod
+    def warmup(cls) -> None:
+        """
+        Load the model and run one small batch, so the first real
+        request doesn't pay for lazy allocator / kernel / graph setup.
+        """
+        model = cls.load_model()
+        started = time.monotonic()
+        model.encode(WARMUP_TEXTS, convert_to_numpy=True, normalize_embeddings=True)
+        print(f"🔥 Embedding model warmed up in {time.monotonic() - started:.2f}s.")
+
     # ------------------------------------------------------
     # Generate embeddings for text
     # ------------------------------------------------------
+    # Single texts go through the micro-batcher (embed_batcher.py), so
+    # concurrent callers share one forward pass.
     @classmethod
     def generate_embedding(cls, text: str) -> List[float]:
         if not text:
             return [0.0] * 384  # MiniLM output dim is 384
 
-        model = cls.load_model()
-        embedding = model.encode(text, convert_to_numpy=True, normalize_embeddings=True)
-        return embedding.tolist()
+        return get_embedding_batcher().embed(text).tolist()
+
+    @classmethod
+    async def embed_async(cls, text: str) -> np.ndarray:
+        """
+        (384,) float32 unit vector, encoded off the event loop.
+        """
+        if not text:
+            return np.zeros(384, dtype=np.float32)
+
+        return await get_embedding_batcher().embed_async(text)
 
     # ------------------------------------------------------
     # Compute cosine similarity between two embeddings
     # ------------------------------------------------------
     @staticmethod
     def similarity(vec1: List[float], vec2: List[float]) -> float:
-        if not vec1 or not vec2:
+        if vec1 is None or vec2 is None or not len(vec1) or not len(vec2):
             return 0.0
 
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
-        sim = float(util.cos_sim(v1, v2)[0][0])
-        return sim
+        v1, v2 = sim.normalize_rows([vec1, vec2])
+        return float(v1 @ v2)
+
+    # ------------------------------------------------------
+    # Batch similarity (unit float32 rows, see utils/similarity.py)
+    # ------------------------------------------------------
+    normalize = staticmethod(sim.normalize_rows)
+    similarities = staticmethod(sim.cosine_scores)         # query vs matrix → (n,)
+    similarity_matrix = staticmethod(sim.cosine_matrix)    # matrix vs matrix → (m, n)
+    top_k = staticmethod(sim.top_k)                        # best k rows per query
 
     # ------------------------------------------------------
     # Batch embedding helper
     # ------------------------------------------------------
     @classmethod
-    def generate_batch_embeddings(cls, texts: List[str]) -> List[List[float]]:
+    def generate_batch_embeddings(cls, texts: List[str], batch_size: int = 64) -> List[List[float]]:
+        return cls.generate_batch_matrix(texts, batch_size=batch_size).tolist()
+
+    @classmethod
+    def generate_batch_matrix(cls, texts: List[str], batch_size: int = 64) -> np.ndarray:
+        """
+        (len(texts), 384) float32, L2-normalized — one row per text,
+        ready for a dot-product search (see vector_index.py).
+        """
+        if not texts:
+            return np.empty((0, 384), dtype=np.float32)
+
         model = cls.load_model()
-        embeddings = model.encode(texts, convert_to_numpy=True, normalize_embeddings=True)
-        return embeddings.tolist()
+        embeddings = model.encode(
+            texts, batch_size=batch_size, convert_to_numpy=True, normalize_embeddings=True
+        )
+        return np.ascontiguousarray(embeddings, dtype=np.float32)
 
 
 # Create a global shared instance
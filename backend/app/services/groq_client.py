@@ -0,0 +1,166 @@
+# backend/app/services/groq_client.py
+
+"""
+Process-wide Groq clients with pooled keep-alive connections.
+
+summarizer._call_groq used to build a new Groq client per call: a new
+connection pool, TCP connect and TLS handshake for every summary and
+every caption (two per item). Clients now come from one GroqPool:
+
+    sync   one Groq client over one httpx.Client, shared by all threads
+    async  one AsyncGroq client per event loop (an httpx.AsyncClient is
+           bound to the loop that first uses it)
+
+Connections are kept alive for GROQ_KEEPALIVE_SECONDS and capped at
+GROQ_MAX_CONNECTIONS per client. GROQ_BASE_URL points the clients at
+another server (a local mock in tests / benchmarks).
+"""
+
+import asyncio
+import os
+import threading
+import weakref
+from typing import Dict, Optional
+
+import httpx
+from groq import AsyncGroq, Groq
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class GroqPool:
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        max_connections: int = 16,
+        keepalive_seconds: float = 60.0,
+        timeout: float = 30.0,
+        connect_timeout: float = 5.0,
+        max_retries: int = 2,
+    ):
+        self.api_key = api_key
+        self.base_url = base_url or None  # None → SDK default (or its GROQ_BASE_URL)
+        self.max_connections = max_connections
+        self.keepalive_seconds = keepalive_seconds
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.max_retries = max_retries
+
+        self._client: Optional[Groq] = None
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGroq]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=self.keepalive_seconds,
+        )
+
+    @property
+    def client(self) -> Groq:
+        """
+        Shared blocking client (thread-safe, built on first use).
+        """
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = Groq(
+                        api_key=self.api_key,
+                        base_url=self.base_url,
+                        max_retries=self.max_retries,
+                        timeout=self.timeout,
+                        http_client=httpx.Client(timeout=self.timeout, limits=self._limits()),
+                    )
+        return self._client
+
+    def async_client(self) -> AsyncGroq:
+        """
+        Client for the running event loop (built on first use in it).
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = AsyncGroq(
+                    api_key=self.api_key,
+                    base_url=self.base_url,
+                    max_retries=self.max_retries,
+                    timeout=self.timeout,
+                    http_client=httpx.AsyncClient(timeout=self.timeout, limits=self._limits()),
+                )
+                self._async_clients[loop] = client
+        return client
+
+    def close(self) -> None:
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the sync client and the running loop's async client.
+        """
+        self.close()
+        with self._lock:
+            client = self._async_clients.pop(asyncio.get_running_loop(), None)
+        if client is not None:
+            await client.close()
+
+    def stats(self) -> Dict:
+        return {
+            "base_url": str(self.client.base_url) if self._client is not None else self.base_url,
+            "max_connections": self.max_connections,
+            "keepalive_seconds": self.keepalive_seconds,
+            "sync_client": self._client is not None,
+            "async_clients": len(self._async_clients),
+        }
+
+
+_pool: Optional[GroqPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_groq_pool() -> GroqPool:
+    """
+    Process-wide pool configured from settings.
+    """
+    global _pool
+
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                api_key = os.getenv("GROQ_API_KEY")
+                if not api_key:
+                    raise RuntimeError(
+                        "GROQ_API_KEY is not set. Please define it in .env or environment variables."
+                    )
+                _pool = GroqPool(
+                    api_key=api_key,
+                    base_url=settings.GROQ_BASE_URL,
+                    max_connections=settings.GROQ_MAX_CONNECTIONS,
+                    keepalive_seconds=settings.GROQ_KEEPALIVE_SECONDS,
+                    timeout=settings.GROQ_TIMEOUT_SECONDS,
+                    connect_timeout=settings.GROQ_CONNECT_TIMEOUT_SECONDS,
+                    max_retries=settings.GROQ_MAX_RETRIES,
+                )
+    return _pool
+
+
+def groq_pool_stats() -> Optional[Dict]:
+    # None until the first Groq call in this process
+    return _pool.stats() if _pool is not None else None
+
+
+async def shutdown_groq_pool() -> None:
+    global _pool
+
+    if _pool is not None:
+        await _pool.aclose()
+        _pool = None
@@ -0,0 +1,357 @@
+# backend/app/services/ingestion/articles.py
+
+"""
+Optional full-article extraction stage.
+
+Feed entries only carry a teaser, so with ARTICLE_EXTRACTION enabled
+every newly inserted item is handed to a background extractor which
+
+    downloads the linked page → extracts the main text (lxml) → caches it
+
+and replaces NewsItem.content when the extracted text is longer. When
+the cycle summarizes, enriched items are summarized again from the full
+text (the inline summary only saw the teaser). Embeddings are of titles
+only, so they don't change.
+
+- Runs on its own thread and event loop: the feed cycle only enqueues.
+- Bounded by ARTICLE_MAX_CONCURRENCY overall and
+  ARTICLE_PER_HOST_CONCURRENCY per host.
+- Final outcomes (ok / empty / failed with a 4xx or a non-HTML page) are
+  cached in article_cache by URL, and URLs already queued are dropped, so
+  no page is downloaded twice. Transient failures (timeouts, connection
+  errors, 429 / 5xx) are not cached and are retried next time the URL
+  is submitted.
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urlparse
+
+import httpx
+from lxml import etree
+from lxml import html as lxml_html
+
+from sqlalchemy.exc import IntegrityError
+
+from app.config import get_settings
+from app.models.db import SessionLocal
+from app.models.orm_models import ArticleCache, NewsItem
+from app.services.summarizer import generate_summary_async
+from app.utils.http_client import build_async_client
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+# ---------------------------------------------------------
+# Main-text extraction
+# ---------------------------------------------------------
+
+# Never part of the article body
+_BOILERPLATE_TAGS = (
+    "script", "style", "noscript", "iframe", "svg", "form", "button",
+    "nav", "header", "footer", "aside", "figure", "template",
+)
+
+_BLOCK_TAGS = {"p", "h1", "h2", "h3", "h4", "li", "blockquote", "pre"}
+
+
+def _text_of(el) -> str:
+    return " ".join(el.text_content().split())
+
+
+def _best_container(root):
+    """
+    Element whose direct <p> children hold the most text
+    (a cut-down readability score).
+    """
+    scores: Dict = {}
+    for p in root.iter("p"):
+        parent = p.getparent()
+        if parent is None:
+            continue
+        length = len(_text_of(p))
+        if length < 25:
+            continue
+        scores[parent] = scores.get(parent, 0) + length
+
+    if not scores:
+        return None
+    return max(scores, key=scores.get)
+
+
+def extract_main_text(page: bytes) -> str:
+    """
+    Main article text of an HTML page ("" if nothing usable).
+    Prefers <article>, then the densest <p> container, then <body>.
+    """
+    if not page:
+        return ""
+
+    try:
+        root = lxml_html.fromstring(page)
+    except (etree.ParserError, ValueError):
+        return ""
+
+    etree.strip_elements(root, etree.Comment, *_BOILERPLATE_TAGS, with_tail=False)
+
+    articles = root.findall(".//article")
+    container = max(articles, key=lambda el: len(_text_of(el))) if articles else None
+    if container is None:
+        container = _best_container(root)
+    if container is None:
+        body = root.find(".//body")
+        return _text_of(body if body is not None else root)
+
+    blocks = [_text_of(el) for el in container.iter() if el.tag in _BLOCK_TAGS]
+    blocks = [b for b in blocks if b]
+    return "\n\n".join(blocks) if blocks else _text_of(container)
+
+
+# ---------------------------------------------------------
+# Download
+# ---------------------------------------------------------
+
+async def _download(client: httpx.AsyncClient, url: str) -> bytes:
+    """
+    GET an HTML page, reading at most ARTICLE_MAX_BYTES.
+    """
+    async with client.stream("GET", url) as response:
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "text/html")
+        if "html" not in content_type:
+            raise ValueError(f"not an HTML page ({content_type})")
+
+        chunks: List[bytes] = []
+        size = 0
+        async for chunk in response.aiter_bytes():
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= settings.ARTICLE_MAX_BYTES:
+                break
+
+    return b"".join(chunks)
+
+
+def _is_transient(error: Exception) -> bool:
+    # Worth retrying later: network trouble, rate limits, server errors
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+async def _extract_one(
+    client: httpx.AsyncClient,
+    url: str,
+    global_limit: asyncio.Semaphore,
+    host_limits: Dict[str, asyncio.Semaphore],
+) -> Dict:
+    host = urlparse(url).netloc.lower()
+    if host not in host_limits:
+        host_limits[host] = asyncio.Semaphore(settings.ARTICLE_PER_HOST_CONCURRENCY)
+
+    result = {"url": url, "status": "failed", "text": None, "error": None, "transient": False}
+
+    # Per-host slot first, so a slow host never holds global slots while waiting
+    async with host_limits[host]:
+        async with global_limit:
+            try:
+                page = await asyncio.wait_for(
+                    _download(client, url),
+                    settings.ARTICLE_TIMEOUT_SECONDS,
+                )
+            except asyncio.TimeoutError:
+                result["error"] = f"timed out after {settings.ARTICLE_TIMEOUT_SECONDS:.0f}s"
+                result["transient"] = True
+                return result
+            except Exception as e:
+                result["error"] = (str(e) or e.__class__.__name__)[:500]
+                result["transient"] = _is_transient(e)
+                return result
+
+    text = extract_main_text(page)
+    if len(text) >= settings.ARTICLE_MIN_CHARS:
+        result["status"] = "ok"
+        result["text"] = text
+    else:
+        result["status"] = "empty"
+
+    return result
+
+
+async def extract_articles_async(urls: List[str]) -> List[Dict]:
+    """
+    Download + extract `urls` concurrently over one shared client.
+    Returns one {"url", "status", "text", "error", "transient"} dict per URL.
+    """
+    global_limit = asyncio.Semaphore(settings.ARTICLE_MAX_CONCURRENCY)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async with build_async_client(
+        max_connections=settings.ARTICLE_MAX_CONCURRENCY,
+        timeout=settings.ARTICLE_TIMEOUT_SECONDS,
+    ) as client:
+        return await asyncio.gather(*(
+            _extract_one(client, url, global_limit, host_limits)
+            for url in urls
+        ))
+
+
+# ---------------------------------------------------------
+# Background extractor
+# ---------------------------------------------------------
+
+class ArticleExtractor:
+    """
+    Single background thread draining a queue of (news_item_id, url) batches.
+    submit() never blocks; batches are processed one at a time.
+    """
+
+    def __init__(self, session_factory=SessionLocal):
+        self.session_factory = session_factory
+        self._queue: "queue.Queue[Tuple[List[Tuple[int, str]], bool]]" = queue.Queue()
+        self._pending: Set[str] = set()  # queued or in flight
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(self, items: Iterable[Tuple[int, str]], summarize: bool = False) -> int:
+        """
+        Queue new items for extraction. Returns how many were accepted.
+        summarize: re-summarize items whose content gets replaced.
+        """
+        batch: List[Tuple[int, str]] = []
+        with self._lock:
+            for item_id, url in items:
+                if not url or url in self._pending:
+                    continue
+                self._pending.add(url)
+                batch.append((item_id, url))
+
+            if batch and (self._thread is None or not self._thread.is_alive()):
+                self._thread = threading.Thread(
+                    target=self._run, name="article-extractor", daemon=True,
+                )
+                self._thread.start()
+
+        if batch:
+            self._queue.put((batch, summarize))
+        return len(batch)
+
+    def _run(self) -> None:
+        while True:
+            batch, summarize = self._queue.get()
+            try:
+                self._process(batch, summarize)
+            except Exception as e:
+                logger.exception("Article extraction batch failed", exc_info=e)
+            finally:
+                with self._lock:
+                    self._pending.difference_update(url for _, url in batch)
+                self._queue.task_done()
+
+    def _process(self, batch: List[Tuple[int, str]], summarize: bool = False) -> None:
+        started = time.monotonic()
+        urls = list(dict.fromkeys(url for _, url in batch))
+
+        db = self.session_factory()
+        try:
+            cached = {
+                row.url: (row.status, row.text)
+                for row in db.query(ArticleCache).filter(ArticleCache.url.in_(urls))
+            }
+
+            to_fetch = [url for url in urls if url not in cached]
+            if to_fetch:
+                for result in asyncio.run(extract_articles_async(to_fetch)):
+                    cached[result["url"]] = (result["status"], result["text"])
+                    if not result["transient"]:
+                        self._cache(db, result)
+
+            texts = {url: text for url, (status, text) in cached.items() if status == "ok"}
+            enriched: List[NewsItem] = []
+            if texts:
+                ids = [item_id for item_id, url in batch if url in texts]
+                for news in db.query(NewsItem).filter(NewsItem.id.in_(ids)):
+                    text = texts.get(news.url)
+                    if text and len(text) > len(news.content or ""):
+                        news.content = text
+                        enriched.append(news)
+
+            db.commit()
+
+            # The inline summary only saw the teaser
+            if summarize and enriched:
+                self._resummarize(db, enriched)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        logger.info(
+            f"Articles: {len(urls)} url(s), {len(to_fetch)} fetched, "
+            f"{len(enriched)} item(s) enriched in {time.monotonic() - started:.1f}s"
+        )
+
+    @staticmethod
+    def _cache(db, result: Dict) -> None:
+        """
+        Insert one cache row in a savepoint: if another worker cached the
+        URL first, only this row is dropped, not the batch's updates.
+        """
+        try:
+            with db.begin_nested():
+                db.add(ArticleCache(
+                    url=result["url"],
+                    status=result["status"],
+                    text=result["text"],
+                    error=result["error"],
+                ))
+        except IntegrityError:
+            pass
+
+    @staticmethod
+    def _resummarize(db, items: List[NewsItem]) -> None:
+        async def summarize_all() -> List[Optional[str]]:
+            limit = asyncio.Semaphore(settings.ARTICLE_MAX_CONCURRENCY)
+
+            async def one(news: NewsItem) -> Optional[str]:
+                async with limit:
+                    try:
+                        return await generate_summary_async(f"{news.title}\n\n{news.content}")
+                    except Exception as e:
+                        logger.warning(f"Re-summarizing item {news.id} failed: {e}")
+                        return None
+
+            return await asyncio.gather(*(one(news) for news in items))
+
+        for news, summary in zip(items, asyncio.run(summarize_all())):
+            if summary:
+                news.summary = summary
+        db.commit()
+
+    def join(self) -> None:
+        """
+        Block until every submitted batch is processed (scripts / tests).
+        """
+        self._queue.join()
+
+
+_extractor: Optional[ArticleExtractor] = None
+
+
+def get_article_extractor() -> ArticleExtractor:
+    """
+    Process-wide extractor, shared by every ingestion cycle.
+    """
+    global _extractor
+
+    if _extractor is None:
+        _extractor = ArticleExtractor()
+    return _extractor
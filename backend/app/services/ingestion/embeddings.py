@@ -0,0 +1,150 @@
+# backend/app/services/ingestion/embeddings.py
+
+"""
+Batched embedding stage with a persistent cache.
+
+Each chunk's kept items are embedded in one call
+
+    texts → normalize → cache lookup (one query) → encode misses in
+    batches of EMBEDDING_BATCH_SIZE → cache the new vectors
+
+The cache key is a hash of (model name, normalized text), so a replayed,
+re-ingested or edited-then-reverted item never reaches the model twice,
+and changing the model never serves stale vectors.
+
+Cache rows are written in their own short transaction: a concurrent
+process caching the same text can't fail the ingestion commit.
+Throughput (items/sec overall and for the model alone) is reported per
+ingestion cycle (report()).
+"""
+
+import hashlib
+import logging
+import time
+import unicodedata
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.db import SessionLocal
+from app.models.orm_models import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def normalize_text(text: Optional[str]) -> str:
+    return " ".join(unicodedata.normalize("NFC", text or "").split())
+
+
+def embedding_key(model: str, text: str) -> str:
+    """
+    Cache key of an already normalized text.
+    """
+    return hashlib.blake2b(f"{model}\n{text}".encode("utf-8"), digest_size=16).hexdigest()
+
+
+class EmbeddingStage:
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        batch_size: Optional[int] = None,
+    ):
+        # Imported here: the model is only loaded when the stage is used
+        from app.services.embedder import EmbedderService
+
+        self.encoder = EmbedderService
+        self.model = EmbedderService.model_id()
+        self.session_factory = session_factory
+        self.batch_size = batch_size or settings.EMBEDDING_BATCH_SIZE
+
+        self.items = 0
+        self.cache_hits = 0
+        self.encoded = 0
+        self.seconds = 0.0
+        self.encode_seconds = 0.0
+
+    def embed(self, texts: List[str]) -> np.ndarray:
+        """
+        (len(texts), dim) float32 unit vectors, one row per text.
+        """
+        started = time.perf_counter()
+        texts = [normalize_text(t) for t in texts]
+        keys = [embedding_key(self.model, t) for t in texts]
+
+        vectors: Dict[str, np.ndarray] = {}
+        unique = list(dict.fromkeys(keys))
+        missing: List[str] = []
+
+        db = self.session_factory()
+        try:
+            if unique:
+                for key, vector in db.query(EmbeddingCache.key, EmbeddingCache.vector).filter(
+                    EmbeddingCache.key.in_(unique)
+                ):
+                    vectors[key] = vector
+
+            missing = [key for key in unique if key not in vectors]
+            if missing:
+                text_of = dict(zip(keys, texts))
+                encode_started = time.perf_counter()
+                matrix = self.encoder.generate_batch_matrix(
+                    [text_of[key] for key in missing], batch_size=self.batch_size
+                )
+                self.encode_seconds += time.perf_counter() - encode_started
+                self.encoded += len(missing)
+
+                vectors.update(zip(missing, matrix))
+                self._store(db, missing, matrix)
+        finally:
+            db.close()
+
+        self.items += len(texts)
+        self.cache_hits += len(texts) - len(missing)  # served without a forward pass
+        self.seconds += time.perf_counter() - started
+
+        if not keys:
+            return np.empty((0, settings.EMBEDDING_DIM), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    def _store(self, db: Session, keys: List[str], matrix: np.ndarray) -> None:
+        db.add_all(
+            EmbeddingCache(key=key, model=self.model, vector=vector)
+            for key, vector in zip(keys, matrix)
+        )
+        try:
+            db.commit()
+        except IntegrityError:
+            # Another process cached some of these first; theirs are identical
+            db.rollback()
+
+    def report(self) -> Dict:
+        report = {
+            "items": self.items,
+            "cache_hits": self.cache_hits,
+            "encoded": self.encoded,
+            "seconds": round(self.seconds, 3),
+            "items_per_sec": round(self.items / self.seconds, 1) if self.seconds else 0.0,
+            "encode_items_per_sec": round(self.encoded / self.encode_seconds, 1) if self.encode_seconds else 0.0,
+        }
+        if self.items:
+            logger.info(
+                f"Embeddings: {self.items} item(s), {self.cache_hits} cached, {self.encoded} encoded "
+                f"in {self.seconds:.2f}s → {report['items_per_sec']} items/s "
+                f"(model {report['encode_items_per_sec']} items/s)"
+            )
+        return report
+
+
+def warm_embedder() -> None:
+    """
+    Startup hook: load the model on the configured backend and run a
+    warmup batch before the first ingestion cycle.
+    """
+    from app.services.embedder import EmbedderService
+
+    EmbedderService.warmup()
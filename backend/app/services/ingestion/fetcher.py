@@ -1,12 +1,36 @@
 # backend/app/services/ingestion/fetcher.py
 
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional
+import asyncio
 import feedparser
-import requests
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
+from urllib.parse import urlparse
+
+import httpx
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.services.ingestion.items import FeedItem
+from app.services.ingestion.seed_data import get_seed_news
+from app.services.ingestion.snapshots import SnapshotStore
+from app.services.ingestion.source_state import (
+    apply_fetch_result,
+    apply_validators,
+    fresh_validators,
+    get_mark,
+    get_validators,
+    is_fetch_allowed,
+    load_source_rows,
+)
+from app.utils.http_client import build_async_client, build_sync_client
 
 logger = logging.getLogger(__name__)
+settings = get_settings()
 
 # -------------------------------------------------------------------
 # STEP 1 — Canonical list of 20 AI news sources
@@ -167,77 +191,547 @@ NEWS_SOURCES: List[Dict] = [
 ]
 
 # -------------------------------------------------------------------
-# STEP 2 — Fetch raw data (NO processing)
+# STEP 2 — Download raw bytes (NO parsing)
 # -------------------------------------------------------------------
+#
+# Each fetch returns a "fetch result" dict:
+#   {"source": <source>, "status": "ok" | "not_modified" | "failed",
+#    "body": bytes | None, "data": json | None, "error": str | None,
+#    "etag": str | None, "last_modified": str | None, "elapsed": seconds,
+#    "fetched_at": datetime | None, "mark": high-water mark | None}
+# Parsing happens afterwards, outside the event loop.
+
+def _new_result(source: Dict) -> Dict:
+    return {
+        "source": source,
+        "status": "ok",
+        "body": None,
+        "data": None,
+        "error": None,
+        "etag": None,
+        "last_modified": None,
+        "elapsed": 0.0,
+        "fetched_at": None,
+        "mark": None,
+    }
+
 
-def fetch_all_sources() -> List[Dict]:
+def _conditional_headers(validator: Optional[Dict]) -> Dict[str, str]:
     """
-    Fetch raw news items from all active sources.
-    Returns source-specific raw items (not normalized).
+    If-None-Match / If-Modified-Since from the last 200 response.
     """
+    headers: Dict[str, str] = {}
+    if not validator:
+        return headers
 
-    raw_items: List[Dict] = []
+    if validator.get("etag"):
+        headers["If-None-Match"] = validator["etag"]
+    if validator.get("last_modified"):
+        headers["If-Modified-Since"] = validator["last_modified"]
+    return headers
 
-    for source in NEWS_SOURCES:
-        if not source["active"]:
-            continue
 
-        logger.info(f"Fetching source: {source['name']}")
+def _host_of(source: Dict) -> str:
+    return urlparse(source["url"]).netloc or source["url"]
+
+
+def _needs_network(source: Dict) -> bool:
+    # MVP: youtube is mock metadata only
+    return source["type"] in ("rss", "api")
+
+
+def _store_response(result: Dict, response: httpx.Response) -> None:
+    if response.status_code == 304:
+        result["status"] = "not_modified"
+        return
+
+    response.raise_for_status()
+
+    result["etag"] = response.headers.get("ETag")
+    result["last_modified"] = response.headers.get("Last-Modified")
+
+    if result["source"]["type"] == "api":
+        result["data"] = response.json()
+    else:
+        result["body"] = response.content
+
+
+async def _fetch_source_async(
+    client: httpx.AsyncClient,
+    source: Dict,
+    global_limit: asyncio.Semaphore,
+    host_limits: Dict[str, asyncio.Semaphore],
+    timeout: float,
+    validator: Optional[Dict] = None,
+) -> Dict:
+    result = _new_result(source)
+
+    if not _needs_network(source):
+        return result
+
+    host = _host_of(source)
+    if host not in host_limits:
+        host_limits[host] = asyncio.Semaphore(settings.FETCH_PER_HOST_CONCURRENCY)
+
+    # Per-host slot first, so a busy host never holds global slots while waiting
+    async with host_limits[host]:
+        async with global_limit:
+            logger.info(f"Fetching source: {source['name']}")
+            started = time.monotonic()
+            try:
+                response = await asyncio.wait_for(
+                    client.get(source["url"], headers=_conditional_headers(validator)),
+                    timeout,
+                )
+                _store_response(result, response)
+            except asyncio.TimeoutError:
+                result["status"] = "failed"
+                result["error"] = f"timed out after {timeout:.0f}s"
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = str(e) or e.__class__.__name__
+            result["elapsed"] = time.monotonic() - started
+
+    return result
+
+
+async def fetch_sources_async(
+    sources: List[Dict],
+    validators: Optional[Dict[str, Dict]] = None,
+    on_result=None,
+) -> List[Dict]:
+    """
+    Download all sources concurrently over one shared AsyncClient.
+
+    - global limit: FETCH_MAX_CONCURRENCY requests in flight
+    - per-host limit: FETCH_PER_HOST_CONCURRENCY requests per host
+    - per-source timeout: FETCH_TIMEOUT_SECONDS (whole request)
+
+    Cycle time is bounded by the slowest source, not the sum.
+    validators: source_url -> {"etag", "last_modified"} for conditional GET.
+    on_result:  optional coroutine fn, called with each result as soon as
+                its source completes (results are then not collected).
+    """
+    validators = validators or {}
+    timeout = settings.FETCH_TIMEOUT_SECONDS
+    global_limit = asyncio.Semaphore(settings.FETCH_MAX_CONCURRENCY)
+    host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    async with build_async_client(
+        max_connections=settings.FETCH_MAX_CONCURRENCY,
+        timeout=timeout,
+    ) as client:
+
+        async def run(source: Dict) -> Optional[Dict]:
+            result = await _fetch_source_async(
+                client, source, global_limit, host_limits, timeout,
+                validators.get(source["url"]),
+            )
+            if on_result is None:
+                return result
+            await on_result(result)
+            return None
+
+        results = await asyncio.gather(*[run(source) for source in sources])
+
+    return [r for r in results if r is not None]
+
 
+_DONE = object()
+
+
+def _stream_async(
+    sources: List[Dict],
+    validators: Dict[str, Dict],
+) -> Iterator[Dict]:
+    """
+    Run the async engine on a background thread and yield results as
+    sources complete. The hand-over queue is bounded (FETCH_BUFFER_SIZE),
+    so at most that many fetched bodies wait for parsing at any time.
+    """
+    buffer: queue.Queue = queue.Queue(maxsize=settings.FETCH_BUFFER_SIZE)
+    stop = threading.Event()
+
+    def put(item) -> None:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.5)
+                return
+            except queue.Full:
+                continue
+
+    async def on_result(result: Dict) -> None:
+        await asyncio.to_thread(put, result)
+
+    def produce() -> None:
         try:
-            if source["type"] == "rss":
-                feed = feedparser.parse(
+            asyncio.run(fetch_sources_async(sources, validators, on_result))
+        except Exception as e:
+            put(e)
+        finally:
+            put(_DONE)
+
+    threading.Thread(target=produce, name="feed-fetcher", daemon=True).start()
+
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        # Consumer stopped early: unblock the producer, let it drain
+        stop.set()
+
+
+def fetch_sources_sync(
+    sources: List[Dict],
+    validators: Optional[Dict[str, Dict]] = None,
+) -> Iterator[Dict]:
+    """
+    Sequential fallback (FETCH_MODE=sync). Same result shape as async mode,
+    yielded one source at a time.
+    """
+    validators = validators or {}
+
+    with build_sync_client(timeout=settings.FETCH_TIMEOUT_SECONDS) as client:
+        for source in sources:
+            result = _new_result(source)
+
+            if not _needs_network(source):
+                yield result
+                continue
+
+            logger.info(f"Fetching source: {source['name']}")
+            started = time.monotonic()
+            try:
+                response = client.get(
                     source["url"],
-                    request_headers={
-                        "User-Agent": "Mozilla/5.0 (AI News Aggregator; +https://example.com)"
-                    }
+                    headers=_conditional_headers(validators.get(source["url"])),
                 )
+                _store_response(result, response)
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = str(e) or e.__class__.__name__
+            result["elapsed"] = time.monotonic() - started
 
-                if not feed.entries:
-                    logger.warning(f"No entries found for {source['name']}")
-                    continue
-
-                for entry in feed.entries:
-                    raw_items.append({
-                        "source_name": source["name"],
-                        "source_url": source["url"],
-                        "parser_key": source["parser_key"],
-                        "title": entry.get("title"),
-                        "url": entry.get("link"),
-                        "author": entry.get("author"),
-                        "published_at": entry.get("published"),
-                        "summary": entry.get("summary"),
-                        "raw": entry,
-                        "fetched_at": datetime.utcnow(),
-                    })
-
-            elif source["type"] == "api":
-                response = requests.get(source["url"], timeout=10)
-                response.raise_for_status()
-
-                data = response.json()
-                raw_items.append({
-                    "source_name": source["name"],
-                    "parser_key": source["parser_key"],
-                    "raw": data,
-                    "fetched_at": datetime.utcnow(),
-                })
-
-            elif source["type"] == "youtube":
-                # MVP: mock metadata only
-                raw_items.append({
-                    "source_name": source["name"],
-                    "parser_key": "youtube_mock",
-                    "title": "Sample AI YouTube Video",
-                    "url": "https://youtube.com",
-                    "summary": "Mock AI video metadata for MVP",
-                    "published_at": datetime.utcnow().isoformat(),
-                    "fetched_at": datetime.utcnow(),
-                })
+            yield result
 
-        except Exception as e:
-            logger.error(f"Failed to fetch {source['name']}: {e}")
+
+# -------------------------------------------------------------------
+# STEP 3 — Turn fetched bytes into raw items (NO processing)
+# -------------------------------------------------------------------
+
+def _entry_guid(entry) -> Optional[str]:
+    return entry.get("id") or entry.get("link")
+
+
+def _already_seen(entry, mark: Dict) -> bool:
+    """
+    Seen before if its id is among the source's recent ids. Feeds are not
+    always in date order (hot listings, backdated or edited posts), so an
+    unseen id is never dropped for its date; only entries without any id
+    fall back to "strictly older than the source's high-water mark".
+    """
+    guid = _entry_guid(entry)
+    if guid:
+        return guid in mark["guids"]
+
+    parsed = entry.get("published_parsed")
+    if parsed and mark["published_at"]:
+        return datetime(*parsed[:6]) < mark["published_at"]  # struct_time is UTC
+
+    return False
+
+
+def result_to_raw_items(result: Dict) -> List[FeedItem]:
+    """
+    Convert one fetch result into FeedItem records.
+    Only the entry fields the pipeline uses are copied out; the
+    feedparser entry itself is dropped here.
+    """
+    source = result["source"]
+
+    if result["status"] == "failed":
+        logger.error(f"Failed to fetch {source['name']}: {result['error']}")
+        return []
+
+    if result["status"] == "not_modified":
+        # 304 — nothing new, skip parsing entirely
+        logger.info(f"Unchanged since last fetch: {source['name']}")
+        return []
+
+    try:
+        if source["type"] == "rss":
+            feed = feedparser.parse(result["body"])
+
+            if not feed.entries:
+                logger.warning(f"No entries found for {source['name']}")
+                return []
+
+            entries = feed.entries
+            if result["mark"]:
+                entries = [e for e in entries if not _already_seen(e, result["mark"])]
+                skipped = len(feed.entries) - len(entries)
+                if skipped:
+                    logger.info(f"{source['name']}: skipped {skipped} already-ingested entries")
+
+            fetched_at = result["fetched_at"] or datetime.utcnow()
+            return [
+                FeedItem(
+                    source_name=source["name"],
+                    source_url=source["url"],
+                    parser_key=source["parser_key"],
+                    title=entry.get("title"),
+                    url=entry.get("link"),
+                    author=entry.get("author"),
+                    published_at=entry.get("published"),
+                    summary=entry.get("summary"),
+                    guid=_entry_guid(entry),
+                    fetched_at=fetched_at,
+                )
+                for entry in entries
+            ]
+
+        elif source["type"] == "api":
+            # No API parser registered yet — payload is not carried further
+            logger.warning(f"No parser for API source {source['name']}")
+            return []
+
+        elif source["type"] == "youtube":
+            # MVP: mock metadata only
+            return [FeedItem(
+                source_name=source["name"],
+                source_url=source["url"],
+                parser_key="youtube_mock",
+                title="Sample AI YouTube Video",
+                url="https://youtube.com",
+                summary="Mock AI video metadata for MVP",
+                published_at=datetime.utcnow().isoformat(),
+                fetched_at=datetime.utcnow(),
+            )]
+
+    except Exception as e:
+        logger.error(f"Failed to parse {source['name']}: {e}")
+
+    return []
+
+
+# fetch result status -> cycle stats counter
+_STATUS_COUNTERS = {
+    "ok": "fetched",
+    "not_modified": "unchanged",
+    "failed": "failed",
+}
+
+
+# Modes that never touch the network (and never update source state)
+OFFLINE_MODES = ("replay", "seed")
+
+
+def _stream_replay(sources: List[Dict]) -> Iterator[Dict]:
+    """
+    Fetch results rebuilt from captured snapshots, in capture order,
+    one per distinct body — at disk speed, no network.
+    """
+    store = SnapshotStore(settings.SNAPSHOT_DIR)
+
+    for source in sources:
+        for entry, body in store.iter_bodies(source["url"]):
+            result = _new_result(source)
+            result["body"] = body
+            result["fetched_at"] = datetime.fromisoformat(entry["captured_at"])
+            yield result
+
+
+def _iter_seed_raw_items(sources: List[Dict]) -> Iterator[FeedItem]:
+    """
+    Deterministic seed news shaped like fetcher raw items (MVP demo mode).
+    """
+    urls_by_name = {s["name"]: s["url"] for s in sources}
+
+    for item in get_seed_news():
+        source_url = urls_by_name.get(item["source_name"])
+        if not source_url:
             continue
 
-    logger.info(f"Fetched {len(raw_items)} raw items from sources")
-    return raw_items
\ No newline at end of file
+        yield FeedItem(
+            source_name=item["source_name"],
+            source_url=source_url,  # IMPORTANT: used for source_id mapping
+            parser_key="rss_generic",
+            title=item["title"],
+            url=item["url"],
+            author=item.get("author"),
+            published_at=item.get("published_at"),
+            summary=item.get("content"),
+            fetched_at=item.get("published_at"),
+        )
+
+
+def stream_fetch_results(
+    sources: List[Dict],
+    validators: Optional[Dict[str, Dict]] = None,
+    mode: Optional[str] = None,
+) -> Iterator[Dict]:
+    """
+    Yield fetch results as sources complete.
+    mode: "async" (concurrent, default), "sync" (sequential)
+          or "replay" (captured snapshots, no network).
+    """
+    mode = mode or settings.FETCH_MODE
+    validators = validators or {}
+
+    if mode == "replay":
+        return _stream_replay(sources)
+    if mode == "async":
+        return _stream_async(sources, validators)
+    return fetch_sources_sync(sources, validators)
+
+
+def iter_fetch_results(
+    db: Optional[Session] = None,
+    sources: Optional[List[Dict]] = None,
+    mode: Optional[str] = None,
+    stats: Optional[Dict] = None,
+) -> Iterator[Dict]:
+    """
+    Stream fetch results (raw bytes, not parsed) from all active sources
+    as downloads complete. Not used for seed mode (no bodies).
+
+    db:    when given, per-source state is read from / written to the
+           `sources` table: health is updated as results arrive (sources
+           with an open circuit breaker are skipped) and HTTP validators
+           are sent (conditional GET). Fresh validators are NOT stored:
+           the consumer stores them with source_state.apply_validators
+           once the feed's items are committed. Caller commits.
+    mode:  "async" (concurrent, default), "sync" (sequential) or
+           "replay" (captured snapshots). Offline modes never read or
+           write source state.
+    stats: optional dict, filled with per-cycle counters
+           (sources / fetched / unchanged / failed / backed_off)
+           once the stream is exhausted.
+
+    Must be consumed from synchronous code (async mode runs its own loop
+    on a background thread).
+    """
+    active = [s for s in (sources or NEWS_SOURCES) if s["active"]]
+    mode = mode or settings.FETCH_MODE
+
+    online = mode not in OFFLINE_MODES
+    rows = load_source_rows(db, active) if db is not None and online else {}
+    validators = get_validators(rows)
+
+    snapshots = SnapshotStore(settings.SNAPSHOT_DIR) if settings.SNAPSHOT_CAPTURE and online else None
+
+    # Circuit breaker: don't spend the cycle on sources that are down
+    allowed = [s for s in active if is_fetch_allowed(rows.get(s["url"]))]
+    backed_off = len(active) - len(allowed)
+    if backed_off:
+        logger.info(f"Skipping {backed_off} source(s) in backoff")
+
+    counts = {
+        "sources": 0, "fetched": 0, "unchanged": 0,
+        "failed": 0, "backed_off": backed_off,
+    }
+    slowest: Optional[Dict] = None
+
+    started = time.monotonic()
+    for result in stream_fetch_results(allowed, validators, mode):
+        counts["sources"] += 1
+        counts[_STATUS_COUNTERS[result["status"]]] += 1
+
+        if slowest is None or result["elapsed"] > slowest["elapsed"]:
+            slowest = {"name": result["source"]["name"], "elapsed": result["elapsed"]}
+
+        row = rows.get(result["source"]["url"])
+        if row is not None:
+            apply_fetch_result(row, result)
+            result["mark"] = get_mark(row)
+
+        if snapshots is not None and result["body"]:
+            try:
+                snapshots.write(result["source"]["url"], result["body"])
+            except OSError as e:
+                logger.error(f"Snapshot write failed for {result['source']['name']}: {e}")
+
+        yield result
+
+    elapsed = time.monotonic() - started
+
+    if stats is not None:
+        stats.update(counts)
+
+    if slowest:
+        logger.info(
+            f"Fetch ({mode}) took {elapsed:.1f}s — slowest: "
+            f"{slowest['name']} ({slowest['elapsed']:.1f}s)"
+        )
+
+    logger.info(
+        f"Fetched {counts['fetched']} feeds "
+        f"(unchanged={counts['unchanged']}, failed={counts['failed']})"
+    )
+
+
+def iter_raw_items(
+    db: Optional[Session] = None,
+    sources: Optional[List[Dict]] = None,
+    mode: Optional[str] = None,
+    stats: Optional[Dict] = None,
+) -> Iterator[FeedItem]:
+    """
+    Stream raw news items from all active sources, source by source,
+    as downloads complete. Only one feed's entries are held at a time.
+
+    Same arguments as iter_fetch_results; mode may also be "seed"
+    (demo seed data). stats additionally gets an "items" counter.
+    Fresh validators are stored once the stream is drained (caller
+    commits them with the items).
+    """
+    active = [s for s in (sources or NEWS_SOURCES) if s["active"]]
+    mode = mode or settings.FETCH_MODE
+    count = 0
+    validators: Dict[str, Dict] = {}
+
+    if mode == "seed":
+        for item in _iter_seed_raw_items(active):
+            count += 1
+            yield item
+        if stats is not None:
+            stats.update({"sources": 0, "items": count})
+        return
+
+    for result in iter_fetch_results(db, active, mode, stats):
+        fresh = fresh_validators(result)
+        if fresh is not None:
+            validators[result["source"]["url"]] = fresh
+
+        items = result_to_raw_items(result)
+        result["body"] = result["data"] = None  # release bytes before parsing downstream
+        count += len(items)
+
+        yield from items
+
+    if db is not None and mode not in OFFLINE_MODES:
+        apply_validators(db, validators)
+
+    if stats is not None:
+        stats["items"] = count
+    logger.info(f"Fetched {count} raw items from sources")
+
+
+def fetch_all_sources(
+    db: Optional[Session] = None,
+    sources: Optional[List[Dict]] = None,
+    mode: Optional[str] = None,
+    stats: Optional[Dict] = None,
+) -> List[FeedItem]:
+    """
+    Fetch raw news items from all active sources.
+    Returns source-specific raw items (not normalized).
+
+    List wrapper around iter_raw_items — prefer the stream for ingestion.
+    """
+    return list(iter_raw_items(db, sources=sources, mode=mode, stats=stats))
@@ -0,0 +1,37 @@
+# backend/app/services/ingestion/items.py
+
+"""
+Compact item record shared by every ingestion stage.
+
+fetcher → parsers → normalizer → pipeline all work on the SAME
+FeedItem instance, updating fields in place:
+- no per-stage dict copies
+- no feedparser `raw` entry carried along (only the fields we use
+  are copied out of it at fetch time)
+- __slots__: no per-instance __dict__
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional
+
+
+@dataclass(slots=True)
+class FeedItem:
+    # Where it came from
+    source_name: Optional[str] = None
+    source_url: Optional[str] = None  # used for source_id mapping
+    parser_key: Optional[str] = None
+
+    # Entry fields (raw after fetch, cleaned by parsers)
+    title: Optional[str] = None
+    url: Optional[str] = None
+    url_hash: Optional[str] = None  # canonical URL hash, set by normalize
+    author: Optional[str] = None
+    published_at: Any = None  # raw string / datetime → UTC datetime after normalize
+    summary: Optional[str] = None
+    description: Optional[str] = None
+    content: Optional[str] = None  # cleaned text after parse
+    guid: Optional[str] = None  # feed entry id (falls back to link)
+
+    fetched_at: Optional[datetime] = None
@@ -0,0 +1,139 @@
+# backend/app/services/ingestion/parse_pool.py
+
+"""
+Optional process-pool parse stage.
+
+feedparser and HTML stripping are pure Python and CPU bound, so large
+feeds (arXiv cs.AI / cs.LG) peg one core. With PARSE_WORKERS > 0,
+fetched bytes are shipped to worker processes which run
+
+    feedparser → parse_raw_items → normalize_items
+
+and send back compact, normalized FeedItems.
+
+- PARSE_WORKERS:    worker processes (0 = parse inline, the default)
+- PARSE_CHUNK_SIZE: fetched feeds per task (batch small feeds to cut IPC)
+
+At most PARSE_WORKERS * 2 tasks are in flight, so memory stays bounded.
+"""
+
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, Iterable, Iterator, List, Optional
+
+from app.config import get_settings
+from app.services.ingestion.fetcher import result_to_raw_items
+from app.services.ingestion.items import FeedItem
+from app.services.ingestion.parsers import iter_parsed_items
+from app.services.normalizer import iter_normalized_items
+from app.utils.iterables import chunked
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_executor: Optional[ProcessPoolExecutor] = None
+_executor_workers = 0
+
+
+def get_executor(workers: int) -> ProcessPoolExecutor:
+    """
+    Process-wide pool, reused across cycles (worker start-up is slow).
+    "spawn": the fetcher runs threads, and forking a threaded process is unsafe.
+    """
+    global _executor, _executor_workers
+
+    if _executor is None or _executor_workers != workers:
+        if _executor is not None:
+            _executor.shutdown(wait=False)
+        _executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        _executor_workers = workers
+        logger.info(f"Parse pool started with {workers} worker(s)")
+
+    return _executor
+
+
+def shutdown_executor() -> None:
+    global _executor
+
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
+
+
+# ---------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------
+def process_results(results: List[Dict]) -> List[FeedItem]:
+    """
+    Runs in a worker: parse + normalize a chunk of fetch results.
+    Also used inline when the pool is disabled.
+    """
+    items: List[FeedItem] = []
+    for result in results:
+        items.extend(iter_normalized_items(iter_parsed_items(result_to_raw_items(result))))
+    return items
+
+
+def _payload(result: Dict) -> Dict:
+    """
+    Only what a worker needs — keeps pickling cheap.
+    """
+    return {
+        "source": result["source"],
+        "status": result["status"],
+        "body": result["body"],
+        "data": result["data"],
+        "error": result["error"],
+        "fetched_at": result["fetched_at"],
+        "mark": result["mark"],
+    }
+
+
+# ---------------------------------------------------------
+# Parent side
+# ---------------------------------------------------------
+def iter_pool_items(
+    results: Iterable[Dict],
+    workers: Optional[int] = None,
+    chunk_size: Optional[int] = None,
+    stats: Optional[Dict] = None,
+) -> Iterator[FeedItem]:
+    """
+    Yield normalized FeedItems for a stream of fetch results,
+    parsing on the process pool. Order of feeds is preserved.
+    """
+    workers = workers if workers is not None else settings.PARSE_WORKERS
+    chunk_size = chunk_size or settings.PARSE_CHUNK_SIZE
+    count = 0
+
+    if workers <= 0:
+        for chunk in chunked(results, chunk_size):
+            items = process_results(chunk)
+            count += len(items)
+            yield from items
+    else:
+        executor = get_executor(workers)
+        pending: Deque[Future] = deque()
+
+        for chunk in chunked(results, chunk_size):
+            pending.append(executor.submit(process_results, [_payload(r) for r in chunk]))
+            for result in chunk:
+                result["body"] = result["data"] = None  # bytes now live in the task
+
+            while len(pending) >= workers * 2:
+                items = pending.popleft().result()
+                count += len(items)
+                yield from items
+
+        while pending:
+            items = pending.popleft().result()
+            count += len(items)
+            yield from items
+
+    if stats is not None:
+        stats["items"] = count
@@ -1,25 +1,36 @@
 # backend/app/services/ingestion/parsers.py
 
-from typing import Dict, List, Optional
-import re
-from bs4 import BeautifulSoup
+from functools import lru_cache
+from typing import Iterable, Iterator, List, Optional
+
+from app.services.ingestion.items import FeedItem
+from app.utils.html_text import html_to_text
+
+# Titles / short teasers repeat across feeds and cycles; long bodies rarely do
+MEMO_MAX_CHARS = 1024
 
 
 # ----------------------------------------------------
 # Utility
 # ----------------------------------------------------
 
+@lru_cache(maxsize=8192)
+def _strip_html_cached(text: str) -> str:
+    return html_to_text(text)
+
+
 def strip_html(text: Optional[str]) -> str:
     """
     Remove HTML tags, normalize whitespace.
     ALWAYS returns a string (never None).
+    Same output as BeautifulSoup(...).get_text(" ", strip=True), see utils/html_text.py.
     """
     if not text:
         return ""
 
-    soup = BeautifulSoup(text, "html.parser")
-    clean = soup.get_text(separator=" ", strip=True)
-    return re.sub(r"\s+", " ", clean).strip()
+    if len(text) <= MEMO_MAX_CHARS:
+        return _strip_html_cached(text)
+    return html_to_text(text)
 
 
 def safe_content(*candidates: Optional[str]) -> str:
@@ -37,84 +48,55 @@ def safe_content(*candidates: Optional[str]) -> str:
 # ----------------------------------------------------
 # Individual parsers
 # ----------------------------------------------------
+# Each parser cleans a FeedItem in place and returns it.
 
-def parse_rss_generic(item: Dict) -> Dict:
+def parse_rss_generic(item: FeedItem) -> FeedItem:
     """
     Generic RSS parser (blogs, tech media, research feeds).
     """
-    title = strip_html(item.get("title"))
-    content = safe_content(
-        item.get("summary"),
-        item.get("description"),
-        item.get("content"),
-        item.get("title"),
+    item.content = safe_content(
+        item.summary,
+        item.description,
+        item.content,
+        item.title,
     )
+    item.title = strip_html(item.title)
+    return item
 
-    return {
-        "title": title,
-        "author": item.get("author"),
-        "url": item.get("link") or item.get("url"),
-        "published_at": item.get("published") or item.get("published_at"),
-        "content": content,
-        "raw": item,
-    }
 
-
-def parse_arxiv(item: Dict) -> Dict:
+def parse_arxiv(item: FeedItem) -> FeedItem:
     """
     arXiv feeds have clean summaries but still need fallback.
     """
-    title = strip_html(item.get("title"))
-    content = safe_content(
-        item.get("summary"),
-        item.get("title"),
+    item.content = safe_content(
+        item.summary,
+        item.title,
     )
-
-    return {
-        "title": title,
-        "author": item.get("author"),
-        "url": item.get("link") or item.get("url"),
-        "published_at": item.get("published") or item.get("published_at"),
-        "content": content,
-        "raw": item,
-    }
+    item.title = strip_html(item.title)
+    return item
 
 
-def parse_reddit(item: Dict) -> Dict:
+def parse_reddit(item: FeedItem) -> FeedItem:
     """
     Reddit RSS often has HTML-heavy summaries.
     """
-    title = strip_html(item.get("title"))
-    content = safe_content(
-        item.get("summary"),
-        item.get("description"),
-        item.get("title"),
+    item.content = safe_content(
+        item.summary,
+        item.description,
+        item.title,
     )
-
-    return {
-        "title": title,
-        "author": item.get("author"),
-        "url": item.get("link") or item.get("url"),
-        "published_at": item.get("published") or item.get("published_at"),
-        "content": content,
-        "raw": item,
-    }
+    item.title = strip_html(item.title)
+    return item
 
 
-def parse_youtube_mock(item: Dict) -> Dict:
+def parse_youtube_mock(item: FeedItem) -> FeedItem:
     """
     MVP YouTube mock — metadata only.
     """
-    title = item.get("title") or "AI YouTube Video"
-
-    return {
-        "title": title,
-        "author": "YouTube",
-        "url": item.get("url"),
-        "published_at": item.get("published_at"),
-        "content": strip_html(item.get("summary") or title),
-        "raw": item,
-    }
+    item.title = item.title or "AI YouTube Video"
+    item.author = "YouTube"
+    item.content = strip_html(item.summary or item.title)
+    return item
 
 
 # ----------------------------------------------------
@@ -129,13 +111,13 @@ PARSER_MAP = {
 }
 
 
-def parse_raw_items(raw_items: List[Dict]) -> List[Dict]:
-
-    parsed_items: List[Dict] = []
-
+def iter_parsed_items(raw_items: Iterable[FeedItem]) -> Iterator[FeedItem]:
+    """
+    Streaming parse: cleans each item in place and yields it,
+    never materialising the whole batch.
+    """
     for item in raw_items:
-        parser_key = item.get("parser_key")
-        parser = PARSER_MAP.get(parser_key)
+        parser = PARSER_MAP.get(item.parser_key)
 
         if not parser:
             continue
@@ -143,14 +125,14 @@ def parse_raw_items(raw_items: List[Dict]) -> List[Dict]:
         parsed = parser(item)
 
         # FINAL SAFETY NET (never allow empty title or URL)
-        if not parsed.get("title") or not parsed.get("url"):
+        if not parsed.title or not parsed.url:
             continue
 
-        parsed_items.append({
-            **parsed,
-            "source_name": item.get("source_name"),
-            "source_url": item.get("source_url"),
-            "fetched_at": item.get("fetched_at"),
-        })
+        # Raw HTML inputs are folded into `content` — release them now
+        parsed.summary = parsed.description = None
+
+        yield parsed
+
 
-    return parsed_items
+def parse_raw_items(raw_items: List[FeedItem]) -> List[FeedItem]:
+    return list(iter_parsed_items(raw_items))
@@ -0,0 +1,360 @@
+# backend/app/services/ingestion/pipeline.py
+
+"""
+Streaming ingestion pipeline.
+
+fetch → parse → normalize → dedupe → (embed → semantic dedup → cluster) → (summarize) → insert
+
+Every stage is a generator, so items flow through one at a time and
+are committed in chunks of INGEST_CHUNK_SIZE. Peak memory is bounded by
+one fetched feed plus one chunk, not by source count or feed size.
+Parsing runs inline or on a process pool (see parse_pool.py).
+Inserted items can be handed to the background article extractor
+(see articles.py), which never holds up the cycle.
+"""
+
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem
+from app.services.clustering import StoryClusterer
+from app.services.deduper import (
+    BatchDeduper,
+    SemanticDeduper,
+    check_duplicate,
+    find_existing_urls,
+)
+from app.services.ingestion.articles import get_article_extractor
+from app.services.ingestion.embeddings import EmbeddingStage
+from app.services.ingestion.fetcher import (
+    NEWS_SOURCES,
+    OFFLINE_MODES,
+    iter_fetch_results,
+    iter_raw_items,
+)
+from app.services.ingestion.items import FeedItem
+from app.services.ingestion.parse_pool import iter_pool_items
+from app.services.ingestion.parsers import iter_parsed_items
+from app.services.ingestion.source_state import advance_marks, apply_validators, fresh_validators
+from app.services.normalizer import iter_normalized_items
+from app.services.search_index import loaded_search_index
+from app.services.summarizer import summarize_news_item
+from app.services.title_index import get_title_index
+from app.services.url_filter import get_url_filter
+from app.utils.iterables import chunked
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def iter_ingest_items(
+    db: Optional[Session] = None,
+    sources: Optional[List[Dict]] = None,
+    mode: Optional[str] = None,
+    stats: Optional[Dict] = None,
+) -> Iterator[FeedItem]:
+    """
+    Stream normalized items: fetch → parse → normalize.
+    Arguments as fetcher.iter_raw_items.
+    """
+    mode = mode or settings.FETCH_MODE
+
+    if mode == "seed":
+        raw_items = iter_raw_items(db, sources=sources, mode=mode, stats=stats)
+        return iter_normalized_items(iter_parsed_items(raw_items))
+
+    results = iter_fetch_results(db, sources=sources or NEWS_SOURCES, mode=mode, stats=stats)
+    if db is None or mode in OFFLINE_MODES:
+        return iter_pool_items(results, stats=stats)
+
+    validators: Dict[str, Dict] = {}
+    items = iter_pool_items(_hold_validators(results, validators), stats=stats)
+    return _track_marks(db, items, validators)
+
+
+def _hold_validators(results: Iterable[Dict], validators: Dict[str, Dict]) -> Iterator[Dict]:
+    """
+    Pass fetch results through, keeping fresh validators in `validators`
+    (stored by _track_marks, not before the items are).
+    """
+    for result in results:
+        fresh = fresh_validators(result)
+        if fresh is not None:
+            validators[result["source"]["url"]] = fresh
+        yield result
+
+
+def _track_marks(db: Session, items: Iterable[FeedItem], validators: Dict[str, Dict]) -> Iterator[FeedItem]:
+    """
+    Pass items through, remembering each source's newest entry and ids;
+    raise the sources' high-water marks and store their validators once
+    the stream is drained, so both land in the commit of the last chunk.
+    A cycle that dies earlier refetches those feeds in full.
+    """
+    marks: Dict[str, Dict] = {}
+
+    for item in items:
+        mark = marks.setdefault(item.source_url, {"published_at": None, "guids": []})
+        if item.published_at and (mark["published_at"] is None or item.published_at > mark["published_at"]):
+            mark["published_at"] = item.published_at
+        if item.guid:
+            mark["guids"].append(item.guid)
+
+        yield item
+
+    advance_marks(db, marks)
+    apply_validators(db, validators)
+
+
+def _ingest_item(
+    db: Session,
+    item: FeedItem,
+    source_map: Dict[str, int],
+    stats: Dict,
+    batch: BatchDeduper,
+    stored_urls: Set[str],
+    existing_urls: Dict[str, int],
+    copies: List[NewsItem],
+    semantic: Optional[SemanticDeduper],
+) -> Optional[NewsItem]:
+    """
+    Screen one item (source, in-batch, URL and title checks) and add
+    it unsummarized; copies of kept items are collected in `copies`.
+    """
+    source_url = item.source_url
+
+    if item.published_at:
+        stats["published"].setdefault(source_url, []).append(item.published_at)
+
+    # HARD GUARD (prevents NULL FK forever)
+    source_id = source_map.get(source_url)
+    if not source_id:
+        return None
+
+    # 1. Copy of a story already kept in this run (memory only)
+    url_key = item.url_hash or item.url
+    original = batch.match(item.title, url_key)
+    if original is not None:
+        if semantic is not None:
+            original = semantic.root(original)
+        stats["duplicates"] += 1
+        stats["batch_duplicates"] += 1
+        copy = _store_batch_duplicate(db, item, source_id, original, stored_urls, existing_urls)
+        if copy is not None:
+            copies.append(copy)
+        return None
+
+    is_dup, _ = check_duplicate(
+        db=db,
+        title=item.title,
+        url=item.url,
+        url_hash=item.url_hash,
+        existing_urls=existing_urls,
+    )
+    if is_dup:
+        stats["duplicates"] += 1
+        return None
+
+    news = NewsItem(
+        source_id=source_id,
+        title=item.title,
+        summary=item.content[:500] if item.content else None,
+        author=item.author,
+        url=item.url,
+        url_hash=item.url_hash,
+        published_at=item.published_at,
+        content=item.content,
+        is_duplicate=False,
+    )
+    db.add(news)
+    batch.add(item.title, url_key, news)
+    stored_urls.add(item.url)
+    stats["inserted"] += 1
+    return news
+
+
+def _store_batch_duplicate(
+    db: Session,
+    item: FeedItem,
+    source_id: int,
+    original: NewsItem,
+    stored_urls: Set[str],
+    existing_urls: Dict[str, int],
+) -> Optional[NewsItem]:
+    """
+    Keep the dropped copy, linked to the item it duplicates
+    (no summary call). Skipped when its URL is already stored.
+    """
+    if (
+        item.url in stored_urls
+        or existing_urls.get(item.url)
+        or existing_urls.get(item.url_hash)
+    ):
+        return None
+
+    copy = NewsItem(
+        source_id=source_id,
+        title=item.title,
+        summary=item.content[:500] if item.content else None,
+        author=item.author,
+        url=item.url,
+        url_hash=item.url_hash,
+        published_at=item.published_at,
+        content=item.content,
+        is_duplicate=True,
+        original=original,
+    )
+    db.add(copy)
+    stored_urls.add(item.url)
+    return copy
+
+
+def _summarize(news: NewsItem) -> None:
+    news.summary = summarize_news_item(
+        title=news.title,
+        content=news.content,
+    )["summary"] or news.summary
+
+
+def run_ingestion_pipeline(
+    db: Session,
+    items: Iterable[FeedItem],
+    source_map: Dict[str, int],
+    summarize: bool = False,
+    chunk_size: Optional[int] = None,
+    extract_articles: bool = False,
+    semantic_dedup: Optional[bool] = None,
+    cluster_stories: Optional[bool] = None,
+    embed: Optional[bool] = None,
+) -> Dict:
+    """
+    Drain a normalized item stream (see iter_ingest_items) into the DB.
+
+    source_map:       source_url -> source_id (see ensure_sources_exist)
+    summarize:        call Groq per inserted item (worker path)
+    extract_articles: queue inserted items for full-text extraction
+    semantic_dedup:   embedding check against recent items
+                      (default: SEMANTIC_DEDUP)
+    cluster_stories:  assign cluster_id to new items
+                      (default: STORY_CLUSTERING)
+    embed:            store title embeddings on new items (default:
+                      EMBEDDINGS; implied by the two stages above)
+
+    Returns:
+        {"inserted", "duplicates", "batch_duplicates",
+         "semantic_duplicates", "published": {source_url: [datetime, ...]},
+         "embeddings": EmbeddingStage.report() when embedding ran}
+
+    "batch_duplicates" (part of "duplicates") are copies of items kept
+    earlier in the same run; "semantic_duplicates" (also part of
+    "duplicates") are paraphrases of recent items. Both are stored with
+    is_duplicate=True and duplicate_of pointing at the kept item.
+    """
+    chunk_size = chunk_size or settings.INGEST_CHUNK_SIZE
+    if semantic_dedup is None:
+        semantic_dedup = settings.SEMANTIC_DEDUP
+    if cluster_stories is None:
+        cluster_stories = settings.STORY_CLUSTERING
+    if embed is None:
+        embed = settings.EMBEDDINGS
+
+    stats: Dict = {
+        "inserted": 0,
+        "duplicates": 0,
+        "batch_duplicates": 0,
+        "semantic_duplicates": 0,
+        "published": {},
+    }
+    batch = BatchDeduper()
+    stored_urls: Set[str] = set()
+
+    extractor = get_article_extractor() if extract_articles else None
+    title_index = get_title_index(db)
+    url_filter = get_url_filter(db)
+    semantic = SemanticDeduper(db) if semantic_dedup else None
+    clusterer = StoryClusterer.load(db) if cluster_stories else None
+    embedder = EmbeddingStage() if (embed or semantic_dedup or cluster_stories) else None
+    search_index = loaded_search_index()
+
+    for chunk in chunked(items, chunk_size):
+        # One round trip resolves every URL in the chunk
+        existing_urls = find_existing_urls(db, ((item.url, item.url_hash) for item in chunk))
+
+        copies: List[NewsItem] = []
+        inserted = [
+            news for news in (
+                _ingest_item(db, item, source_map, stats, batch, stored_urls, existing_urls, copies, semantic)
+                for item in chunk
+            )
+            if news is not None
+        ]
+
+        # One embedding batch per chunk serves every embedding stage
+        embedded = embedder is not None and bool(inserted)
+        vectors = embedder.embed([news.title for news in inserted]) if embedded else None
+
+        if semantic is not None and inserted:
+            keep = semantic.mark(inserted, vectors)
+            paraphrases = [news for news in inserted if news.is_duplicate]
+            stats["inserted"] -= len(paraphrases)
+            stats["duplicates"] += len(paraphrases)
+            stats["semantic_duplicates"] += len(paraphrases)
+            inserted = [inserted[pos] for pos in keep]
+            vectors = vectors[keep]
+
+            # Copies of an item that turned out to be a paraphrase
+            for copy in copies:
+                copy.original = semantic.root(copy.original)
+            copies.extend(paraphrases)
+
+        if embedded:
+            for news, vector in zip(inserted, vectors):
+                news.embedding = vector
+
+        if clusterer is not None and inserted:
+            clusterer.assign(db, inserted, vectors)
+        if clusterer is not None:
+            for copy in copies:
+                clusterer.inherit(copy, copy.original)
+
+        # Only items that survived every dedup stage cost an LLM call
+        if summarize:
+            for news in inserted:
+                _summarize(news)
+
+        new_articles: List[Tuple[int, str]] = []
+        if embedded or (extractor is not None and inserted):
+            db.flush()  # assign ids before the commit expires the rows
+            new_articles = [(news.id, news.url) for news in inserted]
+            if semantic is not None:
+                semantic.index_kept()
+            if clusterer is not None:
+                clusterer.write(db)
+
+        db.commit()
+
+        # Make this chunk's titles and URLs visible to the next lookups
+        if inserted or copies:
+            title_index.sync(db)
+            if url_filter is not None:
+                url_filter.sync(db)
+        if embedded and search_index is not None:
+            search_index.sync(db)
+
+        if extractor is not None and new_articles:
+            extractor.submit(new_articles, summarize=summarize)
+
+    # Per-source fetch state is written even when nothing was inserted
+    db.commit()
+
+    if embedder is not None:
+        stats["embeddings"] = embedder.report()
+
+    logger.info(
+        f"Pipeline inserted={stats['inserted']} duplicates={stats['duplicates']} "
+        f"(in-batch {stats['batch_duplicates']}, semantic {stats['semantic_duplicates']})"
+    )
+    return stats
@@ -5,35 +5,243 @@ Scheduler for periodic news ingestion.
 
 Supports:
 - Manual trigger (used for MVP)
+- Adaptive per-source polling (busy feeds more often, quiet feeds less)
 - APScheduler (optional dev scheduler)
 - Future integration with RQ/Celery workers
 
-Pipeline:
-fetch_all_sources → normalize_items → dedupe → summarize → save to DB
+Pipeline (streamed, see ingestion/pipeline.py):
+iter_ingest_items (fetch → parse → normalize) → dedupe → summarize → save to DB
 """
 
+import heapq
+import time
+from datetime import datetime, timezone
+from statistics import median
+from typing import Dict, Iterable, List, Optional
+
 from sqlalchemy.orm import Session
 
-from app.services.ingestion.fetcher import fetch_all_sources
-from app.services.normalizer import normalize_items
+from app.config import get_settings
+from app.services.ingestion.fetcher import NEWS_SOURCES
+from app.services.ingestion.pipeline import iter_ingest_items, run_ingestion_pipeline
+from app.services.ingestion.source_state import ensure_sources_exist, load_source_rows
+
+settings = get_settings()
+
+
+# ---------------------------------------------------------
+# Adaptive per-source polling
+# ---------------------------------------------------------
+class AdaptivePollScheduler:
+    """
+    Learns each source's publish rate from entry timestamps and
+    keeps a min-heap of (next_due, source_url).
+
+    - interval ≈ median gap between recent entries
+    - feeds that went quiet back off towards the max interval
+    - always clamped to [POLL_MIN_INTERVAL_SECONDS, POLL_MAX_INTERVAL_SECONDS]
+    """
+
+    # How many recent entries the rate estimate looks at
+    HISTORY = 20
+    # Weight of the previous interval (smooths one-off bursts / lulls)
+    SMOOTHING = 0.5
+
+    def __init__(
+        self,
+        sources: Optional[List[Dict]] = None,
+        min_interval: Optional[int] = None,
+        max_interval: Optional[int] = None,
+        default_interval: Optional[int] = None,
+    ):
+        self.min_interval = min_interval or settings.POLL_MIN_INTERVAL_SECONDS
+        self.max_interval = max_interval or settings.POLL_MAX_INTERVAL_SECONDS
+        default_interval = default_interval or settings.POLL_DEFAULT_INTERVAL_SECONDS
+
+        self.sources = {s["url"]: s for s in (sources or NEWS_SOURCES) if s["active"]}
+        self.intervals: Dict[str, float] = {url: float(default_interval) for url in self.sources}
+        self.last_published: Dict[str, float] = {}
+        self.next_due: Dict[str, float] = {}
+        self._heap: List[tuple] = []
+
+        now = time.time()
+        for url in self.sources:
+            self._push(url, now)  # everything is due on first run
+
+    # -------------------------
+    # Heap helpers
+    # -------------------------
+    def _push(self, url: str, due_at: float) -> None:
+        # Older heap entries for the same url become stale (lazy deletion)
+        self.next_due[url] = due_at
+        heapq.heappush(self._heap, (due_at, url))
+
+    def _drop_stale(self) -> None:
+        while self._heap and self.next_due.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+
+    def pop_due(self, now: Optional[float] = None) -> List[Dict]:
+        """
+        Returns the sources due for polling.
+        Each one is provisionally rescheduled at its current interval,
+        so a crashed cycle never drops a source from the queue.
+        """
+        now = now or time.time()
+        due: List[Dict] = []
+
+        self._drop_stale()
+        while self._heap and self._heap[0][0] <= now:
+            _, url = heapq.heappop(self._heap)
+            due.append(self.sources[url])
+            self._push(url, now + self.intervals[url])
+            self._drop_stale()
+
+        return due
+
+    def seconds_until_next(self, now: Optional[float] = None) -> float:
+        now = now or time.time()
+        self._drop_stale()
+        if not self._heap:
+            return float(self.max_interval)
+        return max(0.0, self._heap[0][0] - now)
+
+    # -------------------------
+    # Rate learning
+    # -------------------------
+    def observe(
+        self,
+        url: str,
+        published: Iterable[Optional[datetime]],
+        now: Optional[float] = None,
+    ) -> float:
+        """
+        Update a polled source's interval from the entry timestamps
+        seen this cycle, then schedule its next poll. Returns the interval.
+        """
+        if url not in self.sources:
+            return 0.0
+
+        now = now or time.time()
+        interval = self.intervals[url]
+        last = self.last_published.get(url)
+
+        times = sorted(
+            ts for ts in (_to_epoch(dt) for dt in published)
+            if ts is not None and ts <= now
+        )[-self.HISTORY:]
+
+        target = interval
+        if times:
+            points = ([last] if last is not None and last < times[0] else []) + times
+            gaps = [b - a for a, b in zip(points, points[1:]) if b > a]
+            if gaps:
+                target = median(gaps)
+            last = max(times[-1], last or 0.0)
+            self.last_published[url] = last
+
+        # A feed that has gone quiet should not keep a busy-feed interval
+        if last is not None:
+            target = max(target, (now - last) / 2)
+
+        interval = self.SMOOTHING * interval + (1 - self.SMOOTHING) * target
+        interval = min(max(interval, self.min_interval), self.max_interval)
+
+        self.intervals[url] = interval
+        self._push(url, now + interval)
+        return interval
+
+    def observe_published(
+        self,
+        polled: List[Dict],
+        published: Dict[str, List[datetime]],
+        now: Optional[float] = None,
+    ) -> None:
+        """
+        observe() every polled source.
+        published: source_url -> entry datetimes seen this cycle.
+        Sources with no entries (304, failures) are simply rescheduled.
+        """
+        for source in polled:
+            self.observe(source["url"], published.get(source["url"], []), now)
+
+    # -------------------------
+    # Persistence (sources table)
+    # -------------------------
+    def restore(self, db: Session) -> None:
+        rows = load_source_rows(db, list(self.sources.values()))
+
+        for url, row in rows.items():
+            if row.poll_interval_seconds:
+                self.intervals[url] = float(row.poll_interval_seconds)
+            if row.latest_published_at:
+                self.last_published[url] = _to_epoch(row.latest_published_at)
+            if row.next_poll_at:
+                self._push(url, _to_epoch(row.next_poll_at))
+
+    def persist(self, db: Session) -> None:
+        """
+        Write intervals / next-due times onto source rows. Caller commits.
+        """
+        rows = load_source_rows(db, list(self.sources.values()))
+
+        for url, row in rows.items():
+            row.poll_interval_seconds = int(self.intervals[url])
+            row.next_poll_at = _to_naive_utc(self.next_due.get(url))
+            row.latest_published_at = _to_naive_utc(self.last_published.get(url))
+
+
+def _to_epoch(dt: Optional[datetime]) -> Optional[float]:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)  # DB timestamps are naive UTC
+    return dt.timestamp()
+
+
+def _to_naive_utc(ts: Optional[float]) -> Optional[datetime]:
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc).replace(tzinfo=None)
 
 
 # ---------------------------------------------------------
 # Main ingestion cycle (called manually or via scheduler)
 # ---------------------------------------------------------
-def run_ingestion_cycle(db: Session):
+def run_ingestion_cycle(
+    db: Session,
+    sources: Optional[List[Dict]] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
+    summarize: bool = True,
+) -> Dict:
+    """
+    One streamed ingestion pass over `sources` (default: all active).
+    Returns pipeline stats plus fetch stats under "fetch".
+    """
 
     print("🔄 Starting ingestion cycle...")
 
-    # Step 1: Fetch raw items from all sources
-    raw_items = fetch_all_sources(db)
+    # Step 1: Make sure every source has a row (FK target + fetch state)
+    source_map = ensure_sources_exist(db, NEWS_SOURCES)
 
-    # Step 2: Normalize raw parsed items
-    normalized_items = normalize_items(raw_items)
+    # Step 2: Stream fetch → parse → normalize → dedupe → save
+    fetch_stats: Dict = {}
+    items = iter_ingest_items(db, sources=sources, stats=fetch_stats)
+    result = run_ingestion_pipeline(
+        db, items, source_map,
+        summarize=summarize,
+        extract_articles=settings.ARTICLE_EXTRACTION,
+    )
+    result["fetch"] = fetch_stats
 
-    print(f"✨ Normalization complete — {len(normalized_items)} clean items ready.")
+    print(f"✨ Ingestion complete — {result['inserted']} new items saved.")
 
-    return normalized_items
+    # Step 3: Learn publish rates, schedule next polls
+    if poll_scheduler is not None:
+        poll_scheduler.observe_published(sources or NEWS_SOURCES, result["published"])
+        poll_scheduler.persist(db)
+        db.commit()
+
+    return result
 
 
 # ================================================================================
@@ -49,32 +257,51 @@ except Exception:
 
 
 scheduler = None
+poll_scheduler: Optional[AdaptivePollScheduler] = None
+
+
+def _run_due_sources(db_session_factory):
+    db = db_session_factory()
+    try:
+        due = poll_scheduler.pop_due()
+        if due:
+            run_ingestion_cycle(db, sources=due, poll_scheduler=poll_scheduler)
+    finally:
+        db.close()
 
 
 def start_scheduler(db_session_factory):
     """
-    Starts APScheduler to run ingestion every 15 minutes.
+    Starts APScheduler with adaptive per-source polling.
+    Ticks every POLL_TICK_SECONDS and fetches only the sources that are due.
     Only used during development (NOT required in Docker deployment).
     """
-    global scheduler
+    global scheduler, poll_scheduler
 
     if not APSCHEDULER_AVAILABLE:
         print("⚠ APScheduler not installed. Skipping scheduler startup.")
         return
 
     if scheduler is None:
+        poll_scheduler = AdaptivePollScheduler()
+        db = db_session_factory()
+        try:
+            poll_scheduler.restore(db)
+        finally:
+            db.close()
+
         scheduler = BackgroundScheduler()
 
-        # Add a job every 15 minutes
         scheduler.add_job(
-            lambda: run_ingestion_cycle(db_session_factory()),
+            lambda: _run_due_sources(db_session_factory),
             trigger="interval",
-            minutes=15,
+            seconds=settings.POLL_TICK_SECONDS,
             id="news_ingestion_job",
+            max_instances=1,
         )
 
         scheduler.start()
-        print("⏰ APScheduler started — ingestion every 15 minutes.")
+        print(f"⏰ APScheduler started — adaptive polling, tick every {settings.POLL_TICK_SECONDS}s.")
 
 
 def stop_scheduler():
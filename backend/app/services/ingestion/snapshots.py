@@ -0,0 +1,125 @@
+# backend/app/services/ingestion/snapshots.py
+
+"""
+Content-addressed raw feed snapshot store.
+
+Layout (one directory per source):
+    <root>/<source_key>/objects/<sha256>.gz   gzip'd feed body, stored once
+    <root>/<source_key>/captures.jsonl        capture log, one line per fetch
+
+Used for:
+- capture: the fetcher writes every fetched body (SNAPSHOT_CAPTURE=true)
+- replay:  FETCH_MODE=replay reads snapshots instead of the network,
+           for deterministic, network-free load tests and reprocessing
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import re
+from datetime import datetime
+from typing import Dict, Iterator, Optional, Tuple
+
+
+class SnapshotStore:
+
+    def __init__(self, root: str):
+        self.root = root
+
+    # -------------------------
+    # Paths
+    # -------------------------
+    @staticmethod
+    def source_key(source_url: str) -> str:
+        """
+        Readable + collision-free directory name for a source URL.
+        """
+        slug = re.sub(r"[^a-zA-Z0-9]+", "-", source_url.split("://", 1)[-1]).strip("-")
+        digest = hashlib.sha1(source_url.encode("utf-8")).hexdigest()[:10]
+        return f"{slug[:60]}-{digest}"
+
+    def _source_dir(self, source_url: str) -> str:
+        return os.path.join(self.root, self.source_key(source_url))
+
+    def _object_path(self, source_url: str, sha256: str) -> str:
+        return os.path.join(self._source_dir(source_url), "objects", f"{sha256}.gz")
+
+    def _log_path(self, source_url: str) -> str:
+        return os.path.join(self._source_dir(source_url), "captures.jsonl")
+
+    # -------------------------
+    # Capture
+    # -------------------------
+    def write(self, source_url: str, body: bytes, captured_at: Optional[datetime] = None) -> str:
+        """
+        Store a fetched body (once per distinct content) and log the capture.
+        Returns the body's sha256.
+        """
+        sha256 = hashlib.sha256(body).hexdigest()
+        path = self._object_path(source_url, sha256)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.tmp"
+            with gzip.open(tmp, "wb") as f:
+                f.write(body)
+            os.replace(tmp, path)  # atomic: readers never see partial objects
+
+        entry = {
+            "captured_at": (captured_at or datetime.utcnow()).isoformat(),
+            "sha256": sha256,
+            "size": len(body),
+        }
+        with open(self._log_path(source_url), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+
+        return sha256
+
+    # -------------------------
+    # Replay
+    # -------------------------
+    def read(self, source_url: str, sha256: str) -> bytes:
+        with gzip.open(self._object_path(source_url, sha256), "rb") as f:
+            return f.read()
+
+    def iter_captures(
+        self,
+        source_url: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[Dict]:
+        """
+        Capture log entries in capture order, optionally within a window.
+        Consecutive captures of identical content are collapsed.
+        """
+        path = self._log_path(source_url)
+        if not os.path.exists(path):
+            return
+
+        previous = None
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+
+                entry = json.loads(line)
+                captured_at = datetime.fromisoformat(entry["captured_at"])
+                if since and captured_at < since:
+                    continue
+                if until and captured_at > until:
+                    continue
+                if entry["sha256"] == previous:
+                    continue
+
+                previous = entry["sha256"]
+                yield entry
+
+    def iter_bodies(
+        self,
+        source_url: str,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> Iterator[Tuple[Dict, bytes]]:
+        for entry in self.iter_captures(source_url, since, until):
+            yield entry, self.read(source_url, entry["sha256"])
@@ -0,0 +1,208 @@
+# backend/app/services/ingestion/source_state.py
+
+"""
+Per-source fetch state, persisted on the `sources` table.
+
+Keeps the fetcher itself DB-free:
+- load state rows before a fetch cycle
+- hand plain dicts to the (possibly async) fetch engine
+- write results back onto the rows afterwards (caller commits)
+- validators from fresh responses are stored only once the feed's items
+  are committed (see apply_validators), like the high-water mark:
+  a 304 must never hide entries that were fetched but not saved
+
+State tracked:
+- HTTP cache validators (ETag / Last-Modified) for conditional GET
+- health / circuit breaker:
+    closed     → fetched every cycle
+    open       → skipped until next_retry_at (exponential backoff)
+    half-open  → one probe fetch once next_retry_at has passed;
+                 success closes the breaker (source reactivated),
+                 failure re-opens it with a doubled backoff
+- high-water mark: newest entry date + recent entry ids, so entries
+  already ingested are dropped before any parsing or DB work
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.orm_models import Source
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+def ensure_sources_exist(db: Session, sources: List[Dict]) -> Dict[str, int]:
+    """
+    Ensures sources exist and returns a map: source_url -> source_id
+    """
+    existing = {s.url: s.id for s in db.query(Source).all()}
+
+    for src in sources:
+        if src["url"] not in existing:
+            new = Source(
+                name=src["name"],
+                url=src["url"],
+                type=src["type"],
+                active=True,
+            )
+            db.add(new)
+            db.flush()  # 🔥 get ID immediately
+            existing[new.url] = new.id
+
+    db.commit()
+    return existing
+
+
+def load_source_rows(db: Session, sources: List[Dict]) -> Dict[str, Source]:
+    """
+    Returns a map: source_url -> Source row (only rows that exist).
+    """
+    urls = [s["url"] for s in sources]
+    if not urls:
+        return {}
+
+    rows = db.query(Source).filter(Source.url.in_(urls)).all()
+    return {row.url: row for row in rows}
+
+
+def get_validators(rows: Dict[str, Source]) -> Dict[str, Dict]:
+    """
+    Returns a map: source_url -> {"etag", "last_modified"}
+    """
+    return {
+        url: {"etag": row.etag, "last_modified": row.last_modified}
+        for url, row in rows.items()
+        if row.etag or row.last_modified
+    }
+
+
+def get_mark(row: Optional[Source]) -> Optional[Dict]:
+    """
+    High-water mark handed to the fetcher:
+    {"published_at": naive UTC datetime | None, "guids": set}
+    """
+    if row is None or (row.hwm_published_at is None and not row.recent_guids):
+        return None
+
+    return {
+        "published_at": row.hwm_published_at,
+        "guids": set(row.recent_guids or []),
+    }
+
+
+def advance_marks(db: Session, new_marks: Dict[str, Dict]) -> None:
+    """
+    Raise each source's high-water mark past this cycle's new entries.
+
+    new_marks: source_url -> {"published_at": newest datetime, "guids": [newest first]}
+    Caller commits.
+    """
+    if not new_marks:
+        return
+
+    rows = db.query(Source).filter(Source.url.in_(list(new_marks))).all()
+    now = datetime.utcnow()
+
+    for row in rows:
+        mark = new_marks[row.url]
+
+        published = mark.get("published_at")
+        if published is not None:
+            if published.tzinfo is not None:
+                published = published.astimezone(timezone.utc).replace(tzinfo=None)
+            published = min(published, now)  # future-dated entries must not block real ones
+            if row.hwm_published_at is None or published > row.hwm_published_at:
+                row.hwm_published_at = published
+
+        if mark.get("guids"):
+            fresh = set(mark["guids"])
+            old = [g for g in (row.recent_guids or []) if g not in fresh]
+            # Reassign (not mutate) so the JSON column is flagged dirty
+            row.recent_guids = (mark["guids"] + old)[:settings.HWM_GUID_LIMIT]
+
+
+def fresh_validators(result: Dict) -> Optional[Dict]:
+    """
+    {"etag", "last_modified"} from a fresh 200 response, else None.
+    """
+    if result["status"] != "ok":
+        return None
+    return {"etag": result["etag"], "last_modified": result["last_modified"]}
+
+
+def apply_validators(db: Session, validators: Dict[str, Dict]) -> None:
+    """
+    Store validators once the feed's items are committed (or the cycle
+    is about to commit them).
+
+    validators: source_url -> {"etag", "last_modified"} (see fresh_validators)
+    Caller commits.
+    """
+    if not validators:
+        return
+
+    rows = db.query(Source).filter(Source.url.in_(list(validators))).all()
+    for row in rows:
+        row.etag = validators[row.url]["etag"]
+        row.last_modified = validators[row.url]["last_modified"]
+
+
+def is_fetch_allowed(row: Optional[Source], now: Optional[datetime] = None) -> bool:
+    """
+    False while the source's breaker is open.
+    Unknown sources (no row yet) are always fetched.
+    """
+    if row is None or not row.failure_count or row.next_retry_at is None:
+        return True
+
+    now = now or datetime.utcnow()
+    return now >= row.next_retry_at
+
+
+def backoff_seconds(failure_count: int) -> int:
+    """
+    0 below the threshold, then base * 2^n capped at the max.
+    """
+    over = failure_count - settings.SOURCE_FAILURE_THRESHOLD
+    if over < 0:
+        return 0
+
+    return min(
+        settings.SOURCE_BACKOFF_BASE_SECONDS * (2 ** min(over, 32)),
+        settings.SOURCE_BACKOFF_MAX_SECONDS,
+    )
+
+
+def apply_fetch_result(row: Source, result: Dict, now: Optional[datetime] = None) -> None:
+    """
+    Persist what a fetch result learned about the source's health.
+    Validators are left alone: see apply_validators.
+    """
+    now = now or datetime.utcnow()
+
+    if result["status"] == "failed":
+        row.failure_count = (row.failure_count or 0) + 1
+        row.last_failure_at = now
+        row.last_error = (result["error"] or "")[:500]
+
+        delay = backoff_seconds(row.failure_count)
+        row.next_retry_at = now + timedelta(seconds=delay) if delay else None
+        if delay:
+            logger.warning(
+                f"Source {row.name} failed {row.failure_count}x — "
+                f"backing off for {delay}s"
+            )
+        return
+
+    if row.failure_count:
+        logger.info(f"Source {row.name} recovered after {row.failure_count} failure(s)")
+
+    row.failure_count = 0
+    row.last_success_at = now
+    row.next_retry_at = None
+    row.last_error = None
@@ -5,47 +5,133 @@ Normalizer converts parsed items into a unified schema.
 This is the FINAL structure before deduplication.
 """
 
-from typing import List, Dict
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from datetime import datetime, timezone
 from dateutil import parser as date_parser
 
+from app.services.ingestion.items import FeedItem
+from app.utils.urls import url_hash
 
-def normalize_datetime(value) -> datetime | None:
+
+# ----------------------------------------------------
+# Dates
+# ----------------------------------------------------
+# Feeds stick to one layout (RFC 822 for RSS, ISO 8601 for Atom), so the
+# fast layout that worked last time is tried first per source; dateutil is
+# only the fallback for anything else. It is never remembered: it accepts
+# nearly anything (so it would stay first for good, ~10x slower) and reads
+# some values differently (drops "EST"), which would make the result
+# depend on which entry the source happened to send first.
+
+DATE_CACHE_SIZE = 4096
+
+_source_layouts: Dict[str, str] = {}  # source_url -> last fast layout that parsed
+
+
+def _to_utc(dt: datetime) -> datetime:
+    # Naive timestamps are taken as UTC (feeds / seed data are UTC)
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+_RFC822 = re.compile(
+    r"^(?:[A-Za-z]{3},\s*)?\d{1,2}\s+[A-Za-z]{3}\s+\d{2,4}\s+\d{1,2}:\d{2}(?::\d{2})?"
+    r"(?:\s+(?:[+-]\d{4}|UTC?|GMT|Z|[ACEMP][SD]T))?$"
+)
+
+
+def _parse_rfc822(value: str) -> datetime:
+    # "Mon, 06 Sep 2021 16:45:00 +0000" — parsedate is lenient, so check
+    # the shape first (it would read "4:45 PM" as 04:45)
+    if not _RFC822.match(value):
+        raise ValueError("not RFC 822")
+    return parsedate_to_datetime(value)
+
+
+def _parse_iso8601(value: str) -> datetime:
+    # "2021-09-06T16:45:00Z" (fromisoformat only takes "Z" from 3.11)
+    if value.endswith(("Z", "z")):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _parse_dateutil(value: str) -> datetime:
+    return date_parser.parse(value)
+
+
+_LAYOUTS = {
+    "rfc822": _parse_rfc822,
+    "iso8601": _parse_iso8601,
+    "dateutil": _parse_dateutil,
+}
+_FAST_LAYOUTS = ("rfc822", "iso8601")  # the only ones remembered per source
+
+
+def _sniff_layout(value: str) -> str:
+    return "iso8601" if value[:4].isdigit() and value[4:5] == "-" else "rfc822"
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_date(value: str, first: str) -> Tuple[Optional[datetime], Optional[str]]:
+    """
+    (UTC datetime, layout that parsed it), trying `first` before the rest.
+    """
+    order = [first] + [layout for layout in _LAYOUTS if layout != first]
+    for layout in order:
+        try:
+            return _to_utc(_LAYOUTS[layout](value)), layout
+        except (TypeError, ValueError, OverflowError, date_parser.ParserError):
+            continue
+    return None, None
+
+
+def normalize_datetime(value, source: Optional[str] = None) -> datetime | None:
+    """
+    Any feed date (string or datetime) → tz-aware UTC datetime, or None.
+    source: feed URL, used to remember which layout that feed uses.
+    """
     if not value:
         return None
-    try:
-        dt = date_parser.parse(value)
-        return dt.astimezone(timezone.utc)
-    except Exception:
+    if isinstance(value, datetime):
+        return _to_utc(value)
+    if not isinstance(value, str):
         return None
 
+    value = value.strip()
+    if not value:
+        return None
 
-def normalize_items(parsed_items: List[Dict]) -> List[Dict]:
-    """
-    Output strictly matches NewsItemCreate expectations.
-    """
+    first = _source_layouts.get(source) or _sniff_layout(value)
+    dt, layout = _parse_date(value, first)
 
-    normalized: List[Dict] = []
+    if source and layout in _FAST_LAYOUTS and layout != first:
+        _source_layouts[source] = layout
+    return dt
 
-    for item in parsed_items:
-        title = item.get("title")
-        url = item.get("url")
 
+def iter_normalized_items(parsed_items: Iterable[FeedItem]) -> Iterator[FeedItem]:
+    """
+    Streaming normalize (in place).
+    Output fields strictly match NewsItemCreate expectations.
+    """
+    for item in parsed_items:
         # Mandatory fields
-        if not title or not url:
+        if not item.title or not item.url:
             continue
 
-        normalized.append({
-            "source_name": item.get("source_name"),
-            "source_url": item.get("source_url"),  # 🔥 ADD THIS
-            "title": title.strip(),
-            "summary": item.get("content"),
-            "author": item.get("author"),
-            "url": url,
-            "published_at": normalize_datetime(item.get("published_at")),
-            "content": item.get("content"),
-            "tags": None,
-            "raw": item.get("raw"),
-        })
-
-    return normalized
\ No newline at end of file
+        item.title = item.title.strip()
+        item.url_hash = url_hash(item.url)
+        item.published_at = normalize_datetime(item.published_at, item.source_url)
+
+        yield item
+
+
+def normalize_items(parsed_items: List[FeedItem]) -> List[FeedItem]:
+    """
+    Output fields strictly match NewsItemCreate expectations.
+    """
+    return list(iter_normalized_items(parsed_items))
@@ -0,0 +1,441 @@
+# backend/app/services/search_index.py
+
+"""
+Vector index for semantic search (GET /api/v1/news/search).
+
+Holds the stored title embedding of every non-duplicate item, with its
+id, source and date, as contiguous append-only arrays. Small indexes are
+searched exactly; past SEARCH_IVF_MIN_ITEMS the rows are partitioned
+IVF-style:
+
+    spherical k-means → ~2·√N centroids ("lists")
+    row numbers grouped by list, offsets per list   (packed rows)
+    rows added since the last pack                  (tail, scanned exactly)
+
+A query scores the centroids, then gathers only the SEARCH_IVF_PROBES
+nearest lists plus the tail — tens of thousands of rows at 1M items
+instead of all of them (top_k from utils/similarity.py).
+
+Training and packing never run on the caller's thread: add() only
+appends and, when the tail outgrows TAIL_FRACTION of the index (pack)
+or the index has grown RETRAIN_GROWTH× since training (train), wakes a
+background rebuild thread that builds a new partition and swaps it in.
+Readers take the current (rows, partition) snapshot without locking, so
+a query never waits for an insert or a rebuild.
+
+Source / date filters are applied to the scanned rows; a filter that
+leaves few rows (≤ EXACT_ROWS) is searched exactly over those rows.
+
+Like the title index it catches up from news_items by id (sync), so
+items inserted by any process become searchable on the next query.
+Memory: 4 bytes × EMBEDDING_DIM per item (1.5 KB at 384-d), plus 8 bytes
+of list bookkeeping.
+"""
+
+import logging
+import math
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem
+from app.utils.similarity import normalize_rows, top_k
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+EPOCH = datetime(1970, 1, 1)
+EXACT_ROWS = 100_000
+TAIL_FRACTION = 0.02
+MIN_TAIL = 20_000
+RETRAIN_GROWTH = 4
+KMEANS_ITERATIONS = 8
+KMEANS_SAMPLE_PER_LIST = 32
+
+_TOKEN = re.compile(r"\w+")
+
+
+def _timestamp(value: Optional[datetime]) -> float:
+    # DB columns are naive UTC; query parameters may be aware
+    if value is None:
+        return math.nan
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return (value - EPOCH).total_seconds()
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+    """
+    Nearest centroid of each row (top_k bounds the scratch memory).
+    """
+    return top_k(vectors, centroids, 1)[0][:, 0].astype(np.int32)
+
+
+def _kmeans(vectors: np.ndarray, n_lists: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Spherical k-means on a sample: unit centroids.
+    """
+    sample = vectors[np.sort(rng.choice(len(vectors), min(len(vectors), n_lists * KMEANS_SAMPLE_PER_LIST), replace=False))]
+    centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+    for _ in range(KMEANS_ITERATIONS):
+        labels = _assign(sample, centroids)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, sample)
+        empty = ~sums.any(axis=1)
+        sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]  # re-seed empty lists
+        centroids = normalize_rows(sums)
+
+    return centroids
+
+
+class _Rows:
+    """
+    Published view of the row arrays: rows [0, size) are final.
+    """
+    __slots__ = ("vectors", "ids", "sources", "dates", "size")
+
+    def __init__(self, vectors, ids, sources, dates, size):
+        self.vectors = vectors
+        self.ids = ids
+        self.sources = sources
+        self.dates = dates
+        self.size = size
+
+
+class _Partition:
+    """
+    IVF lists over rows [0, packed), immutable once published.
+    """
+    __slots__ = ("centroids", "labels", "order", "offsets", "packed", "trained_at")
+
+    def __init__(self, centroids: np.ndarray, labels: np.ndarray, trained_at: int):
+        self.centroids = centroids
+        self.labels = labels  # list of each packed row
+        self.order = np.argsort(labels, kind="stable").astype(np.int32)  # row numbers grouped by list
+        self.offsets = np.searchsorted(labels[self.order], np.arange(len(centroids) + 1)).astype(np.int64)
+        self.packed = len(labels)
+        self.trained_at = trained_at
+
+    def rows(self, lists: np.ndarray) -> np.ndarray:
+        return np.concatenate([self.order[self.offsets[l]:self.offsets[l + 1]] for l in lists.tolist()])
+
+
+class SearchIndex:
+
+    def __init__(self, dim: int, capacity: int = 1024):
+        self.dim = dim
+        self._rows = _Rows(
+            np.empty((capacity, dim), dtype=np.float32),
+            np.empty(capacity, dtype=np.int64),
+            np.empty(capacity, dtype=np.int32),
+            np.empty(capacity, dtype=np.float64),
+            0,
+        )
+        self._partition: Optional[_Partition] = None
+        self.max_id = 0
+
+        self._rng = np.random.default_rng(0)
+        self._rebuilding = False
+        self._idle = threading.Event()
+        self._idle.set()
+        self.last_rebuild: Optional[Dict] = None
+
+        self._lock = threading.Lock()  # writers only (add / rebuild scheduling)
+        self._sync_lock = threading.Lock()  # one catch-up at a time
+
+    @property
+    def size(self) -> int:
+        return self._rows.size
+
+    # -------------------------
+    # Updates
+    # -------------------------
+    def add(self, ids: Sequence[int], vectors, sources: Sequence[int], dates: Sequence[float]) -> None:
+        n = len(ids)
+        if n == 0:
+            return
+        vectors = normalize_rows(vectors)
+
+        with self._lock:
+            current = self._rows
+            size, needed = current.size, current.size + n
+            arrays = [current.vectors, current.ids, current.sources, current.dates]
+
+            if needed > len(current.ids):
+                # Readers keep the old arrays; rows past their size are never read
+                capacity = max(needed, len(current.ids) * 3 // 2)
+                grown = []
+                for old in arrays:
+                    array = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+                    array[:size] = old[:size]
+                    grown.append(array)
+                arrays = grown
+
+            for array, values in zip(arrays, (vectors, ids, sources, dates)):
+                array[size:needed] = values
+            self._rows = _Rows(*arrays, needed)
+            self.max_id = max(self.max_id, int(max(ids)))
+
+            self._schedule_rebuild()
+
+    def _pending(self) -> Optional[str]:
+        rows, partition = self._rows, self._partition
+        if rows.size < settings.SEARCH_IVF_MIN_ITEMS:
+            return None
+        if partition is None or rows.size >= RETRAIN_GROWTH * partition.trained_at:
+            return "train"
+        if rows.size - partition.packed > max(MIN_TAIL, TAIL_FRACTION * rows.size):
+            return "pack"
+        return None
+
+    def _schedule_rebuild(self) -> None:
+        # Caller holds self._lock
+        if self._rebuilding or self._pending() is None:
+            return
+        self._rebuilding = True
+        self._idle.clear()
+        threading.Thread(target=self._rebuild, name="search-index-rebuild", daemon=True).start()
+
+    def _rebuild(self) -> None:
+        failed = False
+        try:
+            while (action := self._pending()) is not None:
+                started = time.perf_counter()
+                rows, partition = self._rows, self._partition
+                if action == "train":
+                    partition = self._train(rows)
+                else:
+                    partition = self._pack(rows, partition)
+                self._partition = partition
+                self.last_rebuild = {
+                    "action": action,
+                    "items": partition.packed,
+                    "lists": len(partition.centroids),
+                    "seconds": round(time.perf_counter() - started, 2),
+                }
+                logger.info(f"Search index: {action} over {partition.packed} items in {self.last_rebuild['seconds']}s")
+        except Exception:
+            failed = True
+            logger.exception("Search index rebuild failed; searching the tail exactly")
+        finally:
+            with self._lock:
+                self._rebuilding = False
+                if not failed:
+                    self._schedule_rebuild()  # rows added after the last check
+                if not self._rebuilding:
+                    self._idle.set()
+
+    def _train(self, rows: _Rows) -> _Partition:
+        vectors = rows.vectors[:rows.size]
+        n_lists = max(1, int(2 * math.sqrt(rows.size)))
+        centroids = _kmeans(vectors, n_lists, self._rng)
+        return _Partition(centroids, _assign(vectors, centroids), trained_at=rows.size)
+
+    def _pack(self, rows: _Rows, partition: _Partition) -> _Partition:
+        """
+        Fold the tail into the lists (only the tail is assigned).
+        """
+        tail = _assign(rows.vectors[partition.packed:rows.size], partition.centroids)
+        return _Partition(partition.centroids, np.concatenate([partition.labels, tail]), partition.trained_at)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until no rebuild is running (benchmarks, tests).
+        """
+        return self._idle.wait(timeout)
+
+    # -------------------------
+    # Search
+    # -------------------------
+    @staticmethod
+    def _valid(rows: _Rows, selected, sources, since, until) -> Optional[np.ndarray]:
+        if not sources and since is None and until is None:
+            return None
+        valid = np.ones(len(rows.ids[selected]), dtype=bool)
+        if sources:
+            valid &= np.isin(rows.sources[selected], sources)
+        dates = rows.dates[selected]
+        if since is not None:
+            valid &= dates >= since
+        if until is not None:
+            valid &= dates < until
+        return valid
+
+    def search(
+        self,
+        query,
+        k: int = 10,
+        sources: Optional[List[int]] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        probes: Optional[int] = None,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k item ids and cosine scores for one query vector, best
+        first (fewer than k when fewer items match the filters).
+        """
+        query = normalize_rows(query)
+        since, until = (None if d is None else _timestamp(d) for d in (since, until))
+
+        # Partition first: its packed rows are always within the rows read after it
+        partition = self._partition
+        rows = self._rows
+
+        everything = slice(0, rows.size)
+        filtered = self._valid(rows, everything, sources, since, until)
+
+        if partition is None or (filtered is not None and filtered.sum() <= EXACT_ROWS):
+            selected = np.nonzero(filtered)[0] if filtered is not None else everything
+            return self._exact(rows, query, selected, k)
+
+        ids, scores = self._probe(rows, partition, query, k, probes or settings.SEARCH_IVF_PROBES, sources, since, until)
+        if len(ids) < k and filtered is not None:
+            # Too few matches in the probed lists
+            ids, scores = self._exact(rows, query, np.nonzero(filtered)[0], k)
+        return ids, scores
+
+    @staticmethod
+    def _exact(rows: _Rows, query: np.ndarray, selected, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        found, scores = top_k(query, rows.vectors[selected], k)
+        found, scores = found[0], scores[0]
+        keep = found >= 0
+        return rows.ids[selected][found[keep]], scores[keep]
+
+    def _probe(self, rows: _Rows, partition: _Partition, query, k, probes, sources, since, until):
+        lists = top_k(query, partition.centroids, min(probes, len(partition.centroids)))[0][0]
+        selected = np.concatenate([partition.rows(lists), np.arange(partition.packed, rows.size)])
+
+        valid = self._valid(rows, selected, sources, since, until)
+        found, scores = top_k(query, rows.vectors[selected], k, valid=valid)
+        found, scores = found[0], scores[0]
+        keep = found >= 0
+        return rows.ids[selected[found[keep]]], scores[keep]
+
+    # -------------------------
+    # Catch-up from news_items
+    # -------------------------
+    def sync(self, db: Session, batch_size: int = 5_000, blocking: bool = True) -> int:
+        """
+        Add embedded, non-duplicate news_items rows newer than max_id.
+        With blocking=False, returns 0 at once if a catch-up is running.
+        """
+        if not self._sync_lock.acquire(blocking=blocking):
+            return 0
+        try:
+            return self._sync(db, batch_size)
+        finally:
+            self._sync_lock.release()
+
+    def _sync(self, db: Session, batch_size: int) -> int:
+        added = 0
+        while True:
+            rows = (
+                db.query(
+                    NewsItem.id, NewsItem.embedding, NewsItem.source_id,
+                    NewsItem.published_at, NewsItem.retrieved_at,
+                )
+                .filter(NewsItem.id > self.max_id)
+                .filter(NewsItem.embedding.isnot(None))
+                .filter(NewsItem.is_duplicate.isnot(True))
+                .order_by(NewsItem.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+
+            usable = [row for row in rows if len(row[1]) == self.dim]
+            if usable:
+                self.add(
+                    [row[0] for row in usable],
+                    np.stack([row[1] for row in usable]),
+                    [row[2] for row in usable],
+                    [_timestamp(row[3] or row[4]) for row in usable],
+                )
+                added += len(usable)
+            with self._lock:
+                self.max_id = max(self.max_id, rows[-1][0])
+        return added
+
+    def stats(self) -> Dict:
+        rows, partition = self._rows, self._partition
+        return {
+            "items": rows.size,
+            "max_id": self.max_id,
+            "lists": 0 if partition is None else len(partition.centroids),
+            "tail": rows.size - (0 if partition is None else partition.packed),
+            "rebuilding": self._rebuilding,
+            "last_rebuild": self.last_rebuild,
+            "memory_bytes": int(
+                rows.vectors.nbytes + rows.ids.nbytes + rows.sources.nbytes + rows.dates.nbytes
+                + (0 if partition is None else partition.labels.nbytes + partition.order.nbytes)
+            ),
+        }
+
+
+# -------------------------
+# Keyword re-ranking
+# -------------------------
+def _tokens(text: Optional[str]) -> set:
+    return set(_TOKEN.findall((text or "").lower()))
+
+
+def keyword_score(query: str, news: NewsItem) -> float:
+    """
+    Share of the query's words found in the item's title / summary.
+    """
+    terms = _tokens(query)
+    if not terms:
+        return 0.0
+    return len(terms & (_tokens(news.title) | _tokens(news.summary))) / len(terms)
+
+
+_index: Optional[SearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index(db: Session) -> SearchIndex:
+    """
+    Process-wide index: built from the DB on first use. Later calls
+    catch up without waiting if ingestion is already syncing it.
+    """
+    global _index
+
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                started = time.perf_counter()
+                index = SearchIndex(settings.EMBEDDING_DIM)
+                index.sync(db)
+                logger.info(f"Search index ready: {index.size} item(s) in {time.perf_counter() - started:.1f}s")
+                _index = index
+                return _index
+
+    _index.sync(db, blocking=False)
+    return _index
+
+
+def loaded_search_index() -> Optional[SearchIndex]:
+    # Ingestion only feeds an index this process already serves
+    return _index
+
+
+def warm_search_index() -> None:
+    """
+    Startup hook (API, EMBEDDINGS): load the index before the first query.
+    """
+    from app.models.db import SessionLocal
+
+    db = SessionLocal()
+    try:
+        index = get_search_index(db)
+    finally:
+        db.close()
+    print(f"✅ Search index loaded ({index.size} items).")
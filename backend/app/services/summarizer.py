@@ -7,25 +7,27 @@ Responsibilities:
 - Generate short factual summaries (2–3 lines)
 - Generate optional LinkedIn-style captions
 - Deterministic, cheap, fast prompts
+- Pooled keep-alive clients, sync + async (services/groq_client.py)
 - NO OpenAI usage (Groq only)
 """
 
-import os
+import asyncio
 from typing import Optional
 
-from groq import Groq
+from groq import AsyncGroq, Groq
+
+from app.services.groq_client import get_groq_pool
 
 # --------------------------------------------------
-# Groq Client Initialization
+# Groq Client (pooled, see services/groq_client.py)
 # --------------------------------------------------
 
 def get_groq_client() -> Groq:
-    api_key = os.getenv("GROQ_API_KEY")
-    if not api_key:
-        raise RuntimeError(
-            "GROQ_API_KEY is not set. Please define it in .env or environment variables."
-        )
-    return Groq(api_key=api_key)
+    return get_groq_pool().client
+
+
+def get_async_groq_client() -> AsyncGroq:
+    return get_groq_pool().async_client()
 
 # Fast + cheap Groq model
 DEFAULT_MODEL = "llama-3.1-8b-instant"
@@ -76,18 +78,57 @@ def _call_groq(
     """
     Low-level Groq API call wrapper.
     """
-    client = get_groq_client()
-    response = client.chat.completions.create(
-        model=DEFAULT_MODEL,
-        messages=[
+    response = get_groq_client().chat.completions.create(
+        **_request(system_prompt, user_prompt, temperature, max_tokens)
+    )
+
+    return response.choices[0].message.content.strip()
+
+
+async def _call_groq_async(
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float = 0.2,
+    max_tokens: int = 150,
+) -> str:
+    """
+    Async _call_groq (doesn't block the event loop).
+    """
+    response = await get_async_groq_client().chat.completions.create(
+        **_request(system_prompt, user_prompt, temperature, max_tokens)
+    )
+
+    return response.choices[0].message.content.strip()
+
+
+def _request(system_prompt: str, user_prompt: str, temperature: float, max_tokens: int) -> dict:
+    return {
+        "model": DEFAULT_MODEL,
+        "messages": [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ],
-        temperature=temperature,
-        max_tokens=max_tokens,
-    )
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
 
-    return response.choices[0].message.content.strip()
+
+def _summary_prompt(content: str) -> dict:
+    return {
+        "system_prompt": SUMMARY_SYSTEM_PROMPT,
+        "user_prompt": SUMMARY_USER_PROMPT.format(content=content[:4000]),
+        "temperature": 0.1,   # deterministic
+        "max_tokens": 120,
+    }
+
+
+def _linkedin_prompt(content: str) -> dict:
+    return {
+        "system_prompt": LINKEDIN_SYSTEM_PROMPT,
+        "user_prompt": LINKEDIN_USER_PROMPT.format(content=content[:4000]),
+        "temperature": 0.3,
+        "max_tokens": 120,
+    }
 
 
 def generate_summary(content: str) -> str:
@@ -98,14 +139,7 @@ def generate_summary(content: str) -> str:
     if not content:
         return ""
 
-    prompt = SUMMARY_USER_PROMPT.format(content=content[:4000])
-
-    return _call_groq(
-        system_prompt=SUMMARY_SYSTEM_PROMPT,
-        user_prompt=prompt,
-        temperature=0.1,   # deterministic
-        max_tokens=120,
-    )
+    return _call_groq(**_summary_prompt(content))
 
 
 def generate_linkedin_caption(content: str) -> str:
@@ -116,14 +150,21 @@ def generate_linkedin_caption(content: str) -> str:
     if not content:
         return ""
 
-    prompt = LINKEDIN_USER_PROMPT.format(content=content[:4000])
+    return _call_groq(**_linkedin_prompt(content))
 
-    return _call_groq(
-        system_prompt=LINKEDIN_SYSTEM_PROMPT,
-        user_prompt=prompt,
-        temperature=0.3,
-        max_tokens=120,
-    )
+
+async def generate_summary_async(content: str) -> str:
+    if not content:
+        return ""
+
+    return await _call_groq_async(**_summary_prompt(content))
+
+
+async def generate_linkedin_caption_async(content: str) -> str:
+    if not content:
+        return ""
+
+    return await _call_groq_async(**_linkedin_prompt(content))
 
 
 # --------------------------------------------------
@@ -151,3 +192,26 @@ def summarize_news_item(title: str, content: Optional[str]) -> dict:
         "summary": summary,
         "linkedin_caption": linkedin_caption,
     }
+
+
+async def summarize_news_item_async(title: str, content: Optional[str]) -> dict:
+    """
+    summarize_news_item with the summary and caption requested
+    concurrently (same fallback).
+    """
+
+    base_text = f"{title}\n\n{content or ''}"
+
+    try:
+        summary, linkedin_caption = await asyncio.gather(
+            generate_summary_async(base_text),
+            generate_linkedin_caption_async(base_text),
+        )
+    except Exception as e:
+        summary = (content or title)[:300]
+        linkedin_caption = ""
+
+    return {
+        "summary": summary,
+        "linkedin_caption": linkedin_caption,
+    }
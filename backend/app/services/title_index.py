@@ -0,0 +1,321 @@
+# backend/app/services/title_index.py
+
+"""
+Near-duplicate title index (MinHash + LSH).
+
+Replaces the full-table title scan in deduper.check_duplicate:
+
+    title → byte 3-gram shingles → MinHash signature (120 hashes)
+          → 24 bands of 5 rows → one 32-bit key per band
+
+24 × 5 puts the LSH threshold near Jaccard 0.5, which is about where
+a SequenceMatcher ratio of 0.90 lands for scattered character edits.
+
+Titles sharing any band key are candidates; only those are compared
+with SequenceMatcher. Lookup is O(bands · log N).
+
+Layout (memory ≈ 12 bytes × bands × titles):
+- main:  one sorted uint64 array of (band << 32 | key) + parallel int32
+         ids, so a lookup is a single vectorized searchsorted
+- delta: dict key → [ids] for small incremental inserts, merged into
+         main once it grows past MERGE_EVERY (bulk loads go straight
+         to main)
+
+The index is process-wide (get_title_index), snapshotted to
+DEDUP_INDEX_PATH, and catches up from news_items by id (sync) on load
+and before every check_duplicate lookup, so titles committed by other
+processes (API refresh vs worker) are candidates too.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+_SHIFT32 = np.uint64(32)
+_MASK32 = np.uint64(0xFFFFFFFF)
+
+
+def _normalize(title: str) -> bytes:
+    # At least 3 bytes, so every title has one shingle
+    return " ".join(title.lower().split()).encode("utf-8").ljust(3, b"\0")
+
+
+def _shingles(titles: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Byte 3-grams (packed into 24-bit ints) of a batch of titles,
+    concatenated, plus each title's start offset into the result.
+    """
+    encoded = [_normalize(t) for t in titles]
+    lengths = np.fromiter((len(e) for e in encoded), dtype=np.int64, count=len(encoded))
+    ends = np.cumsum(lengths)
+
+    data = np.frombuffer(b"".join(encoded), dtype=np.uint8).astype(np.uint64)
+    grams = (data[:-2] << np.uint64(16)) | (data[1:-1] << np.uint64(8)) | data[2:]
+
+    # Drop the two grams straddling each title boundary
+    keep = np.ones(len(grams), dtype=bool)
+    keep[ends[:-1] - 2] = False
+    keep[ends[:-1] - 1] = False
+
+    offsets = ends - lengths - 2 * np.arange(len(encoded))
+    return grams[keep], offsets
+
+
+class TitleIndex:
+
+    MERGE_EVERY = 20_000      # delta titles before folding into main
+    SAVE_EVERY = 1_000        # new titles before sync() rewrites the snapshot
+    BATCH = 500               # titles per vectorized signature batch
+
+    def __init__(self, num_perm: int = 120, bands: int = 24, seed: int = 1, path: Optional[str] = None):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.seed = seed
+        self.path = path
+
+        # Multiply-shift hashes: h(x) = ((a * x + b) mod 2^64) >> 32, a odd
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(0, 2**64, size=(num_perm, 1), dtype=np.uint64) | np.uint64(1)
+        self._b = rng.integers(0, 2**64, size=(num_perm, 1), dtype=np.uint64)
+        self._band_mult = rng.integers(0, 2**64, size=self.rows, dtype=np.uint64) | np.uint64(1)
+
+        # Sorted main arrays: (band << 32 | key) and the matching ids
+        self._keys = np.empty(0, dtype=np.uint64)
+        self._ids = np.empty(0, dtype=np.int32)
+        self._staged: List[Tuple[np.ndarray, np.ndarray]] = []  # bulk adds, sorted in lazily
+        self._delta: Dict[int, List[int]] = {}                    # small adds
+        self._delta_size = 0
+        self._band_prefix = np.arange(bands, dtype=np.uint64) << _SHIFT32
+
+        self.max_id = 0
+        self.size = 0
+        self._unsaved = 0
+        self._lock = threading.RLock()
+
+    # -------------------------
+    # Hashing
+    # -------------------------
+    def band_keys(self, titles: Sequence[str]) -> np.ndarray:
+        """
+        (len(titles), bands) uint32 LSH keys, computed in vectorized batches.
+        """
+        out = np.empty((len(titles), self.bands), dtype=np.uint32)
+
+        for start in range(0, len(titles), self.BATCH):
+            batch = titles[start:start + self.BATCH]
+            grams, offsets = _shingles(batch)
+
+            hashed = (self._a * grams[None, :] + self._b) >> _SHIFT32          # (num_perm, total)
+            signatures = np.minimum.reduceat(hashed, offsets, axis=1).T        # (n, num_perm)
+
+            rows = signatures.reshape(len(batch), self.bands, self.rows)
+            acc = (rows * self._band_mult).sum(axis=2, dtype=np.uint64)         # wraps mod 2^64
+            out[start:start + len(batch)] = ((acc ^ (acc >> np.uint64(29))) & _MASK32).astype(np.uint32)
+
+        return out
+
+    def _combined_keys(self, titles: Sequence[str]) -> np.ndarray:
+        """
+        (len(titles), bands) uint64 keys, unique across bands.
+        """
+        return self.band_keys(titles).astype(np.uint64) | self._band_prefix
+
+    # -------------------------
+    # Updates
+    # -------------------------
+    def add_many(self, rows: Iterable[Tuple[int, str]]) -> int:
+        rows = [(i, t) for i, t in rows if t]
+        if not rows:
+            return 0
+
+        keys = self._combined_keys([t for _, t in rows])
+        ids = np.fromiter((i for i, _ in rows), dtype=np.int32, count=len(rows))
+
+        with self._lock:
+            if len(rows) >= self.BATCH:
+                self._staged.append((keys.ravel(), np.repeat(ids, self.bands)))
+            else:
+                for item_id, item_keys in zip(ids.tolist(), keys.tolist()):
+                    for key in item_keys:
+                        self._delta.setdefault(key, []).append(item_id)
+                self._delta_size += len(rows)
+
+            self.max_id = max(self.max_id, int(ids.max()))
+            self.size += len(rows)
+            self._unsaved += len(rows)
+
+            if self._delta_size >= self.MERGE_EVERY:
+                self._merge()
+
+        return len(rows)
+
+    def add(self, item_id: int, title: str) -> None:
+        self.add_many([(item_id, title)])
+
+    def _merge(self) -> None:
+        """
+        Fold staged bulk adds and the delta dict into the sorted main arrays.
+        """
+        if not self._staged and not self._delta_size:
+            return
+
+        parts_keys = [self._keys] + [k for k, _ in self._staged]
+        parts_ids = [self._ids] + [i for _, i in self._staged]
+        if self._delta:
+            pairs = [(key, item_id) for key, ids in self._delta.items() for item_id in ids]
+            parts_keys.append(np.fromiter((k for k, _ in pairs), dtype=np.uint64, count=len(pairs)))
+            parts_ids.append(np.fromiter((i for _, i in pairs), dtype=np.int32, count=len(pairs)))
+
+        keys = np.concatenate(parts_keys)
+        order = np.argsort(keys, kind="stable")
+
+        self._keys = keys[order]
+        self._ids = np.concatenate(parts_ids)[order]
+        self._staged = []
+        self._delta = {}
+        self._delta_size = 0
+
+    # -------------------------
+    # Lookup
+    # -------------------------
+    def candidates(self, title: str) -> List[int]:
+        """
+        Ids of stored titles sharing at least one band with `title`, ascending.
+        """
+        if not title:
+            return []
+
+        query = self._combined_keys([title])[0]
+        found = set()
+
+        with self._lock:
+            if self._staged:
+                self._merge()
+
+            lo = np.searchsorted(self._keys, query, side="left")
+            hi = np.searchsorted(self._keys, query, side="right")
+            for band in np.flatnonzero(hi > lo).tolist():
+                found.update(self._ids[lo[band]:hi[band]].tolist())
+
+            if self._delta:
+                for key in query.tolist():
+                    found.update(self._delta.get(key, ()))
+
+        return sorted(found)
+
+    # -------------------------
+    # Persistence
+    # -------------------------
+    def sync(self, db: Session, batch_size: int = 5_000) -> int:
+        """
+        Index news_items rows newer than max_id (inserted by any process).
+        """
+        added = 0
+        while True:
+            rows = (
+                db.query(NewsItem.id, NewsItem.title)
+                .filter(NewsItem.id > self.max_id)
+                .order_by(NewsItem.id)
+                .limit(batch_size)
+                .all()
+            )
+            if not rows:
+                break
+            added += self.add_many(rows)
+            # Titles may be empty; still move past the batch
+            self.max_id = max(self.max_id, rows[-1][0])
+
+        if self._unsaved >= self.SAVE_EVERY:
+            self.save()
+        return added
+
+    def save(self) -> None:
+        if not self.path:
+            return
+
+        with self._lock:
+            self._merge()
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as f:
+                np.savez(
+                    f,
+                    keys=self._keys,
+                    ids=self._ids,
+                    meta=np.array([self.num_perm, self.bands, self.seed, self.max_id, self.size], dtype=np.int64),
+                )
+            os.replace(tmp, self.path)
+            self._unsaved = 0
+
+    def load(self) -> bool:
+        """
+        Restore a snapshot written with the same hashing parameters.
+        """
+        if not self.path or not os.path.exists(self.path):
+            return False
+
+        try:
+            with np.load(self.path) as data:
+                num_perm, bands, seed, max_id, size = data["meta"].tolist()
+                if (num_perm, bands, seed) != (self.num_perm, self.bands, self.seed):
+                    logger.warning("Title index snapshot has other parameters — rebuilding")
+                    return False
+                keys, ids = data["keys"], data["ids"]
+        except Exception as e:
+            logger.warning(f"Title index snapshot unreadable ({e}) — rebuilding")
+            return False
+
+        with self._lock:
+            self._keys, self._ids = keys, ids
+            self._staged, self._delta, self._delta_size = [], {}, 0
+            self.max_id, self.size = max_id, size
+        return True
+
+    def memory_bytes(self) -> int:
+        return self._keys.nbytes + self._ids.nbytes
+
+
+_index: Optional[TitleIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_title_index(db: Session) -> TitleIndex:
+    """
+    Process-wide index: snapshot + catch-up on first use, then reused.
+    """
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            started = time.monotonic()
+            index = TitleIndex(path=settings.DEDUP_INDEX_PATH)
+            restored = index.load()
+            if restored and index.max_id > (db.query(func.max(NewsItem.id)).scalar() or 0):
+                # Table was reset since the snapshot; ids would be reused
+                index = TitleIndex(path=settings.DEDUP_INDEX_PATH)
+                restored = False
+            added = index.sync(db)
+            logger.info(
+                f"Title index ready: {index.size} titles "
+                f"({'snapshot + ' if restored else ''}{added} indexed) "
+                f"in {time.monotonic() - started:.1f}s"
+            )
+            _index = index
+
+    return _index
@@ -0,0 +1,316 @@
+# backend/app/services/url_filter.py
+
+"""
+Persistent Bloom filter of stored canonical URL hashes.
+
+In steady state nearly every fetched entry is already stored, and each
+one used to cost a slot in the URL lookup query. find_existing_urls
+now asks this filter first:
+
+    not in filter → definitely new, no DB lookup
+    in filter     → possibly stored, checked in the DB as before
+
+A Bloom filter has no false negatives, so URL dedup stays exact; false
+positives only cost the lookup they would have cost anyway, and are
+counted (stats()).
+
+The bit array lives in a memory-mapped file (URL_FILTER_PATH), so a
+worker restart loads it instantly and processes on one host share it.
+Like the title index it catches up from news_items by id (sync, one
+`id > max_id` query), and find_existing_urls syncs before every screen,
+so rows inserted by any process are covered. Sized for
+URL_FILTER_CAPACITY URLs at URL_FILTER_ERROR_RATE; once the table
+outgrows that, the false-positive rate climbs —
+`python -m app.tasks.maintenance rebuild-url-filter` resizes it.
+
+File layout: 64-byte header (magic, hash count, bit count, URL count,
+max indexed id) followed by the bit array.
+"""
+
+import fcntl
+import logging
+import math
+import mmap
+import os
+import struct
+import threading
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem
+from app.utils.urls import url_hash as compute_url_hash
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+MAGIC = b"URLBLOOM"
+HEADER = struct.Struct("<8sIIQQQ")  # magic, version, hashes, bits, count, max_id
+HEADER_SIZE = 64
+VERSION = 1
+
+_BIT_MASKS = (1 << np.arange(8, dtype=np.uint8)).astype(np.uint8)
+
+
+def _hash_pairs(hashes: List[str]) -> np.ndarray:
+    """
+    (n, 2) uint64 halves of 32-hex-char URL hashes.
+    """
+    return np.frombuffer(bytes.fromhex("".join(hashes)), dtype=">u8").astype(np.uint64).reshape(-1, 2)
+
+
+class UrlFilter:
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mm: Optional[mmap.mmap] = None
+        self._file = None
+
+        # Counters since this process opened the filter
+        self.queries = 0
+        self.definitely_new = 0
+        self.possible_hits = 0
+        self.false_positives = 0
+
+    # -------------------------
+    # File handling
+    # -------------------------
+    @staticmethod
+    def create(path: str, capacity: int, error_rate: float) -> None:
+        """
+        Write an empty filter sized for `capacity` URLs at `error_rate`.
+        """
+        bits = int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        bits = (bits + 7) // 8 * 8
+        hashes = max(1, round(bits / capacity * math.log(2)))
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, VERSION, hashes, bits, 0, 0).ljust(HEADER_SIZE, b"\0"))
+            f.truncate(HEADER_SIZE + bits // 8)
+
+    def open(self) -> None:
+        self.close()
+        self._file = open(self.path, "r+b")
+        self._mm = mmap.mmap(self._file.fileno(), 0)
+        self._inode = os.fstat(self._file.fileno()).st_ino
+
+        magic, version, self.hashes, self.bits, _, _ = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{self.path} is not a URL filter file")
+        if len(self._mm) != HEADER_SIZE + self.bits // 8:
+            self.close()
+            raise ValueError(f"{self.path} is truncated")
+
+        self._array = np.frombuffer(self._mm, dtype=np.uint8, offset=HEADER_SIZE)
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._array = None
+            self._mm.close()
+            self._file.close()
+            self._mm = self._file = None
+
+    def _reopen_if_replaced(self) -> None:
+        # A rebuild swaps the file in with os.replace
+        try:
+            if os.stat(self.path).st_ino != self._inode:
+                self.open()
+        except FileNotFoundError:
+            pass
+
+    def _header(self) -> tuple:
+        return HEADER.unpack_from(self._mm, 0)
+
+    @property
+    def count(self) -> int:
+        return self._header()[4]
+
+    @property
+    def max_id(self) -> int:
+        return self._header()[5]
+
+    @property
+    def capacity(self) -> int:
+        # URLs the bit array holds at URL_FILTER_ERROR_RATE
+        return int(self.bits * math.log(2) ** 2 / -math.log(settings.URL_FILTER_ERROR_RATE))
+
+    def _set_header(self, count: int, max_id: int) -> None:
+        HEADER.pack_into(self._mm, 0, MAGIC, VERSION, self.hashes, self.bits, count, max_id)
+
+    # -------------------------
+    # Bits
+    # -------------------------
+    def _positions(self, hashes: List[str]):
+        """
+        Byte offsets and bit masks of every hash's k bits
+        (double hashing: h1 + i·h2 mod bits).
+        """
+        pairs = _hash_pairs(hashes)
+        steps = np.arange(self.hashes, dtype=np.uint64)
+        positions = (pairs[:, :1] + steps * (pairs[:, 1:] | np.uint64(1))) % np.uint64(self.bits)
+        return (positions >> np.uint64(3)).astype(np.int64), _BIT_MASKS[(positions & np.uint64(7)).astype(np.int64)]
+
+    def add_many(self, hashes: Iterable[str]) -> int:
+        hashes = [h for h in hashes if h]
+        if not hashes:
+            return 0
+        offsets, masks = self._positions(hashes)
+        np.bitwise_or.at(self._array, offsets.ravel(), masks.ravel())
+        return len(hashes)
+
+    def contains_many(self, hashes: List[str]) -> np.ndarray:
+        """
+        Bool per hash: False = definitely never added.
+        """
+        if not hashes:
+            return np.zeros(0, dtype=bool)
+        offsets, masks = self._positions(hashes)
+        return ((self._array[offsets] & masks) != 0).all(axis=1)
+
+    # -------------------------
+    # Lookup accounting
+    # -------------------------
+    def screen(self, hashes: List[str]) -> np.ndarray:
+        """
+        contains_many() for a lookup batch, with counters.
+        """
+        with self._lock:
+            maybe = self.contains_many(hashes)
+        hits = int(maybe.sum())
+        self.queries += len(hashes)
+        self.possible_hits += hits
+        self.definitely_new += len(hashes) - hits
+        return maybe
+
+    def record_false_positives(self, n: int) -> None:
+        self.false_positives += n
+
+    def stats(self) -> Dict:
+        with self._lock:
+            _, _, hashes, bits, count, max_id = self._header()
+            fill = float(np.unpackbits(self._array).mean())
+
+        actually_new = self.definitely_new + self.false_positives
+        return {
+            "path": self.path,
+            "size_bytes": HEADER_SIZE + bits // 8,
+            "hashes": hashes,
+            "urls": count,
+            "capacity": self.capacity,
+            "max_id": max_id,
+            "fill_ratio": round(fill, 4),
+            "expected_fp_rate": fill ** hashes,
+            "queries": self.queries,
+            "definitely_new": self.definitely_new,
+            "possible_hits": self.possible_hits,
+            "false_positives": self.false_positives,
+            "observed_fp_rate": self.false_positives / actually_new if actually_new else 0.0,
+        }
+
+    # -------------------------
+    # Catch-up from news_items
+    # -------------------------
+    def sync(self, db: Session, batch_size: int = 10_000) -> int:
+        """
+        Add URLs of news_items rows newer than max_id (inserted by any process).
+        """
+        added = 0
+        with self._lock:
+            self._reopen_if_replaced()
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            try:
+                count, max_id = self.count, self.max_id
+                while True:
+                    rows = (
+                        db.query(NewsItem.id, NewsItem.url, NewsItem.url_hash)
+                        .filter(NewsItem.id > max_id)
+                        .order_by(NewsItem.id)
+                        .limit(batch_size)
+                        .all()
+                    )
+                    if not rows:
+                        break
+                    # Rows stored before url_hash existed are hashed here
+                    added += self.add_many(hashed or compute_url_hash(url) for _, url, hashed in rows)
+                    max_id = rows[-1][0]
+                    self._set_header(count + added, max_id)
+            finally:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+
+        if added and self.count > self.capacity:
+            logger.warning(
+                f"URL filter holds {self.count} URLs, over its capacity — "
+                f"run `python -m app.tasks.maintenance rebuild-url-filter`"
+            )
+        return added
+
+
+
+def rebuild_url_filter(db: Session, path: Optional[str] = None, capacity: Optional[int] = None) -> UrlFilter:
+    """
+    Build a fresh filter from every stored URL (sized for at least twice
+    the current row count) and swap it in atomically.
+    """
+    path = path or settings.URL_FILTER_PATH
+    rows = db.query(func.count(NewsItem.id)).scalar() or 0
+    capacity = capacity or max(settings.URL_FILTER_CAPACITY, 2 * rows)
+
+    tmp = path + ".tmp"
+    UrlFilter.create(tmp, capacity, settings.URL_FILTER_ERROR_RATE)
+    url_filter = UrlFilter(tmp)
+    url_filter.open()
+    try:
+        url_filter.sync(db)
+        url_filter._mm.flush()
+    finally:
+        url_filter.close()
+
+    os.replace(tmp, path)
+    url_filter.path = path
+    url_filter.open()
+    return url_filter
+
+
+_filter: Optional[UrlFilter] = None
+_filter_failed = False
+_filter_lock = threading.Lock()
+
+
+def get_url_filter(db: Session) -> Optional[UrlFilter]:
+    """
+    Process-wide filter (None when URL_FILTER is off or the file is
+    unusable): mapped on first use, rebuilt when missing, then synced.
+    """
+    global _filter, _filter_failed
+
+    if not settings.URL_FILTER or _filter_failed:
+        return None
+
+    with _filter_lock:
+        if _filter is None and not _filter_failed:
+            try:
+                url_filter = UrlFilter(settings.URL_FILTER_PATH)
+                try:
+                    url_filter.open()
+                    db_max_id = db.query(func.max(NewsItem.id)).scalar() or 0
+                    if url_filter.max_id > db_max_id:
+                        # Table was reset since the file was written
+                        url_filter.close()
+                        url_filter = rebuild_url_filter(db)
+                except (FileNotFoundError, ValueError) as e:
+                    logger.info(f"URL filter unavailable ({e}) — rebuilding")
+                    url_filter = rebuild_url_filter(db)
+                added = url_filter.sync(db)
+                logger.info(f"URL filter ready: {url_filter.count} URLs ({added} synced)")
+                _filter = url_filter
+            except OSError as e:
+                logger.warning(f"URL filter disabled: {e}")
+                _filter_failed = True
+
+    return _filter
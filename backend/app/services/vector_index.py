@@ -0,0 +1,186 @@
+# backend/app/services/vector_index.py
+
+"""
+In-memory vector index for semantic dedup.
+
+One contiguous float32 matrix of L2-normalized embeddings (cosine =
+dot product) plus a parallel id array. Search is exact: top_k()
+from utils/similarity.py (chunked matmul + argpartition).
+
+- add() appends in place; capacity doubles, so appends are amortized O(1)
+- max_items keeps only the newest rows (ids grow with insert time)
+- sync() catches up from news_items by id, like the title / search
+  indexes, so items another process stored (API refresh vs worker) are
+  compared against too; rows add()ed here are skipped when it reaches them
+
+Exact search over the recent-items window (tens of thousands of rows)
+is a few milliseconds per batch, so no IVF / ANN structure is needed.
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem
+from app.utils.similarity import normalize_rows, top_k
+
+logger = logging.getLogger(__name__)
+settings = get_settings()
+
+
+class VectorIndex:
+
+    def __init__(self, dim: int, capacity: int = 1024, max_items: Optional[int] = None):
+        self.dim = dim
+        self.max_items = max_items
+        self._vectors = np.empty((capacity, dim), dtype=np.float32)
+        self._ids = np.empty(capacity, dtype=np.int64)
+        self.size = 0
+        self.max_id = 0  # news_items synced up to here
+        self._added: Set[int] = set()  # add()ed ids past max_id (sync skips them)
+        self._lock = threading.Lock()
+        self._sync_lock = threading.Lock()  # one catch-up at a time
+
+    def add(self, ids: Sequence[int], vectors) -> None:
+        """
+        Append rows directly (items this process just stored).
+        """
+        vectors = normalize_rows(vectors)
+        n = len(ids)
+        if n == 0:
+            return
+        if vectors.shape != (n, self.dim):
+            raise ValueError(f"expected {n} vectors of dim {self.dim}, got {vectors.shape}")
+
+        with self._lock:
+            self._append(ids, vectors)
+            self._added.update(int(item_id) for item_id in ids if item_id > self.max_id)
+
+    def _append(self, ids: Sequence[int], vectors: np.ndarray) -> None:
+        # Caller holds self._lock
+        n = len(ids)
+        needed = self.size + n
+        if needed > len(self._ids):
+            capacity = max(needed, 2 * len(self._ids))
+            grown = np.empty((capacity, self.dim), dtype=np.float32)
+            grown[:self.size] = self._vectors[:self.size]
+            self._vectors = grown
+            grown_ids = np.empty(capacity, dtype=np.int64)
+            grown_ids[:self.size] = self._ids[:self.size]
+            self._ids = grown_ids
+
+        self._vectors[self.size:needed] = vectors
+        self._ids[self.size:needed] = ids
+        self.size = needed
+
+        if self.max_items and self.size > self.max_items:
+            drop = self.size - self.max_items
+            self._vectors[:self.max_items] = self._vectors[drop:self.size]
+            self._ids[:self.max_items] = self._ids[drop:self.size]
+            self.size = self.max_items
+
+    def search(self, queries, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Top-k by cosine for each query row.
+        Returns (ids, scores), both (n_queries, k); id -1 / score -inf pad
+        when the index holds fewer than k vectors.
+        """
+        with self._lock:
+            rows, scores = top_k(normalize_rows(queries), self._vectors[:self.size], k)
+            ids = np.where(rows >= 0, self._ids[rows], -1)
+
+        return ids, scores
+
+    def sync(self, db: Session, since: Optional[datetime] = None, batch_size: int = 5_000) -> int:
+        """
+        Add embedded, non-duplicate news_items rows newer than max_id
+        (and retrieved since `since`, for the initial build).
+        """
+        with self._sync_lock:
+            added = 0
+            while True:
+                query = (
+                    db.query(NewsItem.id, NewsItem.embedding)
+                    .filter(NewsItem.id > self.max_id)
+                    .filter(NewsItem.embedding.isnot(None))
+                    .filter(NewsItem.is_duplicate.isnot(True))
+                )
+                if since is not None:
+                    query = query.filter(NewsItem.retrieved_at >= since)
+                rows = query.order_by(NewsItem.id).limit(batch_size).all()
+                if not rows:
+                    break
+
+                with self._lock:
+                    fresh = [
+                        (item_id, embedding) for item_id, embedding in rows
+                        if item_id not in self._added and len(embedding) == self.dim
+                    ]
+                    if fresh:
+                        self._append(
+                            [item_id for item_id, _ in fresh],
+                            normalize_rows(np.stack([embedding for _, embedding in fresh])),
+                        )
+                        added += len(fresh)
+                    self.max_id = rows[-1][0]
+                    self._added = {item_id for item_id in self._added if item_id > self.max_id}
+            return added
+
+
+_index: Optional[VectorIndex] = None
+_index_lock = threading.Lock()
+
+
+def build_vector_index(db: Session) -> VectorIndex:
+    """
+    Rebuild from stored embeddings of recent, non-duplicate items.
+    """
+    since = datetime.utcnow() - timedelta(days=settings.SEMANTIC_DEDUP_WINDOW_DAYS)
+    index = VectorIndex(settings.EMBEDDING_DIM, max_items=settings.SEMANTIC_DEDUP_MAX_ITEMS)
+
+    # Rows up to here are either in the window or too old: later syncs
+    # (no `since`) must start past them, even when the window is empty
+    newest = db.query(func.max(NewsItem.id)).scalar() or 0
+    index.sync(db, since=since)
+    index.max_id = max(index.max_id, newest)
+    return index
+
+
+def get_vector_index(db: Session) -> VectorIndex:
+    """
+    Process-wide index: rebuilt from the DB on first use (startup),
+    then appended to by the ingestion pipeline and synced per chunk
+    (SemanticDeduper.mark).
+    """
+    global _index
+
+    with _index_lock:
+        if _index is None:
+            _index = build_vector_index(db)
+            logger.info(f"Vector index ready: {_index.size} recent item(s)")
+
+    return _index
+
+
+def warm_semantic_dedup() -> None:
+    """
+    Startup hook (SEMANTIC_DEDUP): warm the embedding model and rebuild
+    the index, so the first ingestion chunk doesn't pay for either.
+    """
+    from app.models.db import SessionLocal
+    from app.services.ingestion.embeddings import warm_embedder
+
+    warm_embedder()
+
+    db = SessionLocal()
+    try:
+        index = get_vector_index(db)
+    finally:
+        db.close()
+    print(f"✅ Vector index loaded ({index.size} recent items).")
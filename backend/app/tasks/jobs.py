@@ -9,57 +9,40 @@ Reusable ingestion logic triggered by:
 """
 
 import logging
+from typing import Dict, List, Optional
+
 from sqlalchemy.orm import Session
 
 from app.models.db import SessionLocal
-from app.services.ingestion.fetcher import fetch_all_sources
-from app.services.ingestion.parsers import parse_raw_items
-from app.services.normalizer import normalize_items
-from app.services.deduper import is_duplicate
-from app.services.summarizer import summarize_news_item
-from app.models.orm_models import NewsItem
+from app.services.clustering import compact_clusters
+from app.services.ingestion.schedule import AdaptivePollScheduler, run_ingestion_cycle
 
 logger = logging.getLogger(__name__)
 
 
-def run_news_ingestion_job():
+def run_news_ingestion_job(
+    sources: Optional[List[Dict]] = None,
+    poll_scheduler: Optional[AdaptivePollScheduler] = None,
+):
+    """
+    sources:        only fetch these (default: all active sources)
+    poll_scheduler: when given, learns publish rates from this cycle's
+                    items and schedules each polled source's next fetch
+
+    Items are streamed and committed in chunks, so a failure mid-cycle
+    keeps everything committed before it.
+    """
     logger.info(" Starting ingestion job")
 
     db: Session = SessionLocal()
 
     try:
-        raw_items = fetch_all_sources()
-        parsed_items = parse_raw_items(raw_items)
-        normalized_items = normalize_items(parsed_items)
-
-        inserted, skipped = 0, 0
-
-        for item in normalized_items:
-            if is_duplicate(db, item["title"], item["url"]):
-                skipped += 1
-                continue
-
-            summary = summarize_news_item(
-                title=item["title"],
-                content=item.get("content")
-            )
-
-            news = NewsItem(
-                source_name=item.get("source_name"),
-                title=item["title"],
-                summary=summary,
-                author=item.get("author"),
-                url=item["url"],
-                published_at=item.get("published_at"),
-                content=item.get("content"),
-                is_duplicate=False,
-            )
-
-            db.add(news)
-            inserted += 1
-
-        db.commit()
-        logger.info(f" Inserted={inserted}, Skipped={skipped}")
+        result = run_ingestion_cycle(db, sources=sources, poll_scheduler=poll_scheduler)
+
+        logger.info(
+            f" Inserted={result['inserted']}, Skipped={result['duplicates']}, "
+            f"UnchangedSources={result['fetch'].get('unchanged', 0)}"
+        )
 
     except Exception as e:
         db.rollback()
@@ -67,3 +50,21 @@ def run_news_ingestion_job():
 
     finally:
         db.close()
+
+
+def run_cluster_compaction_job():
+    """
+    Merge story clusters that drifted together (see services/clustering.py).
+    """
+    db: Session = SessionLocal()
+
+    try:
+        merged = compact_clusters(db)
+        logger.info(f" Cluster compaction merged {merged} cluster(s)")
+
+    except Exception as e:
+        db.rollback()
+        logger.exception(" Cluster compaction failed", exc_info=e)
+
+    finally:
+        db.close()
@@ -0,0 +1,84 @@
+# backend/app/tasks/maintenance.py
+
+"""
+Maintenance commands (run from backend/):
+
+    python -m app.tasks.maintenance rebuild-url-filter [--capacity N]
+    python -m app.tasks.maintenance url-filter-stats
+    python -m app.tasks.maintenance backfill-url-hashes
+
+rebuild-url-filter backfills url_hash first (see backfill-url-hashes).
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from app.models.db import SessionLocal, init_db
+from app.services.deduper import backfill_url_hashes
+from app.services.url_filter import get_url_filter, rebuild_url_filter
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def rebuild_url_filter_command(args) -> int:
+    db = SessionLocal()
+    try:
+        updated = backfill_url_hashes(db)
+        if updated:
+            print(f"✅ Backfilled url_hash on {updated} news item(s)")
+        url_filter = rebuild_url_filter(db, capacity=args.capacity)
+        print(f"✅ URL filter rebuilt: {url_filter.count} URLs, capacity {url_filter.capacity}")
+        print(json.dumps(url_filter.stats(), indent=2))
+    finally:
+        db.close()
+    return 0
+
+
+def url_filter_stats_command(args) -> int:
+    db = SessionLocal()
+    try:
+        url_filter = get_url_filter(db)
+        if url_filter is None:
+            print("URL filter is disabled (URL_FILTER=false).")
+            return 1
+        print(json.dumps(url_filter.stats(), indent=2))
+    finally:
+        db.close()
+    return 0
+
+
+def backfill_url_hashes_command(args) -> int:
+    db = SessionLocal()
+    try:
+        updated = backfill_url_hashes(db)
+        print(f"✅ Backfilled url_hash on {updated} news item(s)")
+    finally:
+        db.close()
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    rebuild = commands.add_parser("rebuild-url-filter", help="rebuild the seen-URL Bloom filter from the DB")
+    rebuild.add_argument("--capacity", type=int, default=None,
+                         help="URLs to size for (default: max(URL_FILTER_CAPACITY, 2 x rows))")
+    rebuild.set_defaults(handler=rebuild_url_filter_command)
+
+    stats = commands.add_parser("url-filter-stats", help="print the filter's size, fill and counters")
+    stats.set_defaults(handler=url_filter_stats_command)
+
+    backfill = commands.add_parser("backfill-url-hashes", help="hash the URLs of rows stored before url_hash existed")
+    backfill.set_defaults(handler=backfill_url_hashes_command)
+
+    args = parser.parse_args()
+    init_db()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
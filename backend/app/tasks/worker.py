@@ -3,32 +3,67 @@
 """
 Lightweight background worker.
 
-Runs the ingestion job at a fixed interval.
-Meets <15m latency requirement without Redis/RQ.
+Polls each source on its own adaptive interval (learned from the
+feed's publish rate) instead of one fixed interval for everything.
+Busy feeds are polled down to every POLL_MIN_INTERVAL_SECONDS,
+so the <15m latency requirement holds without Redis/RQ.
 """
 
 import time
 import logging
-from app.tasks.jobs import run_news_ingestion_job
+
+from app.config import get_settings
+from app.models.db import SessionLocal
+from app.services.ingestion.schedule import AdaptivePollScheduler
+from app.services.ingestion.embeddings import warm_embedder
+from app.services.url_filter import get_url_filter
+from app.services.vector_index import warm_semantic_dedup
+from app.tasks.jobs import run_cluster_compaction_job, run_news_ingestion_job
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 15 minutes (BRD requirement)
-REFRESH_INTERVAL_SECONDS = 15 * 60
+settings = get_settings()
 
 
 def start_worker():
     logger.info(" Background ingestion worker started")
 
+    poll_scheduler = AdaptivePollScheduler()
+
+    db = SessionLocal()
+    try:
+        poll_scheduler.restore(db)
+        get_url_filter(db)  # map + catch up before the first cycle
+    except Exception as e:
+        logger.exception(" Could not restore polling state", exc_info=e)
+    finally:
+        db.close()
+
+    if settings.SEMANTIC_DEDUP:
+        warm_semantic_dedup()
+    elif settings.EMBEDDINGS or settings.STORY_CLUSTERING:
+        warm_embedder()
+
+    next_compaction = time.monotonic() + settings.CLUSTER_COMPACT_INTERVAL_SECONDS
+
     while True:
-        try:
-            run_news_ingestion_job()
-        except Exception as e:
-            logger.exception(" Worker execution failed", exc_info=e)
+        due = poll_scheduler.pop_due()
+
+        if due:
+            logger.info(f" Polling {len(due)} due source(s)")
+            try:
+                run_news_ingestion_job(sources=due, poll_scheduler=poll_scheduler)
+            except Exception as e:
+                logger.exception(" Worker execution failed", exc_info=e)
+
+        if settings.STORY_CLUSTERING and time.monotonic() >= next_compaction:
+            run_cluster_compaction_job()
+            next_compaction = time.monotonic() + settings.CLUSTER_COMPACT_INTERVAL_SECONDS
 
-        logger.info(f"⏳ Sleeping for {REFRESH_INTERVAL_SECONDS} seconds")
-        time.sleep(REFRESH_INTERVAL_SECONDS)
+        sleep_for = min(poll_scheduler.seconds_until_next(), settings.POLL_TICK_SECONDS)
+        logger.info(f"⏳ Sleeping for {sleep_for:.0f} seconds")
+        time.sleep(sleep_for)
 
 
 if __name__ == "__main__":
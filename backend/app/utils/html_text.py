@@ -0,0 +1,178 @@
+# backend/app/utils/html_text.py
+
+"""
+Fast HTML → text conversion.
+
+Drop-in for
+
+    BeautifulSoup(markup, "html.parser").get_text(separator=" ", strip=True)
+
+without building a tree. Text is collected straight from the html.parser
+token stream, with BeautifulSoup's rules for which strings count as text
+(no comments / doctype / PIs, nothing inside script, style, template,
+rt, rp) and for where one string ends and the next begins. Entity tables
+and tag sets are read from the installed bs4, so both paths stay in sync.
+
+Markup that html.parser rejects falls back to BeautifulSoup itself.
+"""
+
+from html.parser import HTMLParser
+import re
+from typing import List, Optional
+
+from bs4 import BeautifulSoup
+from bs4.builder import HTMLParserTreeBuilder
+from bs4.dammit import EntitySubstitution, UnicodeDammit
+
+_builder = HTMLParserTreeBuilder()
+
+EMPTY_ELEMENT_TAGS = frozenset(_builder.empty_element_tags or ())
+SKIP_TEXT_TAGS = frozenset(_builder.string_containers)  # script, style, template, rt, rp
+ENTITY_TO_CHARACTER = EntitySubstitution.HTML_ENTITY_TO_CHARACTER
+
+_DECIMAL_REFERENCE = re.compile("^([0-9]+)(.*)")
+_HEX_REFERENCE = re.compile("^([0-9a-f]+)(.*)")
+
+
+def _dereference_charref(name: str) -> str:
+    """
+    Numeric reference → text, the way bs4's html.parser builder does it
+    (trailing junk after the digits is kept as plain text).
+    """
+    base, reg = 10, _DECIMAL_REFERENCE
+    if name[:1] in ("x", "X"):
+        name, base, reg = name[1:], 16, _HEX_REFERENCE
+
+    extra = ""
+    try:
+        number = int(name, base)
+    except ValueError:
+        match = reg.search(name)
+        if match is None:
+            return name
+        number, extra = int(match.group(1), base), match.group(2)
+
+    return UnicodeDammit.numeric_character_reference(number)[0] + extra
+
+
+class _TextCollector(HTMLParser):
+    """
+    Streams text strings out of markup.
+
+    Mirrors the tree bs4 would build only as far as text is concerned:
+    a stack of open tag names (for skip-text containers) and the list of
+    void tags whose stray end tag must not split the surrounding string.
+    """
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.strings: List[str] = []
+        self._data: List[str] = []
+        self._open: List[str] = []
+        self._skip_depth = 0  # open script/style/template/rt/rp tags
+        self._closed_void: List[str] = []
+
+    # --- string boundaries ---
+    def _end_data(self) -> None:
+        if self._data:
+            if not self._skip_depth:
+                self.strings.append("".join(self._data))
+            self._data = []
+
+    def handle_data(self, data: str) -> None:
+        self._data.append(data)
+
+    def handle_entityref(self, name: str) -> None:
+        character = ENTITY_TO_CHARACTER.get(name)
+        self._data.append(character if character is not None else "&" + name)
+
+    def handle_charref(self, name: str) -> None:
+        self._data.append(_dereference_charref(name))
+
+    # --- tags ---
+    def _push(self, tag: str) -> None:
+        self._open.append(tag)
+        if tag in SKIP_TEXT_TAGS:
+            self._skip_depth += 1
+
+    def _pop_to(self, tag: str) -> None:
+        if tag not in self._open:
+            return
+        while self._open:
+            popped = self._open.pop()
+            if popped in SKIP_TEXT_TAGS:
+                self._skip_depth -= 1
+            if popped == tag:
+                return
+
+    def handle_starttag(self, tag, attrs) -> None:
+        self._end_data()
+        if tag in EMPTY_ELEMENT_TAGS:
+            # Closed immediately; a later </tag> is swallowed
+            self._closed_void.append(tag)
+            return
+        self._push(tag)
+
+    def handle_startendtag(self, tag, attrs) -> None:
+        self._end_data()
+
+    def handle_endtag(self, tag) -> None:
+        if tag in self._closed_void:
+            self._closed_void.remove(tag)
+            return
+        self._end_data()
+        self._pop_to(tag)
+
+    # --- non-text nodes ---
+    def handle_comment(self, data) -> None:
+        self._end_data()
+
+    def handle_decl(self, decl) -> None:
+        self._end_data()
+
+    def handle_pi(self, data) -> None:
+        self._end_data()
+
+    def unknown_decl(self, data) -> None:
+        self._end_data()
+        if data.upper().startswith("CDATA["):
+            # CDATA is text even inside skip containers
+            self.strings.append(data[len("CDATA["):])
+
+    def close(self) -> None:
+        super().close()
+        self._end_data()
+
+
+def _collapse(text: str) -> str:
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def soup_text(markup: str) -> str:
+    """
+    Reference implementation (BeautifulSoup tree + get_text).
+    """
+    soup = BeautifulSoup(markup, "html.parser")
+    return _collapse(soup.get_text(separator=" ", strip=True))
+
+
+def html_to_text(markup: Optional[str]) -> str:
+    """
+    Visible text of an HTML fragment, whitespace collapsed.
+    Identical to soup_text(), several times faster.
+    """
+    if not markup:
+        return ""
+
+    # Plain text: nothing to parse
+    if "<" not in markup and "&" not in markup:
+        return _collapse(markup)
+
+    parser = _TextCollector()
+    try:
+        parser.feed(markup)
+        parser.close()
+    except Exception:
+        return soup_text(markup)
+
+    return _collapse(" ".join(s.strip() for s in parser.strings if s.strip()))
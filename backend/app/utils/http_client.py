@@ -0,0 +1,46 @@
+# backend/app/utils/http_client.py
+
+"""
+Shared HTTP client helpers.
+
+All outbound feed / API traffic goes through pooled clients built here,
+so connections are reused instead of opened per request.
+"""
+
+import httpx
+
+USER_AGENT = "Mozilla/5.0 (AI News Aggregator; +https://example.com)"
+
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+}
+
+
+def build_async_client(
+    max_connections: int = 32,
+    timeout: float = 20.0,
+) -> httpx.AsyncClient:
+    """
+    Async client shared by every request of one fetch cycle.
+    Must be used inside the event loop that created it.
+    """
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        timeout=httpx.Timeout(timeout),
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+        follow_redirects=True,
+    )
+
+
+def build_sync_client(timeout: float = 20.0) -> httpx.Client:
+    """
+    Blocking counterpart of build_async_client (sequential fetch mode).
+    """
+    return httpx.Client(
+        headers=DEFAULT_HEADERS,
+        timeout=httpx.Timeout(timeout),
+        follow_redirects=True,
+    )
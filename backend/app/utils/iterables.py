@@ -0,0 +1,21 @@
+# backend/app/utils/iterables.py
+
+"""
+Small helpers for streaming pipelines.
+"""
+
+from typing import Iterable, Iterator, List
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """
+    Split a stream into lists of at most `size` items, lazily.
+    """
+    chunk: List = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
@@ -0,0 +1,120 @@
+# backend/app/utils/similarity.py
+
+"""
+Vectorized cosine similarity over embedding matrices.
+
+Everything works on contiguous float32 rows that are already
+L2-normalized (what EmbedderService produces), so cosine is a plain dot
+product and a whole comparison is one matmul:
+
+    cosine_scores(query, matrix)    (n,)      one query vs n rows
+    cosine_matrix(a, b)             (m, n)    every pair
+    top_k(queries, matrix, k)       (q, k)    best rows per query
+
+top_k walks the matrix in chunks of `chunk_rows`, keeping a running
+top k per query (argpartition, never a full sort), and takes the
+queries `query_rows` at a time, so the scratch memory is at most
+query_rows × chunk_rows whatever the corpus or query count (labelling
+a million rows against centroids is a million queries).
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+CHUNK_ROWS = 16_384
+QUERY_ROWS = 1_024
+
+
+def normalize_rows(vectors) -> np.ndarray:
+    """
+    Contiguous float32 copy with unit-length rows (zero rows stay zero).
+    """
+    matrix = np.array(vectors, dtype=np.float32, ndmin=2, order="C")
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    matrix /= norms
+    return matrix
+
+
+def _as_matrix(vectors) -> np.ndarray:
+    return np.ascontiguousarray(np.atleast_2d(vectors), dtype=np.float32)
+
+
+def cosine_scores(query, matrix) -> np.ndarray:
+    """
+    (n,) cosine of one unit query against n unit rows.
+    """
+    return _as_matrix(matrix) @ np.asarray(query, dtype=np.float32).ravel()
+
+
+def cosine_matrix(a, b=None) -> np.ndarray:
+    """
+    (len(a), len(b)) cosine of every pair of unit rows (b defaults to a).
+    """
+    a = _as_matrix(a)
+    return a @ (a if b is None else _as_matrix(b)).T
+
+
+def _select(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Column indices and scores of each row's k best, best first.
+    """
+    if k < scores.shape[1]:
+        top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    else:
+        top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+    top_scores = np.take_along_axis(scores, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind="stable")
+    return np.take_along_axis(top, order, axis=1), np.take_along_axis(top_scores, order, axis=1)
+
+
+def top_k(
+    queries,
+    matrix,
+    k: int = 1,
+    chunk_rows: int = CHUNK_ROWS,
+    valid: Optional[np.ndarray] = None,
+    query_rows: int = QUERY_ROWS,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Best k rows of `matrix` by cosine for each query row.
+
+    Returns (indices, scores), both (n_queries, k), best first; index -1 /
+    score -inf pad when fewer than k rows qualify. `valid` (bool per
+    matrix row) excludes rows without copying the matrix.
+    """
+    queries = _as_matrix(queries)
+    matrix = _as_matrix(matrix)
+    n = len(queries)
+
+    indices = np.full((n, k), -1, dtype=np.int64)
+    scores = np.full((n, k), -np.inf, dtype=np.float32)
+    if n == 0 or k <= 0 or len(matrix) == 0:
+        return indices, scores
+
+    for start in range(0, n, query_rows):
+        block = slice(start, start + query_rows)
+        indices[block], scores[block] = _top_k_block(queries[block], matrix, k, chunk_rows, valid)
+    return indices, scores
+
+
+def _top_k_block(queries, matrix, k, chunk_rows, valid) -> Tuple[np.ndarray, np.ndarray]:
+    n = len(queries)
+    indices = np.full((n, k), -1, dtype=np.int64)
+    scores = np.full((n, k), -np.inf, dtype=np.float32)
+
+    for start in range(0, len(matrix), chunk_rows):
+        sims = queries @ matrix[start:start + chunk_rows].T
+        if valid is not None:
+            sims[:, ~valid[start:start + chunk_rows]] = -np.inf
+
+        # Merge the chunk's best with the running best
+        chunk_top, chunk_scores = _select(sims, min(k, sims.shape[1]))
+        merged_indices = np.concatenate([indices, chunk_top + start], axis=1)
+        merged_scores = np.concatenate([scores, chunk_scores], axis=1)
+        best, scores = _select(merged_scores, k)
+        indices = np.take_along_axis(merged_indices, best, axis=1)
+
+    indices[np.isneginf(scores)] = -1
+    return indices, scores
@@ -0,0 +1,81 @@
+# backend/app/utils/urls.py
+
+"""
+URL canonicalization + fixed-width URL hashes.
+
+Two links to the same article should hash the same even when they
+differ by tracking parameters, "www.", a trailing slash, http vs
+https, default ports, fragments or query-parameter order.
+"""
+
+import hashlib
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+URL_HASH_LENGTH = 32  # hex chars (128-bit blake2b)
+
+# Query parameters that never change which page is served
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "_hsenc", "_hsmi", "ref", "ref_src", "ref_url", "cmpid", "ocid", "spm",
+    "guccounter", "guce_referrer", "guce_referrer_sig", "s_kwcid", "trk", "smid",
+}
+TRACKING_PREFIXES = ("utm_", "pk_", "mtm_")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def _is_tracking(param: str) -> bool:
+    param = param.lower()
+    return param in TRACKING_PARAMS or param.startswith(TRACKING_PREFIXES)
+
+
+def canonicalize_url(url: Optional[str]) -> str:
+    """
+    Normalized form of a link, used for dedup only (the original URL is
+    what gets stored and shown).
+    """
+    if not url:
+        return ""
+
+    url = url.strip()
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    if scheme not in ("http", "https"):
+        return url
+    scheme = "https"
+
+    host = (parts.hostname or "").rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    if port and port not in DEFAULT_PORTS.values():
+        host = f"{host}:{port}"
+
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/") or "/"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking(key)
+    )
+
+    return urlunsplit((scheme, host, path, urlencode(query), ""))
+
+
+def url_hash(url: Optional[str]) -> Optional[str]:
+    """
+    Fixed-width hash of the canonical URL (None for an empty URL).
+    """
+    canonical = canonicalize_url(url)
+    if not canonical:
+        return None
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=URL_HASH_LENGTH // 2).hexdigest()
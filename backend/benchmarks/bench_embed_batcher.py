@@ -0,0 +1,115 @@
+# backend/benchmarks/bench_embed_batcher.py
+
+"""
+Micro-batched vs one-forward-pass-per-request single-text embedding.
+
+C concurrent asyncio clients each embed R texts back to back:
+
+  direct   every request runs its own encode on a 1-thread executor
+  batched  requests go through MicroBatcher (app/services/embed_batcher.py)
+
+Reports throughput, mean batch size and p50/p99 request latency.
+
+By default encode is a cost model (fixed per-call overhead + per-text
+cost, as measured for MiniLM on CPU), so the benchmark runs without the
+model; --model uses the real EmbedderService.
+
+Usage (from backend/):
+    python -m benchmarks.bench_embed_batcher [--clients 32] [--requests 50]
+        [--window-ms 5] [--max-batch 64] [--model]
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+
+import numpy as np
+
+from app.services.embed_batcher import MicroBatcher
+from benchmarks.bench_title_index import TitleGenerator
+
+
+def cost_model(overhead_ms: float, per_text_ms: float) -> Callable[[List[str]], np.ndarray]:
+    def encode(texts: List[str]) -> np.ndarray:
+        time.sleep((overhead_ms + per_text_ms * len(texts)) / 1000)
+        return np.zeros((len(texts), 384), dtype=np.float32)
+    return encode
+
+
+async def drive(embed, clients: int, requests: int, texts: List[str]) -> List[float]:
+    latencies: List[float] = []
+
+    async def client(c: int) -> None:
+        for r in range(requests):
+            started = time.perf_counter()
+            await embed(texts[(c * requests + r) % len(texts)])
+            latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(client(c) for c in range(clients)))
+    return latencies
+
+
+def report(name: str, latencies: List[float], seconds: float, extra: str = "") -> None:
+    ms = np.array(latencies) * 1000
+    print(
+        f"  {name:<8} {len(ms) / seconds:8.1f} req/s   "
+        f"p50 {np.percentile(ms, 50):7.1f} ms   p99 {np.percentile(ms, 99):7.1f} ms{extra}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=64)
+    parser.add_argument("--overhead-ms", type=float, default=4.0)
+    parser.add_argument("--per-text-ms", type=float, default=0.4)
+    parser.add_argument("--model", action="store_true", help="encode with the real model")
+    args = parser.parse_args()
+
+    if args.model:
+        from app.services.embedder import EmbedderService
+
+        EmbedderService.warmup()
+        encode = lambda texts: EmbedderService.generate_batch_matrix(texts, batch_size=len(texts))
+    else:
+        encode = cost_model(args.overhead_ms, args.per_text_ms)
+
+    gen = TitleGenerator(random.Random(11))
+    texts = [gen.title() for _ in range(args.clients * args.requests)]
+    print(f"{args.clients} clients x {args.requests} requests, window {args.window_ms} ms, max batch {args.max_batch}")
+
+    executor = ThreadPoolExecutor(max_workers=1)
+
+    async def direct(text: str):
+        return await asyncio.get_running_loop().run_in_executor(executor, encode, [text])
+
+    started = time.perf_counter()
+    latencies = asyncio.run(drive(direct, args.clients, args.requests, texts))
+    report("direct", latencies, time.perf_counter() - started)
+    executor.shutdown()
+
+    batcher = MicroBatcher(encode, max_batch=args.max_batch, window_ms=args.window_ms)
+    started = time.perf_counter()
+    latencies = asyncio.run(drive(batcher.embed_async, args.clients, args.requests, texts))
+    seconds = time.perf_counter() - started
+    stats = batcher.stats()
+    batcher.close()
+    report("batched", latencies, seconds, f"   mean batch {stats['mean_batch']}")
+
+    # A lone caller pays at most the window
+    batcher = MicroBatcher(encode, max_batch=args.max_batch, window_ms=args.window_ms)
+    started = time.perf_counter()
+    latencies = asyncio.run(drive(batcher.embed_async, 1, args.requests, texts))
+    report("1 client", latencies, time.perf_counter() - started)
+    batcher.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+# backend/benchmarks/bench_embedder_backends.py
+
+"""
+Embedder inference backends on CPU: speed and agreement with fp32.
+
+For each backend (torch fp32 reference, torch-int8, onnx) reports:
+
+  load       cold model load + warmup batch
+  items/s    encode throughput over the sample texts (best of --repeat)
+  cosine     per-text cosine between the backend's vector and the fp32
+             vector (mean / min) — how interchangeable the vectors are
+  top-1      share of texts whose nearest neighbour (among the other
+             texts) is the same as with fp32
+
+Texts are stored news titles when the DB has enough, else synthetic
+headlines (benchmarks/bench_title_index.py).
+
+Usage (from backend/):
+    python -m benchmarks.bench_embedder_backends [--backends torch,torch-int8,onnx]
+        [--threads 4] [--batch-size 64] [--texts 2000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from typing import List
+
+import numpy as np
+
+from app.services.embedder import load_backend
+
+
+def sample_texts(n: int) -> List[str]:
+    try:
+        from app.models.db import SessionLocal
+        from app.models.orm_models import NewsItem
+
+        db = SessionLocal()
+        try:
+            titles = [t for (t,) in db.query(NewsItem.title).order_by(NewsItem.id.desc()).limit(n)]
+        finally:
+            db.close()
+        if len(titles) >= n // 2:
+            return titles
+    except Exception:
+        pass
+
+    from benchmarks.bench_title_index import TitleGenerator
+
+    gen = TitleGenerator(random.Random(7))
+    return [gen.title() for _ in range(n)]
+
+
+def nearest(vectors: np.ndarray) -> np.ndarray:
+    sims = vectors @ vectors.T
+    np.fill_diagonal(sims, -np.inf)
+    return sims.argmax(axis=1)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backends", default="torch,torch-int8,onnx")
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--texts", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    texts = sample_texts(args.texts)
+    print(f"{len(texts)} texts, batch {args.batch_size}, threads {args.threads or 'default'}")
+
+    reference = None
+    reference_nn = None
+    backends = args.backends.split(",")
+    if backends[0] != "torch":
+        backends.insert(0, "torch")  # fp32 is the reference
+
+    for backend in backends:
+        started = time.perf_counter()
+        try:
+            model = load_backend(backend, args.threads)
+        except Exception as e:
+            print(f"  {backend:<11} unavailable: {e}")
+            continue
+        model.encode(texts[:8], convert_to_numpy=True, normalize_embeddings=True)
+        load = time.perf_counter() - started
+
+        best = float("inf")
+        for _ in range(args.repeat):
+            t0 = time.perf_counter()
+            vectors = model.encode(
+                texts, batch_size=args.batch_size, convert_to_numpy=True, normalize_embeddings=True
+            ).astype(np.float32)
+            best = min(best, time.perf_counter() - t0)
+
+        line = f"  {backend:<11} load {load:5.1f}s   {len(texts) / best:8.1f} items/s"
+        if reference is None:
+            reference, reference_nn = vectors, nearest(vectors)
+            line += "   (reference)"
+        else:
+            cosine = np.einsum("ij,ij->i", vectors, reference)
+            top1 = float(np.mean(nearest(vectors) == reference_nn))
+            line += f"   cosine mean {cosine.mean():.4f} min {cosine.min():.4f}   top-1 {top1:.1%}"
+        print(line)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
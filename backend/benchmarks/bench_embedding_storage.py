@@ -0,0 +1,88 @@
+# backend/benchmarks/bench_embedding_storage.py
+
+"""
+Embedding storage: JSON column vs packed float32 / int8 bytes.
+
+Reports, for N random unit vectors of EMBEDDING_DIM:
+
+  size       bytes per stored vector and shrink factor vs JSON
+  load       SELECT every row from a SQLite table and stack one
+             (N, dim) float32 matrix (what the vector index rebuild does)
+  error      int8 only: |cosine(dequantized) - cosine(original)| over
+             random pairs
+
+Usage (from backend/):
+    python -m benchmarks.bench_embedding_storage [--rows 20000]
+"""
+
+import argparse
+import json
+import sys
+import time
+
+import numpy as np
+from sqlalchemy import JSON, Column, Integer, MetaData, Table, create_engine, select
+
+from app.config import get_settings
+from app.models.types import VectorType
+from app.utils.vectors import decode_vector, encode_vector
+
+settings = get_settings()
+
+
+def load_time(vectors: np.ndarray, column_type) -> float:
+    engine = create_engine("sqlite://")
+    table = Table("vectors", MetaData(), Column("id", Integer, primary_key=True), Column("v", column_type))
+    table.metadata.create_all(engine)
+
+    values = [v.tolist() for v in vectors] if isinstance(column_type, JSON) else list(vectors)
+    with engine.begin() as conn:
+        conn.execute(table.insert(), [{"id": i, "v": v} for i, v in enumerate(values)])
+
+    started = time.perf_counter()
+    with engine.connect() as conn:
+        rows = conn.execute(select(table.c.v)).scalars().all()
+    matrix = np.asarray(rows, dtype=np.float32) if isinstance(column_type, JSON) else np.stack(rows)
+    elapsed = time.perf_counter() - started
+
+    assert matrix.shape == vectors.shape
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    vectors = rng.standard_normal((args.rows, settings.EMBEDDING_DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    json_size = np.mean([len(json.dumps(v.tolist())) for v in vectors[:1000]])
+    json_load = load_time(vectors, JSON())
+    print(f"{args.rows:,} vectors × {settings.EMBEDDING_DIM}-d")
+    print(f"  json     {json_size:7.0f} B/vector            load {json_load * 1000:8.1f} ms")
+
+    for storage in ("float32", "int8"):
+        size = len(encode_vector(vectors[0], storage))
+        load = load_time(vectors, VectorType(storage))
+        print(
+            f"  {storage:<8} {size:7.0f} B/vector  {json_size / size:5.1f}x   "
+            f"load {load * 1000:8.1f} ms  {json_load / load:5.1f}x"
+        )
+
+    # Quantization error on cosine similarity
+    decoded = np.stack([decode_vector(encode_vector(v, "int8")) for v in vectors[:2000]])
+    a, b = rng.integers(0, len(decoded), size=(2, 20_000))
+    exact = np.einsum("ij,ij->i", vectors[a], vectors[b])
+    approx = np.einsum("ij,ij->i", decoded[a], decoded[b]) / (
+        np.linalg.norm(decoded[a], axis=1) * np.linalg.norm(decoded[b], axis=1)
+    )
+    error = np.abs(exact - approx)
+    print(f"  int8 cosine error: mean {error.mean():.5f}  max {error.max():.5f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+# backend/benchmarks/bench_groq_client.py
+
+"""
+Per-call vs pooled Groq clients against a local mock server.
+
+A keep-alive HTTP/1.1 server on localhost answers every request with a
+canned chat completion after --latency-ms. Modes:
+
+  per-call  new Groq client per request (the old _call_groq)
+  pooled    GroqPool.client shared by --threads threads
+  async     GroqPool.async_client(), --threads concurrent tasks
+
+Reports throughput, p50/p99 latency and TCP connections opened. The mock
+is plain HTTP, so the per-call cost here excludes the TLS handshake the
+real API adds on every new connection.
+
+Usage (from backend/):
+    python -m benchmarks.bench_groq_client [--requests 400] [--threads 8]
+        [--latency-ms 20]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+import numpy as np
+
+# Settings are read on import; the mock needs neither a DB nor a real key
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("GROQ_API_KEY", "mock")
+
+from groq import Groq  # noqa: E402
+
+from app.services.groq_client import GroqPool  # noqa: E402
+
+COMPLETION = json.dumps({
+    "id": "chatcmpl-mock",
+    "object": "chat.completion",
+    "created": 0,
+    "model": "llama-3.1-8b-instant",
+    "choices": [{
+        "index": 0,
+        "message": {"role": "assistant", "content": "A short factual summary."},
+        "finish_reason": "stop",
+    }],
+    "usage": {"prompt_tokens": 50, "completion_tokens": 8, "total_tokens": 58},
+}).encode()
+
+
+class MockGroq(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    latency = 0.0
+    connections = 0
+    _lock = threading.Lock()
+
+    def setup(self):
+        super().setup()
+        with MockGroq._lock:
+            MockGroq.connections += 1
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        time.sleep(self.latency)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(COMPLETION)))
+        self.end_headers()
+        self.wfile.write(COMPLETION)
+
+    def log_message(self, *args):
+        pass
+
+
+def call(client) -> float:
+    started = time.perf_counter()
+    client.chat.completions.create(
+        model="llama-3.1-8b-instant",
+        messages=[{"role": "user", "content": "Summarize: ..."}],
+        max_tokens=120,
+    )
+    return time.perf_counter() - started
+
+
+def report(name: str, latencies: List[float], seconds: float, connections: int) -> None:
+    ms = np.array(latencies) * 1000
+    print(
+        f"  {name:<9} {len(ms) / seconds:8.1f} req/s   p50 {np.percentile(ms, 50):6.1f} ms   "
+        f"p99 {np.percentile(ms, 99):6.1f} ms   {connections} connection(s)"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    MockGroq.latency = args.latency_ms / 1000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockGroq)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    print(f"{args.requests} requests, {args.threads} concurrent, mock latency {args.latency_ms} ms ({base_url})")
+
+    def run(name: str, fn) -> None:
+        MockGroq.connections = 0
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            latencies = list(pool.map(lambda _: fn(), range(args.requests)))
+        report(name, latencies, time.perf_counter() - started, MockGroq.connections)
+
+    def per_call() -> float:
+        # Building the client is the cost being measured
+        started = time.perf_counter()
+        with Groq(api_key="mock", base_url=base_url) as client:
+            call(client)
+        return time.perf_counter() - started
+
+    run("per-call", per_call)
+
+    groq_pool = GroqPool(api_key="mock", base_url=base_url, max_connections=args.threads)
+    run("pooled", lambda: call(groq_pool.client))
+
+    async def drive() -> List[float]:
+        client = groq_pool.async_client()
+        limit = asyncio.Semaphore(args.threads)
+
+        async def one() -> float:
+            async with limit:
+                started = time.perf_counter()
+                await client.chat.completions.create(
+                    model="llama-3.1-8b-instant",
+                    messages=[{"role": "user", "content": "Summarize: ..."}],
+                    max_tokens=120,
+                )
+                return time.perf_counter() - started
+
+        latencies = await asyncio.gather(*(one() for _ in range(args.requests)))
+        await groq_pool.aclose()
+        return latencies
+
+    MockGroq.connections = 0
+    started = time.perf_counter()
+    latencies = asyncio.run(drive())
+    report("async", latencies, time.perf_counter() - started, MockGroq.connections)
+
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
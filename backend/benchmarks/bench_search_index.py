@@ -0,0 +1,99 @@
+# backend/benchmarks/bench_search_index.py
+
+"""
+Semantic search index: build time, query latency and recall vs exact.
+
+Synthetic unit vectors with topic structure (items scattered around
+random topic centres, like headlines around stories) are added in
+ingestion-sized batches, so the IVF training / packing path is the one
+production takes (rebuilds run in the background; the slowest add()
+shows whether inserts ever wait for them). Queries are perturbed items;
+recall@k is measured against exact top_k over all rows.
+
+Usage (from backend/):
+    python -m benchmarks.bench_search_index [--items 1000000] [--queries 200]
+        [--probes 16,32,64] [--dim 384] [--noise 0.6]
+"""
+
+import argparse
+import resource
+import sys
+import time
+
+import numpy as np
+
+from app.services.search_index import SearchIndex
+from app.utils.similarity import normalize_rows, top_k
+
+
+def jitter(norm: float, shape, rng: np.random.Generator) -> np.ndarray:
+    # Gaussian offsets of expected length `norm`
+    return norm / np.sqrt(shape[1]) * rng.standard_normal(shape, dtype=np.float32)
+
+
+def synthetic(n: int, dim: int, topics: int, noise: float, rng: np.random.Generator, batch: int = 50_000):
+    centres = normalize_rows(rng.standard_normal((topics, dim), dtype=np.float32))
+    for start in range(0, n, batch):
+        size = min(batch, n - start)
+        vectors = centres[rng.integers(0, topics, size)] + jitter(noise, (size, dim), rng)
+        yield start, normalize_rows(vectors)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1_000_000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--dim", type=int, default=384)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--probes", default="16,32,64")
+    parser.add_argument(
+        "--noise", type=float, default=0.6,
+        help="item distance from its topic centre (0.6 ≈ cosine 0.86; ≥1.5 is close to isotropic)",
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(3)
+    index = SearchIndex(args.dim)
+
+    started = time.perf_counter()
+    slowest_add = 0.0
+    for start, vectors in synthetic(args.items, args.dim, max(100, args.items // 50), args.noise, rng):
+        ids = np.arange(start + 1, start + len(vectors) + 1)
+        t0 = time.perf_counter()
+        index.add(ids, vectors, np.zeros(len(ids), dtype=np.int32), ids.astype(np.float64))
+        slowest_add = max(slowest_add, time.perf_counter() - t0)
+    loaded = time.perf_counter() - started
+    index.wait_idle()
+    print(
+        f"{args.items} items, dim {args.dim}: added in {loaded:.1f}s (slowest add {slowest_add * 1000:.0f} ms), "
+        f"rebuilds done at {time.perf_counter() - started:.1f}s"
+    )
+    print(f"  {index.stats()}")
+
+    rows = index._rows
+    picks = rng.choice(rows.size, args.queries, replace=False)
+    queries = normalize_rows(rows.vectors[picks] + jitter(args.noise / 2, (args.queries, args.dim), rng))
+
+    started = time.perf_counter()
+    exact_rows, _ = top_k(queries, rows.vectors[:rows.size], args.k)
+    exact = [set(rows.ids[found].tolist()) for found in exact_rows]
+    print(f"  exact     {(time.perf_counter() - started) / args.queries * 1000:7.1f} ms/query (brute force)")
+
+    for probes in [int(p) for p in args.probes.split(",")]:
+        latencies, recall = [], []
+        for query, truth in zip(queries, exact):
+            t0 = time.perf_counter()
+            ids, _ = index.search(query, args.k, probes=probes)
+            latencies.append(time.perf_counter() - t0)
+            recall.append(len(truth & set(ids.tolist())) / args.k)
+        ms = np.array(latencies) * 1000
+        print(
+            f"  probes {probes:<3} p50 {np.percentile(ms, 50):6.2f} ms   p99 {np.percentile(ms, 99):6.2f} ms   "
+            f"recall@{args.k} {np.mean(recall):.3f}"
+        )
+    print(f"  peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
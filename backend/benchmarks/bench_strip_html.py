@@ -0,0 +1,106 @@
+# backend/benchmarks/bench_strip_html.py
+
+"""
+strip_html micro-benchmark over captured feed HTML.
+
+Collects every title / summary / content string from real feed bodies —
+the snapshot store (SNAPSHOT_CAPTURE=true) and/or feed files given on
+the command line — then times:
+
+  bs4        BeautifulSoup(...).get_text (the previous implementation)
+  fast       utils.html_text.html_to_text (no memo)
+  memo       parsers.strip_html (fast + memo, as called by the parsers)
+
+and checks that every output is identical to bs4.
+
+Usage (from backend/):
+    python -m benchmarks.bench_strip_html [--snapshots data/snapshots] [feed.xml ...]
+"""
+
+import argparse
+import glob
+import gzip
+import os
+import sys
+import time
+from typing import Callable, List
+
+import feedparser
+
+from app.services.ingestion.parsers import _strip_html_cached, strip_html
+from app.utils.html_text import html_to_text, soup_text
+
+
+def load_bodies(snapshot_dir: str, paths: List[str]) -> List[bytes]:
+    bodies = []
+    for path in glob.glob(os.path.join(snapshot_dir, "*", "objects", "*.gz")):
+        with gzip.open(path, "rb") as f:
+            bodies.append(f.read())
+    for path in paths:
+        with open(path, "rb") as f:
+            bodies.append(f.read())
+    return bodies
+
+
+def collect_strings(bodies: List[bytes]) -> List[str]:
+    """
+    The exact candidates safe_content() sees, in feed order.
+    """
+    strings = []
+    for body in bodies:
+        for entry in feedparser.parse(body).entries:
+            strings.append(entry.get("title"))
+            strings.append(entry.get("summary"))
+            for content in entry.get("content") or []:
+                strings.append(content.get("value"))
+    return [s for s in strings if s]
+
+
+def timed(label: str, fn: Callable[[str], str], strings: List[str], repeat: int, reset=None) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        if reset is not None:
+            reset()
+        started = time.perf_counter()
+        for s in strings:
+            fn(s)
+        best = min(best, time.perf_counter() - started)
+    per_item = best / len(strings) * 1e6
+    print(f"  {label:<6} {best * 1000:9.1f} ms   {per_item:8.1f} µs/string")
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("feeds", nargs="*", help="raw feed files (RSS / Atom)")
+    parser.add_argument("--snapshots", default=os.getenv("SNAPSHOT_DIR", "data/snapshots"))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    strings = collect_strings(load_bodies(args.snapshots, args.feeds))
+    if not strings:
+        print("No feed HTML found — capture snapshots or pass feed files.")
+        return 1
+
+    markup = sum(1 for s in strings if "<" in s or "&" in s)
+    print(f"{len(strings)} strings ({markup} with markup, {len(set(strings))} distinct)")
+
+    # Correctness first: byte-identical to the bs4 implementation
+    mismatches = [s for s in strings if html_to_text(s) != soup_text(s)]
+    if mismatches:
+        print(f"❌ {len(mismatches)} output mismatch(es), first: {mismatches[0][:200]!r}")
+        return 1
+    print("✅ outputs identical to bs4")
+
+    baseline = timed("bs4", soup_text, strings, args.repeat)
+    fast = timed("fast", html_to_text, strings, args.repeat)
+
+    # Memo: cold cache each repeat, so only in-run repeats (titles etc.) hit
+    memo = timed("memo", strip_html, strings, args.repeat, reset=_strip_html_cached.cache_clear)
+
+    print(f"Speed-up: fast {baseline / fast:.1f}x, memo {baseline / memo:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
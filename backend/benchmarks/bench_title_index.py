@@ -0,0 +1,141 @@
+# backend/benchmarks/bench_title_index.py
+
+"""
+Near-duplicate title lookup: MinHash/LSH index vs the old full scan.
+
+For each size (default 10k, 100k, 1M stored titles) reports:
+
+  build      signatures + sort, and index memory
+  lookup     LSH candidates + SequenceMatcher confirmation (the
+             check_duplicate title path, minus the DB round-trip)
+  recall     share of planted near-duplicates (ratio >= 0.90) detected
+  scan       the previous linear SequenceMatcher scan per lookup
+             (measured on up to 20k titles, extrapolated beyond)
+
+Titles are synthetic headline-like strings; near-duplicates are
+re-cased / suffixed, word-dropped or misspelled copies. "cand" is the
+mean candidate count for titles with no duplicate (pure LSH noise).
+
+Usage (from backend/):
+    python -m benchmarks.bench_title_index [--sizes 10000,100000,1000000] [--queries 500]
+"""
+
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import time
+
+from app.services.deduper import TITLE_SIMILARITY_THRESHOLD, is_similar_title, title_similarity
+from app.services.title_index import TitleIndex
+
+# English-like syllables → a Zipf-distributed 30k-word lexicon, so shingle
+# overlap between unrelated titles resembles real headlines
+SYLLABLES = (
+    "ba be bi bo bu ca co cu da de di do ed en er es fa fe fi fo ga ge go ha he hi "
+    "ho in is it la le li lo lu ma me mi mo mu na ne ni no nu on or pa pe pi po pu "
+    "ra re ri ro ru sa se si so st su ta te ti to tu un ur va ve vi wa we wi ya yo "
+    "za ing tion ment ness able ly al ous ter ble pro con com ex ar ch sh th ph"
+).split()
+
+
+class TitleGenerator:
+
+    def __init__(self, rng: random.Random, lexicon_size: int = 30_000):
+        self.rng = rng
+        lexicon = {
+            "".join(rng.choice(SYLLABLES) for _ in range(rng.choice([1, 2, 2, 3, 3, 4])))
+            for _ in range(lexicon_size)
+        }
+        self.lexicon = sorted(lexicon)
+        rng.shuffle(self.lexicon)
+        self.cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(self.lexicon))))
+
+    def title(self) -> str:
+        n = self.rng.randint(6, 12)
+        return " ".join(self.rng.choices(self.lexicon, cum_weights=self.cum_weights, k=n)).capitalize()
+
+    def near_duplicate(self, title: str) -> str:
+        rng = self.rng
+        kind = rng.randrange(4)
+        if kind == 0:
+            return title.upper() + rng.choice(["", " ...", "!", " | AI"])
+        if kind == 1:
+            words = title.split()
+            words.pop(rng.randrange(len(words)))
+            return " ".join(words)
+        # Scattered typos, up to the 0.90 boundary
+        chars = list(title)
+        for _ in range(max(1, len(chars) // rng.choice([40, 20, 15]))):
+            chars[rng.randrange(len(chars))] = rng.choice("abcdefghijklmnopqrstuvwxyz")
+        return "".join(chars)
+
+
+def run(size: int, n_queries: int, gen: TitleGenerator) -> None:
+    rng = gen.rng
+    titles = [gen.title() for _ in range(size)]
+
+    started = time.perf_counter()
+    index = TitleIndex()
+    index.add_many(enumerate(titles))
+    index._merge()
+    build = time.perf_counter() - started
+
+    # Planted near-duplicates that really are >= threshold
+    dup_queries = []
+    while len(dup_queries) < n_queries:
+        source = titles[rng.randrange(size)]
+        query = gen.near_duplicate(source)
+        if title_similarity(query, source) >= TITLE_SIMILARITY_THRESHOLD:
+            dup_queries.append(query)
+    fresh_queries = [gen.title() for _ in range(n_queries)]
+
+    latencies, candidate_counts, hits = [], [], 0
+    for n, query in enumerate(dup_queries + fresh_queries):
+        t0 = time.perf_counter()
+        ids = index.candidates(query)
+        is_dup = any(is_similar_title(query, titles[i]) for i in ids)
+        latencies.append(time.perf_counter() - t0)
+        if n < len(dup_queries):
+            hits += is_dup
+        else:
+            candidate_counts.append(len(ids))
+
+    # Old path: scan everything (capped, then extrapolated)
+    scan_size = min(size, 20_000)
+    scan_queries = fresh_queries[:3]
+    t0 = time.perf_counter()
+    for query in scan_queries:
+        for existing in titles[:scan_size]:
+            if title_similarity(query, existing) >= TITLE_SIMILARITY_THRESHOLD:
+                break
+    scan = (time.perf_counter() - t0) / len(scan_queries) * (size / scan_size)
+
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1e3
+    p99 = latencies[int(len(latencies) * 0.99)] * 1e3
+    print(
+        f"{size:>9,} titles | build {build:7.1f}s  {index.memory_bytes() / 2**20:7.1f} MiB | "
+        f"lookup p50 {p50:6.2f} ms  p99 {p99:6.2f} ms  cand {statistics.mean(candidate_counts):5.1f} | "
+        f"recall {hits / len(dup_queries):6.1%} | "
+        f"scan {scan * 1e3:9.1f} ms{' (extrap.)' if scan_size < size else ''}  "
+        f"→ {scan / statistics.mean(latencies):,.0f}x"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    gen = TitleGenerator(random.Random(args.seed))
+    for size in (int(s) for s in args.sizes.split(",")):
+        run(size, args.queries, gen)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,45 @@
+# backend/tests/conftest.py
+
+"""
+Shared fixtures. Run from backend/: python -m pytest -q
+
+Settings are read once per process at import time, so the environment
+is pointed at a throwaway SQLite file (shared by every session, like a
+real DB between processes) and data directory before `app` is imported.
+"""
+
+import os
+import sys
+import tempfile
+
+import pytest
+
+_DATA_DIR = tempfile.mkdtemp(prefix="news-tests-")
+
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_DATA_DIR, 'news.db')}"
+os.environ.setdefault("GROQ_API_KEY", "test")
+os.environ["URL_FILTER_PATH"] = os.path.join(_DATA_DIR, "url_filter.bloom")
+os.environ["DEDUP_INDEX_PATH"] = os.path.join(_DATA_DIR, "title_index.npz")
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.models.db import Base, SessionLocal, engine, init_db  # noqa: E402
+
+
+@pytest.fixture
+def session_factory():
+    """
+    Fresh tables; yields SessionLocal (open as many sessions as needed).
+    """
+    init_db()
+    yield SessionLocal
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture
+def db(session_factory):
+    session = session_factory()
+    try:
+        yield session
+    finally:
+        session.close()
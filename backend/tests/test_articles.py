@@ -0,0 +1,104 @@
+# backend/tests/test_articles.py
+
+import pytest
+
+from app.models.orm_models import ArticleCache, NewsItem, Source
+from app.services.ingestion import articles
+from app.services.ingestion.articles import ArticleExtractor
+
+TEXT = "Full article text. " * 40  # past ARTICLE_MIN_CHARS
+
+
+def _result(url: str, status: str = "ok", transient: bool = False, error: str = None) -> dict:
+    return {
+        "url": url,
+        "status": status,
+        "text": TEXT if status == "ok" else None,
+        "error": error,
+        "transient": transient,
+    }
+
+
+def _insert(session, urls) -> list:
+    session.add(Source(name="Example", url="https://example.com/feed"))
+    session.flush()
+    source_id = session.query(Source.id).scalar()
+    items = [
+        NewsItem(source_id=source_id, title=f"Story {i}", url=url, content="Teaser", summary="Teaser summary")
+        for i, url in enumerate(urls)
+    ]
+    session.add_all(items)
+    session.commit()
+    return [(news.id, news.url) for news in items]
+
+
+@pytest.fixture
+def extract(monkeypatch):
+    """
+    Replace the page fetcher; set `extract.results` (and optionally
+    `extract.before`, run inside the call) per test.
+    """
+    class Stub:
+        results = []
+        before = None
+
+    async def fake(urls):
+        if Stub.before is not None:
+            Stub.before()
+        return [r for r in Stub.results if r["url"] in urls]
+
+    monkeypatch.setattr(articles, "extract_articles_async", fake)
+    return Stub
+
+
+def test_transient_failures_are_not_cached(session_factory, db, extract):
+    batch = _insert(db, ["https://a.com/ok", "https://a.com/gone", "https://a.com/slow"])
+    extract.results = [
+        _result("https://a.com/ok"),
+        _result("https://a.com/gone", status="failed", error="404 Not Found"),
+        _result("https://a.com/slow", status="failed", transient=True, error="timed out after 15s"),
+    ]
+
+    ArticleExtractor(session_factory=session_factory)._process(batch)
+
+    cached = {row.url: row.status for row in db.query(ArticleCache)}
+    assert cached == {"https://a.com/ok": "ok", "https://a.com/gone": "failed"}
+
+
+def test_concurrent_cache_insert_keeps_the_batch(session_factory, db, extract):
+    batch = _insert(db, ["https://a.com/1", "https://a.com/2"])
+    extract.results = [_result("https://a.com/1"), _result("https://a.com/2")]
+
+    def other_worker():
+        session = session_factory()
+        session.add(ArticleCache(url="https://a.com/1", status="ok", text=TEXT))
+        session.commit()
+        session.close()
+
+    extract.before = other_worker
+
+    ArticleExtractor(session_factory=session_factory)._process(batch)
+
+    db.expire_all()
+    assert db.query(ArticleCache).count() == 2
+    assert [news.content for news in db.query(NewsItem).order_by(NewsItem.id)] == [TEXT, TEXT]
+
+
+def test_enriched_items_are_resummarized(session_factory, db, extract, monkeypatch):
+    batch = _insert(db, ["https://a.com/long", "https://a.com/short"])
+    extract.results = [_result("https://a.com/long"), _result("https://a.com/short", status="empty")]
+
+    prompts = []
+
+    async def fake_summary(content):
+        prompts.append(content)
+        return "Summary of the full text"
+
+    monkeypatch.setattr(articles, "generate_summary_async", fake_summary)
+
+    ArticleExtractor(session_factory=session_factory)._process(batch, summarize=True)
+
+    db.expire_all()
+    summaries = [news.summary for news in db.query(NewsItem).order_by(NewsItem.id)]
+    assert summaries == ["Summary of the full text", "Teaser summary"]
+    assert prompts == [f"Story 0\n\n{TEXT}"]
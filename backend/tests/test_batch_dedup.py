@@ -0,0 +1,91 @@
+# backend/tests/test_batch_dedup.py
+
+from datetime import datetime
+
+import pytest
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem
+from app.services import title_index as title_index_module
+from app.services.deduper import BatchDeduper
+from app.services.ingestion import pipeline
+from app.services.ingestion.items import FeedItem
+from app.services.ingestion.source_state import ensure_sources_exist
+from app.utils.urls import url_hash
+
+WIRE = {"name": "Wire", "url": "https://wire.example.com/feed", "type": "rss", "parser_key": "rss_generic", "active": True}
+BLOG = {"name": "Blog", "url": "https://blog.example.com/feed", "type": "rss", "parser_key": "rss_generic", "active": True}
+
+
+@pytest.fixture(autouse=True)
+def fresh_indexes(monkeypatch):
+    title_index_module._index = None
+    monkeypatch.setattr(get_settings(), "URL_FILTER", False)
+    yield
+    title_index_module._index = None
+
+
+def _item(source: dict, title: str, url: str) -> FeedItem:
+    return FeedItem(
+        source_name=source["name"],
+        source_url=source["url"],
+        parser_key=source["parser_key"],
+        title=title,
+        url=url,
+        url_hash=url_hash(url),
+        published_at=datetime(2026, 1, 1, 12, 0),
+        content=f"{title}. Body text.",
+    )
+
+
+def test_match_by_url_key_and_similar_title():
+    batch = BatchDeduper()
+    kept = object()
+    batch.add("OpenAI ships a new reasoning model", url_hash("https://a.com/story"), kept)
+
+    assert batch.match("Unrelated headline", url_hash("https://www.a.com/story/?utm_source=rss")) is kept
+    assert batch.match("OpenAI Ships A New Reasoning Model!", url_hash("https://b.com/other")) is kept
+    assert batch.match("Google releases a weather model", url_hash("https://b.com/other")) is None
+    assert batch.match("Google releases a weather model", None) is None
+
+
+def test_first_kept_item_wins():
+    batch = BatchDeduper()
+    first, second = object(), object()
+    batch.add("Chip export rules tightened", "same-key", first)
+    batch.add("Completely different story", "same-key", second)
+
+    assert batch.match("Something else entirely", "same-key") is first
+
+
+def test_pipeline_links_in_batch_copies_without_db_checks(db, monkeypatch):
+    source_map = ensure_sources_exist(db, [WIRE, BLOG])
+    items = [
+        _item(WIRE, "OpenAI ships a new reasoning model", "https://wire.example.com/openai"),
+        _item(BLOG, "OpenAI ships a new reasoning model!", "https://blog.example.com/openai-model"),
+        _item(BLOG, "Unrelated headline", "https://www.wire.example.com/openai/?utm_source=blog"),
+        _item(WIRE, "Google releases a weather model", "https://wire.example.com/weather"),
+    ]
+
+    checked = []
+    check_duplicate = pipeline.check_duplicate
+
+    def counting_check(**kwargs):
+        checked.append(kwargs["title"])
+        return check_duplicate(**kwargs)
+
+    monkeypatch.setattr(pipeline, "check_duplicate", counting_check)
+
+    stats = pipeline.run_ingestion_pipeline(db, iter(items), source_map, chunk_size=2)
+
+    assert (stats["inserted"], stats["duplicates"], stats["batch_duplicates"]) == (2, 2, 2)
+    # Copies never reach the DB title / URL check
+    assert checked == ["OpenAI ships a new reasoning model", "Google releases a weather model"]
+
+    rows = {news.url: news for news in db.query(NewsItem)}
+    original = rows["https://wire.example.com/openai"]
+    copy = rows["https://blog.example.com/openai-model"]
+    assert copy.is_duplicate and copy.duplicate_of == original.id
+    # Same canonical URL as the original: not stored a second time
+    assert "https://www.wire.example.com/openai/?utm_source=blog" not in rows
+    assert not rows["https://wire.example.com/weather"].is_duplicate
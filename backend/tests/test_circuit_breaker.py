@@ -0,0 +1,86 @@
+# backend/tests/test_circuit_breaker.py
+
+from datetime import datetime, timedelta
+
+from app.config import get_settings
+from app.models.orm_models import Source
+from app.services.ingestion.fetcher import _new_result, iter_fetch_results
+from app.services.ingestion.source_state import (
+    apply_fetch_result,
+    backoff_seconds,
+    ensure_sources_exist,
+    is_fetch_allowed,
+)
+
+settings = get_settings()
+THRESHOLD = settings.SOURCE_FAILURE_THRESHOLD
+BASE = settings.SOURCE_BACKOFF_BASE_SECONDS
+
+SOURCE = {
+    "name": "Flaky Feed",
+    "url": "https://flaky.example.com/feed.xml",
+    "type": "rss",
+    "parser_key": "rss_generic",
+    "active": True,
+}
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+def _result(status: str, error: str = None) -> dict:
+    result = _new_result(SOURCE)
+    result["status"] = status
+    result["error"] = error
+    return result
+
+
+def _fail(row: Source, now: datetime) -> None:
+    apply_fetch_result(row, _result("failed", "HTTP 503"), now=now)
+
+
+def test_backoff_doubles_from_threshold_and_is_capped():
+    assert [backoff_seconds(n) for n in range(THRESHOLD)] == [0] * THRESHOLD
+    assert backoff_seconds(THRESHOLD) == BASE
+    assert backoff_seconds(THRESHOLD + 1) == 2 * BASE
+    assert backoff_seconds(THRESHOLD + 2) == 4 * BASE
+    assert backoff_seconds(THRESHOLD + 1000) == settings.SOURCE_BACKOFF_MAX_SECONDS
+
+
+def test_breaker_opens_half_opens_and_closes():
+    row = Source(name=SOURCE["name"], url=SOURCE["url"], failure_count=0)
+
+    # Closed: failures below the threshold never skip a cycle
+    for _ in range(THRESHOLD - 1):
+        _fail(row, NOW)
+        assert is_fetch_allowed(row, NOW)
+
+    # Open: skipped until next_retry_at
+    _fail(row, NOW)
+    assert row.next_retry_at == NOW + timedelta(seconds=BASE)
+    assert row.last_error == "HTTP 503"
+    assert not is_fetch_allowed(row, NOW + timedelta(seconds=BASE - 1))
+
+    # Half-open: one probe; failing it doubles the backoff
+    probe_at = NOW + timedelta(seconds=BASE)
+    assert is_fetch_allowed(row, probe_at)
+    _fail(row, probe_at)
+    assert row.next_retry_at == probe_at + timedelta(seconds=2 * BASE)
+
+    # A successful probe (a 304 counts) closes it again
+    recovered_at = row.next_retry_at
+    apply_fetch_result(row, _result("not_modified"), now=recovered_at)
+    assert (row.failure_count, row.next_retry_at, row.last_error) == (0, None, None)
+    assert row.last_success_at == recovered_at
+    assert is_fetch_allowed(row, recovered_at)
+
+
+def test_open_sources_are_skipped_without_a_request(db):
+    ensure_sources_exist(db, [SOURCE])
+    row = db.query(Source).one()
+    row.failure_count = THRESHOLD
+    row.next_retry_at = datetime.utcnow() + timedelta(hours=1)
+    db.commit()
+
+    stats = {}
+    assert list(iter_fetch_results(db, [SOURCE], mode="sync", stats=stats)) == []
+    assert stats["backed_off"] == 1
+    assert stats["sources"] == 0
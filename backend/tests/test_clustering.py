@@ -0,0 +1,135 @@
+# backend/tests/test_clustering.py
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem, Source, StoryCluster
+from app.services.clustering import StoryClusterer, compact_clusters
+
+settings = get_settings()
+DIM = settings.EMBEDDING_DIM
+NOW = datetime.utcnow().replace(microsecond=0)
+
+
+def _unit(vector: np.ndarray) -> np.ndarray:
+    return (vector / np.linalg.norm(vector)).astype(np.float32)
+
+
+def _topic(seed: int) -> np.ndarray:
+    return _unit(np.random.default_rng(seed).standard_normal(DIM))
+
+
+def _near(topic: np.ndarray, seed: int, noise: float = 0.2) -> np.ndarray:
+    # Cosine to `topic` ≈ 1 / sqrt(1 + noise²) — well above CLUSTER_THRESHOLD
+    jitter = _unit(np.random.default_rng(seed).standard_normal(DIM))
+    return _unit(topic + noise * jitter)
+
+
+@pytest.fixture
+def source_id(db):
+    db.add(Source(name="Example", url="https://example.com/feed"))
+    db.commit()
+    return db.query(Source.id).scalar()
+
+
+def _run(db, source_id: int, stories, clusterer=None) -> list:
+    """
+    One ingestion chunk: stories = [(title, vector, published_at)].
+    """
+    clusterer = clusterer or StoryClusterer.load(db)
+    items = [
+        NewsItem(source_id=source_id, title=title, url=f"https://example.com/{title.replace(' ', '-')}", published_at=published)
+        for title, _, published in stories
+    ]
+    db.add_all(items)
+    clusterer.assign(db, items, np.stack([vector for _, vector, _ in stories]))
+    db.flush()
+    clusterer.write(db)
+    db.commit()
+    return items
+
+
+def test_similar_titles_share_a_cluster(db, source_id):
+    chips, rates = _topic(1), _topic(2)
+    items = _run(db, source_id, [
+        ("chip export rules tightened", _near(chips, 10), NOW - timedelta(hours=3)),
+        ("interest rates held", _near(rates, 11), NOW - timedelta(hours=2)),
+        ("new limits on chip exports", _near(chips, 12), NOW - timedelta(hours=1)),
+    ])
+
+    assert items[0].cluster_id == items[2].cluster_id != items[1].cluster_id
+    cluster = db.get(StoryCluster, items[0].cluster_id)
+    assert (cluster.label, cluster.size) == ("chip export rules tightened", 2)
+    assert cluster.first_seen_at == NOW - timedelta(hours=3)
+    assert cluster.last_seen_at == NOW - timedelta(hours=1)
+
+
+def test_next_run_joins_stored_cluster(db, source_id):
+    chips = _topic(1)
+    first = _run(db, source_id, [("chip export rules tightened", _near(chips, 10), NOW - timedelta(hours=2))])
+
+    later = _run(db, source_id, [("chip makers react to export rules", _near(chips, 11), NOW)])
+
+    assert later[0].cluster_id == first[0].cluster_id
+    assert db.query(StoryCluster).count() == 1
+    assert db.get(StoryCluster, first[0].cluster_id).size == 2
+
+
+def test_members_decay_with_half_life(db, source_id):
+    chips = _topic(1)
+    half_life = timedelta(hours=settings.CLUSTER_HALF_LIFE_HOURS)
+    start = NOW - half_life
+    items = _run(db, source_id, [
+        ("chip export rules tightened", _near(chips, 10), start),
+        ("chip makers react to export rules", _near(chips, 11), start + half_life),
+    ])
+
+    cluster = db.get(StoryCluster, items[0].cluster_id)
+    assert cluster.weight == pytest.approx(1.5)  # 0.5 (one half-life old) + 1
+
+
+def test_items_outside_the_window_open_a_new_cluster(db, source_id):
+    chips = _topic(1)
+    window = timedelta(hours=settings.CLUSTER_WINDOW_HOURS)
+    items = _run(db, source_id, [
+        ("chip export rules tightened", _near(chips, 10), NOW - window - timedelta(hours=2)),
+        ("chip export rules tightened again", _near(chips, 11), NOW),
+    ])
+
+    assert items[0].cluster_id != items[1].cluster_id
+
+
+def test_copies_inherit_their_original_cluster(db, source_id):
+    clusterer = StoryClusterer.load(db)
+    original, = _run(db, source_id, [("chip export rules tightened", _topic(1), NOW)], clusterer)
+
+    copy = NewsItem(source_id=source_id, title="Chip export rules tightened!", url="https://example.com/copy",
+                    is_duplicate=True, original=original)
+    db.add(copy)
+    clusterer.inherit(copy, original)
+    db.commit()
+
+    assert copy.cluster_id == original.cluster_id
+
+
+def test_compaction_merges_drifted_clusters(db, source_id):
+    chips = _topic(1)
+    # Far enough apart to open two clusters, close enough to merge later
+    items = _run(db, source_id, [
+        ("chip export rules tightened", _near(chips, 10, noise=0.6), NOW - timedelta(hours=2)),
+        ("chip export rules tightened again", _near(chips, 10, noise=0.6), NOW - timedelta(hours=1)),
+        ("chip curbs, take two", _near(chips, 11, noise=0.8), NOW),
+        ("weather model released", _topic(2), NOW),
+    ])
+    heavy, light = items[0].cluster_id, items[2].cluster_id
+    assert heavy == items[1].cluster_id and heavy != light
+
+    assert compact_clusters(db, threshold=0.5) == 1
+
+    db.expire_all()
+    assert db.get(StoryCluster, light).merged_into == heavy
+    assert db.get(StoryCluster, heavy).size == 3
+    assert {news.cluster_id for news in db.query(NewsItem) if news.title.startswith("chip")} == {heavy}
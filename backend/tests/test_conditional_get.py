@@ -0,0 +1,106 @@
+# backend/tests/test_conditional_get.py
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.models.orm_models import Source
+from app.services.ingestion.fetcher import iter_raw_items
+from app.services.ingestion.pipeline import iter_ingest_items
+from app.services.ingestion.source_state import ensure_sources_exist
+
+ETAG = '"feed-v1"'
+LAST_MODIFIED = "Mon, 06 Sep 2021 16:45:00 GMT"
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Stub</title>
+<item><title>First story</title><link>https://example.com/1</link>
+<pubDate>Mon, 06 Sep 2021 16:00:00 GMT</pubDate></item>
+<item><title>Second story</title><link>https://example.com/2</link>
+<pubDate>Mon, 06 Sep 2021 16:30:00 GMT</pubDate></item>
+</channel></rss>"""
+
+
+class StubFeed(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        StubFeed.requests.append(self.headers)  # case-insensitive
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/rss+xml")
+        self.send_header("Content-Length", str(len(FEED)))
+        self.send_header("ETag", ETAG)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(FEED)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_source():
+    StubFeed.requests = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubFeed)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield {
+        "name": "Stub Feed",
+        "url": f"http://127.0.0.1:{server.server_address[1]}/feed.xml",
+        "type": "rss",
+        "parser_key": "rss_generic",
+        "active": True,
+    }
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("mode", ["sync", "async"])
+def test_second_fetch_is_conditional(db, stub_source, mode):
+    ensure_sources_exist(db, [stub_source])
+
+    items = list(iter_raw_items(db, [stub_source], mode=mode))
+    db.commit()
+    assert [item.title for item in items] == ["First story", "Second story"]
+    assert "If-None-Match" not in StubFeed.requests[0]
+
+    row = db.query(Source).filter(Source.url == stub_source["url"]).one()
+    assert (row.etag, row.last_modified) == (ETAG, LAST_MODIFIED)
+
+    stats = {}
+    assert list(iter_raw_items(db, [stub_source], mode=mode, stats=stats)) == []
+    db.commit()
+
+    sent = StubFeed.requests[1]
+    assert sent["If-None-Match"] == ETAG
+    assert sent["If-Modified-Since"] == LAST_MODIFIED
+    assert stats["unchanged"] == 1
+
+    db.refresh(row)
+    assert (row.etag, row.last_modified) == (ETAG, LAST_MODIFIED)
+
+
+@pytest.mark.parametrize("stream", [iter_raw_items, iter_ingest_items])
+def test_validators_wait_for_the_feed_items(db, stub_source, stream):
+    ensure_sources_exist(db, [stub_source])
+
+    items = stream(db, sources=[stub_source], mode="sync")
+    next(items)
+    db.commit()  # a chunk commit mid-feed
+    items.close()  # then the cycle dies
+    db.rollback()
+
+    row = db.query(Source).filter(Source.url == stub_source["url"]).one()
+    assert (row.etag, row.last_modified) == (None, None)
+
+    # The next cycle must get the feed again, not a 304
+    assert len(list(stream(db, sources=[stub_source], mode="sync"))) == 2
+    db.commit()
+    assert "If-None-Match" not in StubFeed.requests[1]
+
+    db.refresh(row)
+    assert row.etag == ETAG
@@ -0,0 +1,43 @@
+# backend/tests/test_high_water_marks.py
+
+import time
+from datetime import datetime
+
+from app.services.ingestion.fetcher import _already_seen, _new_result, result_to_raw_items
+
+SOURCE = {
+    "name": "Stub Feed",
+    "url": "https://example.com/feed.xml",
+    "type": "rss",
+    "parser_key": "stub",
+    "active": True,
+}
+
+FEED = b"""<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Stub</title>
+<item><guid>post-1</guid><title>Already ingested</title><link>https://example.com/1</link>
+<pubDate>Mon, 06 Sep 2021 16:00:00 GMT</pubDate></item>
+<item><guid>post-2</guid><title>Backdated new post</title><link>https://example.com/2</link>
+<pubDate>Sun, 05 Sep 2021 09:00:00 GMT</pubDate></item>
+<item><guid>post-3</guid><title>Fresh post</title><link>https://example.com/3</link>
+<pubDate>Mon, 06 Sep 2021 18:00:00 GMT</pubDate></item>
+</channel></rss>"""
+
+MARK = {"published_at": datetime(2021, 9, 6, 17, 0), "guids": {"post-1"}}
+
+
+def test_unseen_guid_older_than_mark_is_kept():
+    result = _new_result(SOURCE)
+    result["body"] = FEED
+    result["mark"] = MARK
+
+    titles = [item.title for item in result_to_raw_items(result)]
+    assert titles == ["Backdated new post", "Fresh post"]
+
+
+def test_entries_without_id_fall_back_to_date():
+    older = {"published_parsed": time.strptime("2021-09-06 16:00", "%Y-%m-%d %H:%M")}
+    newer = {"published_parsed": time.strptime("2021-09-06 18:00", "%Y-%m-%d %H:%M")}
+    assert _already_seen(older, MARK)
+    assert not _already_seen(newer, MARK)
+    assert not _already_seen({}, MARK)
@@ -0,0 +1,30 @@
+# backend/tests/test_normalizer.py
+
+from datetime import datetime, timezone
+
+from app.services import normalizer
+from app.services.normalizer import normalize_datetime
+
+
+def test_odd_entry_does_not_pin_source_to_dateutil():
+    source = "https://example.com/odd-feed"
+    normalizer._source_layouts.pop(source, None)
+
+    eastern = "Mon, 06 Sep 2021 16:45:00 EST"
+    before = normalize_datetime(eastern, source)
+    assert before == datetime(2021, 9, 6, 21, 45, tzinfo=timezone.utc)
+
+    # Only dateutil reads this one
+    assert normalize_datetime("Sep 6, 2021", source) == datetime(2021, 9, 6, tzinfo=timezone.utc)
+    assert normalizer._source_layouts.get(source) != "dateutil"
+
+    # Same value, same answer, whatever came before it
+    assert normalize_datetime(eastern, source) == before
+
+
+def test_switches_remembered_fast_layout():
+    source = "https://example.com/mixed"
+    normalizer._source_layouts[source] = "iso8601"
+
+    assert normalize_datetime("Mon, 06 Sep 2021 16:45:00 +0000", source) == datetime(2021, 9, 6, 16, 45, tzinfo=timezone.utc)
+    assert normalizer._source_layouts[source] == "rfc822"
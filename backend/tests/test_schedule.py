@@ -0,0 +1,86 @@
+# backend/tests/test_schedule.py
+
+import time
+from datetime import datetime, timezone
+
+import pytest
+
+from app.services.ingestion.schedule import AdaptivePollScheduler
+from app.services.ingestion.source_state import ensure_sources_exist
+
+BUSY = {"name": "Busy", "url": "https://busy.example.com/feed", "type": "rss", "parser_key": "rss_generic", "active": True}
+QUIET = {"name": "Quiet", "url": "https://quiet.example.com/feed", "type": "rss", "parser_key": "rss_generic", "active": True}
+OFF = {"name": "Off", "url": "https://off.example.com/feed", "type": "rss", "parser_key": "rss_generic", "active": False}
+
+MIN, MAX, DEFAULT = 120, 6 * 3600, 900
+
+
+@pytest.fixture
+def poller():
+    return AdaptivePollScheduler([BUSY, QUIET, OFF], min_interval=MIN, max_interval=MAX, default_interval=DEFAULT)
+
+
+def _entries(now: float, gap: float, count: int):
+    # Naive UTC datetimes, newest `gap` seconds before now
+    return [
+        datetime.fromtimestamp(now - gap * i, tz=timezone.utc).replace(tzinfo=None)
+        for i in range(1, count + 1)
+    ]
+
+
+def test_everything_is_due_once_then_rescheduled(poller):
+    now = time.time() + 1
+    assert sorted(s["name"] for s in poller.pop_due(now)) == ["Busy", "Quiet"]
+    assert poller.pop_due(now) == []
+    assert poller.seconds_until_next(now) == pytest.approx(DEFAULT)
+    assert sorted(s["name"] for s in poller.pop_due(now + DEFAULT)) == ["Busy", "Quiet"]
+
+
+def test_interval_moves_towards_publish_gap(poller):
+    now = time.time()
+    # Hourly posts: halfway from the default towards 3600s
+    assert poller.observe(QUIET["url"], _entries(now, 3600, 5), now) == pytest.approx((DEFAULT + 3600) / 2)
+    # A post every 10s converges on the minimum, never below
+    intervals = [poller.observe(BUSY["url"], _entries(now, 10, 20), now) for _ in range(5)]
+    assert intervals == sorted(intervals, reverse=True)
+    assert intervals[-1] == MIN
+
+
+def test_quiet_feed_backs_off_to_max(poller):
+    now = time.time()
+    poller.observe(QUIET["url"], _entries(now, 60, 5), now)
+
+    interval = 0.0
+    for day in range(1, 10):
+        interval = poller.observe(QUIET["url"], [], now + day * 86400)
+    assert interval == MAX
+
+
+def test_reschedule_replaces_older_heap_entry(poller):
+    now = time.time() + 1
+    poller.pop_due(now)  # both provisionally due again at now + DEFAULT
+    poller.observe(BUSY["url"], _entries(now, 10, 20), now)  # busy: due at now + smaller interval
+
+    assert poller.seconds_until_next(now) < DEFAULT
+    due_at = poller.next_due[BUSY["url"]]
+    assert [s["name"] for s in poller.pop_due(due_at)] == ["Busy"]
+    # The stale (now + DEFAULT) entry for Busy is not returned again
+    assert [s["name"] for s in poller.pop_due(now + DEFAULT)] == ["Quiet"]
+
+
+def test_persist_and_restore(db, poller):
+    ensure_sources_exist(db, [BUSY, QUIET])
+    now = time.time()
+    poller.pop_due(now + 1)
+    interval = poller.observe(QUIET["url"], _entries(now, 3600, 5), now)
+    poller.persist(db)
+    db.commit()
+
+    restored = AdaptivePollScheduler([BUSY, QUIET], min_interval=MIN, max_interval=MAX, default_interval=DEFAULT)
+    restored.restore(db)
+
+    assert restored.intervals[QUIET["url"]] == int(interval)
+    assert restored.next_due[QUIET["url"]] == pytest.approx(now + interval, abs=1)
+    # Not due again until its persisted time, unlike a fresh scheduler
+    assert [s["name"] for s in restored.pop_due(now + 2)] == []
+    assert restored.last_published[QUIET["url"]] == pytest.approx(now - 3600, abs=1)
@@ -0,0 +1,165 @@
+# backend/tests/test_search.py
+
+import sys
+import types
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.api.v1.news import search_news
+from app.config import get_settings
+from app.models.orm_models import NewsItem, Source
+from app.services import search_index as search_index_module
+from app.services.search_index import SearchIndex, _timestamp, keyword_score
+
+settings = get_settings()
+DIM = settings.EMBEDDING_DIM
+DAY = datetime(2026, 1, 10)
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    search_index_module._index = None
+    yield
+    search_index_module._index = None
+
+
+def _unit(seed: int) -> np.ndarray:
+    vector = np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _row(vector: np.ndarray) -> np.ndarray:
+    return (vector / np.linalg.norm(vector))[None, :]
+
+
+def _at_cosine(query: np.ndarray, cosine: float, seed: int) -> np.ndarray:
+    # Unit vector with exactly `cosine` similarity to `query`
+    other = _unit(seed)
+    other -= (other @ query) * query
+    other /= np.linalg.norm(other)
+    return (cosine * query + np.sqrt(1 - cosine ** 2) * other).astype(np.float32)
+
+
+def test_exact_ranking_and_filters():
+    query = _unit(0)
+    index = SearchIndex(DIM)
+    cosines = [0.9, 0.5, 0.7, 0.3]
+    index.add(
+        ids=[1, 2, 3, 4],
+        vectors=np.stack([_at_cosine(query, c, seed) for seed, c in enumerate(cosines, 1)]),
+        sources=[1, 2, 1, 2],
+        dates=[_timestamp(DAY + timedelta(days=d)) for d in range(3)] + [_timestamp(None)],
+    )
+
+    ids, scores = index.search(query, k=3)
+    assert ids.tolist() == [1, 3, 2]
+    assert scores.tolist() == pytest.approx([0.9, 0.7, 0.5], abs=1e-5)
+
+    assert index.search(query, k=10, sources=[2])[0].tolist() == [2, 4]
+    # Date range is [since, until); undated items never match a date filter
+    assert index.search(query, k=10, since=DAY + timedelta(days=1))[0].tolist() == [3, 2]
+    assert index.search(query, k=10, until=DAY + timedelta(days=1))[0].tolist() == [1]
+    assert index.search(query, k=10, sources=[1], since=DAY + timedelta(days=3))[0].tolist() == []
+
+
+def test_ivf_search_finds_planted_neighbours(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_IVF_MIN_ITEMS", 2_000)
+    rng = np.random.default_rng(1)
+    topics = rng.standard_normal((40, DIM)).astype(np.float32)
+    vectors = topics[rng.integers(0, 40, 4_000)] + 0.3 * rng.standard_normal((4_000, DIM)).astype(np.float32)
+
+    index = SearchIndex(DIM)
+    index.add(np.arange(1, 4_001), vectors, np.ones(4_000), np.zeros(4_000))
+    assert index.wait_idle(timeout=60)
+    assert index._partition is not None and index._partition.packed == 4_000
+
+    query = _unit(7)
+    # Lands in the unpacked tail, which every query scans
+    index.add([5_000], _at_cosine(query, 0.95, 8)[None, :], [3], [0.0])
+    assert index.wait_idle(timeout=60)
+
+    ids, _ = index.search(query, k=1)
+    assert ids.tolist() == [5_000]
+
+    # All lists probed = exact search
+    everything = len(index._partition.centroids)
+    probed, _ = index.search(vectors[0], k=10, probes=everything)
+    exact, _ = SearchIndex._exact(index._rows, _row(vectors[0]), slice(0, index.size), 10)
+    assert probed.tolist() == exact.tolist()
+
+    # A narrow filter is searched exactly over its rows
+    assert index.search(query, k=5, sources=[3])[0].tolist() == [5_000]
+
+
+def _store(db, items) -> dict:
+    """
+    items: [(title, vector or None, is_duplicate)] → {title: id}
+    """
+    db.add(Source(name="Example", url="https://example.com/feed"))
+    db.flush()
+    source_id = db.query(Source.id).scalar()
+    rows = [
+        NewsItem(
+            source_id=source_id, title=title, url=f"https://example.com/{n}",
+            embedding=vector, is_duplicate=duplicate, published_at=DAY,
+        )
+        for n, (title, vector, duplicate) in enumerate(items)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return {news.title: news.id for news in rows}
+
+
+@pytest.fixture
+def fake_embedder(monkeypatch):
+    """
+    Query embedding without the model: set `fake_embedder.vector`.
+    """
+    module = types.ModuleType("app.services.embedder")
+
+    class EmbedderService:
+        vector = None
+
+        @classmethod
+        def generate_embedding(cls, text):
+            return cls.vector
+
+    module.EmbedderService = EmbedderService
+    monkeypatch.setitem(sys.modules, "app.services.embedder", module)
+    return EmbedderService
+
+
+def _search(db, q: str, keyword_weight: float, limit: int = 10):
+    response = search_news(q=q, limit=limit, source_id=None, since=None, until=None, keyword_weight=keyword_weight, db=db)
+    return response["items"]
+
+
+def test_hybrid_ranking_blends_keyword_score(db, fake_embedder):
+    query = _unit(0)
+    fake_embedder.vector = query
+    ids = _store(db, [
+        ("Chipmakers rally on strong demand", _at_cosine(query, 0.9, 1), False),
+        ("Nvidia earnings beat estimates", _at_cosine(query, 0.8, 2), False),
+        ("Nvidia earnings beat estimates again", _at_cosine(query, 0.99, 3), True),  # syndicated copy
+        ("Weather model released", None, False),  # not embedded
+    ])
+
+    semantic = _search(db, "nvidia earnings", keyword_weight=0.0)
+    assert [hit["item"].id for hit in semantic] == [ids["Chipmakers rally on strong demand"], ids["Nvidia earnings beat estimates"]]
+
+    hybrid = _search(db, "nvidia earnings", keyword_weight=0.5)
+    assert [hit["item"].id for hit in hybrid] == [ids["Nvidia earnings beat estimates"], ids["Chipmakers rally on strong demand"]]
+    top = hybrid[0]
+    assert top["keyword_score"] == 1.0
+    assert top["score"] == pytest.approx(0.5 * top["semantic_score"] + 0.5)
+
+    assert len(_search(db, "nvidia earnings", keyword_weight=0.5, limit=1)) == 1
+
+
+def test_keyword_score_counts_query_words_in_title_and_summary():
+    news = NewsItem(title="Nvidia earnings beat estimates", summary="Data-center revenue doubled.")
+    assert keyword_score("NVIDIA revenue", news) == 1.0
+    assert keyword_score("nvidia guidance", news) == 0.5
+    assert keyword_score("!!!", news) == 0.0
@@ -0,0 +1,40 @@
+# backend/tests/test_title_index.py
+
+import pytest
+
+from app.models.orm_models import NewsItem, Source
+from app.services import title_index as title_index_module
+from app.services.deduper import check_duplicate
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    title_index_module._index = None
+    yield
+    title_index_module._index = None
+
+
+def _insert(session, title: str, url: str) -> int:
+    if session.query(Source).count() == 0:
+        session.add(Source(name="Example", url="https://example.com/feed"))
+        session.flush()
+    news = NewsItem(source_id=session.query(Source.id).scalar(), title=title, url=url)
+    session.add(news)
+    session.commit()
+    return news.id
+
+
+def test_sees_titles_committed_by_another_session(session_factory, db):
+    _insert(db, "Unrelated headline about chips", "https://a.com/1")
+    assert check_duplicate(db, "OpenAI ships a new reasoning model", "https://b.com/1") == (False, None)
+
+    other = session_factory()
+    try:
+        stored_id = _insert(other, "OpenAI ships a new reasoning model", "https://c.com/1")
+    finally:
+        other.close()
+
+    assert check_duplicate(db, "OpenAI ships a new reasoning model", "https://d.com/1") == (True, stored_id)
+    # Small edits still match
+    assert check_duplicate(db, "OpenAI ships new reasoning model!", "https://e.com/1") == (True, stored_id)
+    assert check_duplicate(db, "Google releases a weather model", "https://f.com/1") == (False, None)
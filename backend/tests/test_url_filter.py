@@ -0,0 +1,80 @@
+# backend/tests/test_url_filter.py
+
+import os
+
+import pytest
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem, Source
+from app.services import url_filter as url_filter_module
+from app.services.deduper import backfill_url_hashes, find_existing_urls
+from app.utils.urls import url_hash
+
+
+@pytest.fixture(autouse=True)
+def fresh_filter():
+    url_filter_module._filter = None
+    url_filter_module._filter_failed = False
+    yield
+    if url_filter_module._filter is not None:
+        url_filter_module._filter.close()
+        url_filter_module._filter = None
+    path = get_settings().URL_FILTER_PATH
+    if os.path.exists(path):
+        os.remove(path)
+
+
+def _insert(session, url: str) -> int:
+    if session.query(Source).count() == 0:
+        session.add(Source(name="Example", url="https://example.com/feed"))
+        session.flush()
+    news = NewsItem(
+        source_id=session.query(Source.id).scalar(),
+        title=f"Story at {url}",
+        url=url,
+        url_hash=url_hash(url),
+    )
+    session.add(news)
+    session.commit()
+    return news.id
+
+
+def test_finds_urls_committed_by_another_session(session_factory, db):
+    _insert(db, "https://a.com/x")
+    # Map the filter in this "process" before the other one writes
+    assert find_existing_urls(db, [("https://b.com/y", url_hash("https://b.com/y"))]) == {}
+
+    other = session_factory()
+    try:
+        stored_id = _insert(other, "https://b.com/y")
+    finally:
+        other.close()
+
+    hashed = url_hash("https://b.com/y")
+    assert find_existing_urls(db, [("https://b.com/y", hashed)]) == {
+        hashed: stored_id,
+        "https://b.com/y": stored_id,
+    }
+
+    # A canonical variant of the same URL resolves to the stored row
+    variant = "https://b.com/y?utm_source=rss"
+    assert find_existing_urls(db, [(variant, url_hash(variant))]) == {hashed: stored_id}
+
+
+def test_unseen_urls_skip_the_lookup(db):
+    _insert(db, "https://a.com/x")
+    assert find_existing_urls(db, [("https://c.com/z", url_hash("https://c.com/z"))]) == {}
+    assert url_filter_module._filter.stats()["definitely_new"] >= 1
+
+
+def test_backfill_matches_canonical_variants_of_legacy_rows(db):
+    legacy_id = _insert(db, "https://www.a.com/story/?utm_source=rss")
+    db.query(NewsItem).update({NewsItem.url_hash: None})  # stored before url_hash existed
+    db.commit()
+
+    variant = "https://a.com/story"
+    assert find_existing_urls(db, [(variant, url_hash(variant))]) == {}
+
+    assert backfill_url_hashes(db) == 1
+    assert find_existing_urls(db, [(variant, url_hash(variant))]) == {url_hash(variant): legacy_id}
+    assert backfill_url_hashes(db) == 0
@@ -0,0 +1,53 @@
+# backend/tests/test_urls.py
+
+import pytest
+
+from app.utils.urls import URL_HASH_LENGTH, canonicalize_url, url_hash
+
+CANONICAL = "https://example.com/ai/story?a=1&b=2"
+
+
+@pytest.mark.parametrize("variant", [
+    CANONICAL,
+    "http://example.com/ai/story?a=1&b=2",
+    "HTTPS://WWW.Example.COM/ai/story?a=1&b=2",
+    "https://example.com./ai/story?a=1&b=2",
+    "https://example.com:443/ai/story?a=1&b=2",
+    "http://example.com:80/ai/story?a=1&b=2",
+    "https://example.com/ai/story/?a=1&b=2",
+    "https://example.com/ai/story?b=2&a=1",
+    "https://example.com/ai/story?a=1&b=2#comments",
+    "https://example.com/ai/story?utm_source=rss&a=1&UTM_Medium=feed&b=2&fbclid=x&Ref=tw",
+    "  https://example.com/ai/story?a=1&b=2\n",
+])
+def test_variants_share_one_canonical_form(variant):
+    assert canonicalize_url(variant) == CANONICAL
+    assert url_hash(variant) == url_hash(CANONICAL)
+
+
+@pytest.mark.parametrize("url, other", [
+    ("https://example.com/ai/story", "https://example.com/ai/Story"),  # paths are case-sensitive
+    ("https://example.com/ai/story", "https://example.com:8443/ai/story"),  # non-default port
+    ("https://example.com/ai/story?id=1", "https://example.com/ai/story?id=2"),  # real parameters
+    ("https://example.com/ai/story", "https://news.example.com/ai/story"),  # only www. is dropped
+])
+def test_different_pages_stay_different(url, other):
+    assert url_hash(url) != url_hash(other)
+
+
+def test_root_and_blank_values():
+    assert canonicalize_url("http://www.example.com") == "https://example.com/"
+    assert canonicalize_url("https://example.com/?q=") == "https://example.com/?q="
+    assert canonicalize_url("http://[::1]:8080/p") == "https://[::1]:8080/p"
+
+
+@pytest.mark.parametrize("url", ["mailto:news@example.com", "ftp://example.com/file", "http://example.com:99999/x"])
+def test_non_web_and_malformed_urls_are_left_alone(url):
+    assert canonicalize_url(url) == url
+
+
+def test_hash_width_and_empty_urls():
+    assert len(url_hash(CANONICAL)) == URL_HASH_LENGTH
+    assert url_hash("") is None
+    assert url_hash(None) is None
+    assert canonicalize_url(None) == ""
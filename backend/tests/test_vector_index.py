@@ -0,0 +1,90 @@
+# backend/tests/test_vector_index.py
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem, Source
+from app.services import vector_index as vector_index_module
+from app.services.deduper import SemanticDeduper
+
+DIM = get_settings().EMBEDDING_DIM
+
+
+@pytest.fixture(autouse=True)
+def fresh_index():
+    vector_index_module._index = None
+    yield
+    vector_index_module._index = None
+
+
+def _unit(seed: int) -> np.ndarray:
+    vector = np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def _store(session, title: str, vector: np.ndarray) -> NewsItem:
+    if session.query(Source).count() == 0:
+        session.add(Source(name="Example", url="https://example.com/feed"))
+        session.flush()
+    news = NewsItem(
+        source_id=session.query(Source.id).scalar(),
+        title=title,
+        url=f"https://example.com/{title.replace(' ', '-')}",
+        embedding=vector,
+    )
+    session.add(news)
+    session.commit()
+    return news
+
+
+def test_catches_paraphrase_stored_by_another_session(session_factory, db):
+    _store(db, "unrelated story", _unit(1))
+    deduper = SemanticDeduper(db, threshold=0.9)  # builds the index here
+
+    other = session_factory()
+    try:
+        original_id = _store(other, "openai ships new model", _unit(2)).id
+    finally:
+        other.close()
+
+    paraphrase = NewsItem(source_id=1, title="new model shipped by openai", url="https://example.com/p")
+    kept = deduper.mark([paraphrase], _unit(2)[None, :])
+
+    assert kept == []
+    assert paraphrase.is_duplicate
+    assert paraphrase.original.id == original_id
+
+
+def test_sync_skips_rows_added_in_process(db):
+    stored = _store(db, "first story", _unit(3))
+    deduper = SemanticDeduper(db, threshold=0.9)
+
+    news = NewsItem(source_id=stored.source_id, title="second story", url="https://example.com/second")
+    assert deduper.mark([news], _unit(4)[None, :]) == [0]
+    news.embedding = _unit(4)
+    db.add(news)
+    db.flush()
+    deduper.index_kept()
+    db.commit()
+
+    deduper.index.sync(db)
+    index = deduper.index
+    assert sorted(index._ids[:index.size].tolist()) == [stored.id, news.id]
+    assert index.max_id == news.id
+
+
+def test_empty_window_does_not_load_history(db):
+    old = _store(db, "old story", _unit(5))
+    old.retrieved_at = datetime.utcnow() - timedelta(days=get_settings().SEMANTIC_DEDUP_WINDOW_DAYS + 1)
+    db.commit()
+
+    index = vector_index_module.build_vector_index(db)
+    assert index.size == 0
+    assert index.max_id == old.id
+
+    fresh = _store(db, "fresh story", _unit(6))
+    assert index.sync(db) == 1
+    assert index._ids[:index.size].tolist() == [fresh.id]
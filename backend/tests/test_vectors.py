@@ -0,0 +1,94 @@
+# backend/tests/test_vectors.py
+
+import json
+
+import numpy as np
+import pytest
+from sqlalchemy import text
+
+from app.config import get_settings
+from app.models.orm_models import NewsItem, Source
+from app.utils.vectors import HEADER_SIZE, decode_quantized, decode_vector, encode_vector
+
+DIM = 384
+
+
+def _unit(seed: int) -> np.ndarray:
+    vector = np.random.default_rng(seed).standard_normal(DIM).astype(np.float32)
+    return vector / np.linalg.norm(vector)
+
+
+def test_float32_round_trip_is_exact():
+    vector = _unit(1)
+    blob = encode_vector(vector)
+
+    assert len(blob) == HEADER_SIZE + 4 * DIM
+    decoded = decode_vector(blob)
+    assert decoded.dtype == np.float32
+    assert np.array_equal(decoded, vector)
+    # Zero-copy view; memoryview (psycopg2 bytea) decodes the same
+    assert not decoded.flags.writeable
+    assert np.array_equal(decode_vector(memoryview(blob)), vector)
+
+
+def test_int8_keeps_cosine():
+    vectors = [_unit(seed) for seed in range(20)]
+    blobs = [encode_vector(vector, "int8") for vector in vectors]
+
+    assert {len(blob) for blob in blobs} == {HEADER_SIZE + 4 + DIM}
+    for vector, blob in zip(vectors, blobs):
+        decoded = decode_vector(blob)
+        cosine = decoded @ vector / np.linalg.norm(decoded)
+        assert cosine == pytest.approx(1.0, abs=0.002)
+
+    quantized, scale = decode_quantized(blobs[0])
+    assert quantized.dtype == np.int8 and np.abs(quantized).max() == 127
+    assert scale == pytest.approx(np.abs(vectors[0]).max() / 127, rel=1e-6)
+
+
+def test_edge_cases():
+    assert np.array_equal(decode_vector(encode_vector(np.zeros(DIM), "int8")), np.zeros(DIM))
+    assert decode_vector(encode_vector([], "int8")).size == 0
+    assert decode_vector(encode_vector([])).size == 0
+
+    with pytest.raises(ValueError):
+        encode_vector(_unit(1), "float16")
+    with pytest.raises(ValueError):
+        decode_vector(b"JSON[0.1, 0.2]")
+    with pytest.raises(ValueError):
+        decode_quantized(encode_vector(_unit(1)))
+
+
+def test_column_reads_every_stored_format(db, monkeypatch):
+    db.add(Source(name="Example", url="https://example.com/feed"))
+    db.flush()
+    source_id = db.query(Source.id).scalar()
+
+    settings = get_settings()
+    stored = {}
+    for storage in ("float32", "int8"):
+        monkeypatch.setattr(settings, "EMBEDDING_STORAGE", storage)
+        news = NewsItem(source_id=source_id, title=storage, url=f"https://example.com/{storage}", embedding=_unit(1))
+        db.add(news)
+        db.commit()
+        stored[storage] = news.id
+
+    legacy = NewsItem(source_id=source_id, title="legacy", url="https://example.com/legacy")
+    db.add(legacy)
+    db.commit()
+    # JSON text written before the column was binary
+    db.execute(
+        text("UPDATE news_items SET embedding = :value WHERE id = :id"),
+        {"value": json.dumps(_unit(1).tolist()), "id": legacy.id},
+    )
+    db.commit()
+    db.expire_all()
+
+    raw = dict(db.execute(text("SELECT title, length(embedding) FROM news_items")).all())
+    assert raw["float32"] == HEADER_SIZE + 4 * DIM
+    assert raw["int8"] == HEADER_SIZE + 4 + DIM
+
+    vectors = {news.title: news.embedding for news in db.query(NewsItem)}
+    assert np.array_equal(vectors["float32"], _unit(1))
+    assert np.allclose(vectors["legacy"], _unit(1))
+    assert vectors["int8"] @ _unit(1) == pytest.approx(1.0, abs=0.002)